@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+from standin_site import site_url, start_standin_site
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def start_site(**kwargs):
+    """Start the stand-in site and point sminfo_app at it (call before importing it)."""
+    server = start_standin_site(**kwargs)
+    os.environ["SMINFO_BASE_URL"] = site_url(server)
+    os.environ.setdefault("SMINFO_BROWSER_CHANNEL", "chromium")
+    return server
+
+
+def write_empty_state() -> Path:
+    state_dir = Path(tempfile.mkdtemp(prefix="sminfo-bench-"))
+    state_path = state_dir / "storage_state.json"
+    state_path.write_text(json.dumps({"cookies": [], "origins": []}), encoding="utf-8")
+    return state_path
+
+
+def percentile(samples: list[float], pct: int) -> float:
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[pct - 1]
+
+
+def report(label: str, samples_ms: list[float]) -> None:
+    print(
+        f"{label:<10} n={len(samples_ms):<4} "
+        f"p50={percentile(samples_ms, 50):8.1f} ms  p95={percentile(samples_ms, 95):8.1f} ms"
+    )
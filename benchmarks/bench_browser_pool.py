@@ -0,0 +1,65 @@
+"""Cold vs pooled browser vs parked-context latency against the stand-in site.
+
+    python benchmarks/bench_browser_pool.py --iterations 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from _common import report, start_site, write_empty_state
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--delay-ms", type=int, default=0)
+    args = parser.parse_args()
+
+    server = start_site(delay_ms=args.delay_ms)
+
+    from sminfo_app.browser_pool import BrowserPool, ContextPool
+    from sminfo_app.sminfo_client import SminfoClient
+
+    state_path = write_empty_state()
+
+    def run(client: SminfoClient) -> list[float]:
+        samples = []
+        for idx in range(args.iterations):
+            started = time.perf_counter()
+            client.search_company(f"테스트{idx % 3}")
+            samples.append((time.perf_counter() - started) * 1000)
+        return samples
+
+    cold = run(SminfoClient(state_path=state_path, browser_channel="chromium"))
+
+    pool = BrowserPool(channel="chromium", headless=True, max_browsers=1)
+    pooled_client = SminfoClient(
+        state_path=state_path,
+        browser_channel="chromium",
+        browser_pool=pool,
+    )
+    pooled_client.search_company("warmup")
+    pooled = run(pooled_client)
+
+    parked_client = SminfoClient(
+        state_path=state_path,
+        browser_channel="chromium",
+        browser_pool=pool,
+        context_pool=ContextPool(pool),
+    )
+    parked_client.search_company("warmup")
+    parked = run(parked_client)
+
+    parked_client.context_pool.close()
+    pool.close()
+    server.shutdown()
+
+    report("cold", cold)
+    report("pooled", pooled)
+    report("parked", parked)
+
+
+if __name__ == "__main__":
+    main()
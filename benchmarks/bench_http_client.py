@@ -0,0 +1,59 @@
+"""Parked browser context vs browser-free HTTP client against the stand-in site.
+
+    python benchmarks/bench_http_client.py --iterations 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from _common import report, start_site, write_empty_state
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--delay-ms", type=int, default=0)
+    args = parser.parse_args()
+
+    server = start_site(delay_ms=args.delay_ms)
+
+    from sminfo_app.browser_pool import BrowserPool, ContextPool
+    from sminfo_app.http_client import SminfoHttpClient
+    from sminfo_app.sminfo_client import SminfoClient
+
+    state_path = write_empty_state()
+
+    def run(client) -> list[float]:
+        samples = []
+        for idx in range(args.iterations):
+            started = time.perf_counter()
+            client.search_company(f"테스트{idx % 3}")
+            samples.append((time.perf_counter() - started) * 1000)
+        return samples
+
+    pool = BrowserPool(channel="chromium", headless=True, max_browsers=1)
+    parked_client = SminfoClient(
+        state_path=state_path,
+        browser_channel="chromium",
+        browser_pool=pool,
+        context_pool=ContextPool(pool),
+    )
+    parked_client.search_company("warmup")
+    parked = run(parked_client)
+    parked_client.context_pool.close()
+    pool.close()
+
+    with SminfoHttpClient(state_path=state_path) as http_client:
+        http_client.search_company("warmup")
+        http = run(http_client)
+
+    server.shutdown()
+
+    report("parked", parked)
+    report("http", http)
+
+
+if __name__ == "__main__":
+    main()
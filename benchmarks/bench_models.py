@@ -0,0 +1,121 @@
+"""Memory per result and to_dict throughput of the result models (no browser needed).
+
+    python benchmarks/bench_models.py --results 5000
+
+"before" re-declares the previous plain dataclasses with asdict-based
+to_dict; "after" uses sminfo_app.models.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sminfo_app import models  # noqa: E402
+
+
+@dataclass
+class LegacyCandidate:
+    name: str
+    row_text: str
+    table_title: str
+    match_score: int
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class LegacyTableData:
+    title: str
+    headers: list[str]
+    rows: list[list[str]]
+    frame_url: str
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class LegacySearchResult:
+    query: str
+    candidates: list[LegacyCandidate]
+    selected: LegacyCandidate | None
+    performance_tables: list[LegacyTableData]
+
+    def to_dict(self) -> dict:
+        return {
+            "query": self.query,
+            "candidates": [c.to_dict() for c in self.candidates],
+            "selected": self.selected.to_dict() if self.selected else None,
+            "performance_tables": [t.to_dict() for t in self.performance_tables],
+        }
+
+
+_METRICS = ["매출액", "영업이익", "당기순이익", "자산총계", "부채총계", "자본총계", "종업원수"]
+
+
+def build(kind, count: int, seed: int = 5) -> list:
+    candidate_cls, table_cls, result_cls = kind
+    rng = random.Random(seed)
+    results = []
+    for idx in range(count):
+        # 페이지에서 읽은 문자열처럼 결과마다 새 str 객체를 만듦
+        fresh = lambda text: (text + " ")[:-1]  # noqa: E731
+        candidates = [
+            candidate_cls(f"회사{idx}-{n}", f"회사{idx}-{n} 서울 제조업", fresh("검색결과"), 60)
+            for n in range(3)
+        ]
+        tables = [
+            table_cls(
+                title=fresh(title),
+                headers=[fresh("구분"), fresh("2021"), fresh("2022"), fresh("2023")],
+                rows=[
+                    [fresh(metric), *(f"{rng.randint(1, 10**7):,}" for _ in range(3))]
+                    for metric in _METRICS
+                ],
+                frame_url=fresh("https://sminfo.mss.go.kr/gc/sf/GSF003R0.print"),
+            )
+            for title in ("재무상태표 (단위: 백만원)", "손익계산서 (단위: 백만원)")
+        ]
+        results.append(result_cls(f"회사{idx}", candidates, candidates[0], tables))
+    return results
+
+
+def measure(label: str, kind, count: int, repeat: int) -> None:
+    gc.collect()
+    tracemalloc.start()
+    results = build(kind, count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for result in results:
+            result.to_dict()
+        best = min(best, time.perf_counter() - started)
+
+    print(f"{label:<7} {size / count:9.0f} bytes/result  {count / best:10.0f} to_dict/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--results", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    measure("before", (LegacyCandidate, LegacyTableData, LegacySearchResult), args.results, args.repeat)
+    measure("after", (models.Candidate, models.TableData, models.SearchResult), args.results, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Throughput of a sequential search_company loop vs search_many against the stand-in site.
+
+    python benchmarks/bench_search_many.py --companies 40 --concurrency 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from _common import start_site, write_empty_state
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--companies", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--delay-ms", type=int, default=50)
+    args = parser.parse_args()
+
+    server = start_site(delay_ms=args.delay_ms)
+
+    from sminfo_app.sminfo_client import SminfoClient
+
+    client = SminfoClient(state_path=write_empty_state(), browser_channel="chromium")
+    queries = [f"테스트기업{idx}" for idx in range(args.companies)]
+
+    def throughput(label: str, elapsed: float, done: int) -> None:
+        print(f"{label:<24} {done} companies in {elapsed:6.1f} s  -> {done / elapsed * 60:7.1f} companies/min")
+
+    started = time.perf_counter()
+    for query in queries:
+        client.search_company(query)
+    throughput("sequential loop", time.perf_counter() - started, len(queries))
+
+    started = time.perf_counter()
+    done = sum(1 for outcome in client.search_many(queries, concurrency=args.concurrency) if outcome.ok)
+    throughput(f"search_many (x{args.concurrency})", time.perf_counter() - started, done)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Table relevance scoring on detail pages with hundreds of tables (no browser needed).
+
+    python benchmarks/bench_table_score.py --tables 500 --extra-keywords 자본,현금흐름,종업원
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sminfo_app.table_score import FINANCIAL_KEYWORDS, TableScorer  # noqa: E402
+
+_WORDS = ["매출액", "영업이익", "당기순이익", "자산총계", "부채비율", "구분", "비고", "주소", "대표자", "업종"]
+_VALUES = ["1,234,567", "(12,345)", "-", "2021", "2022", "2023", "12.5%", "해당없음", ""]
+
+
+def make_page(count: int, rng: random.Random) -> list[tuple[str, list[str], list[list[str]]]]:
+    page = []
+    for _ in range(count):
+        cols = rng.randint(2, 8)
+        headers = ["구분", *rng.sample(["2021", "2022", "2023", "비고", "단위"], k=min(cols - 1, 5))]
+        rows = [
+            [rng.choice(_WORDS), *(rng.choice(_VALUES) for _ in range(cols - 1))]
+            for _ in range(rng.randint(1, 40))
+        ]
+        page.append((rng.choice(["재무상태표", "손익계산서", "기업개요", ""]), headers, rows))
+    return page
+
+
+def legacy_score(keywords: tuple[str, ...]):
+    # 이전 _score_table: 표마다 문자열을 만들고 키워드마다 in 검사 (연도 정규식은 의도대로 수정)
+    year_re = re.compile(r"20\d{2}")
+
+    def score(title: str, headers: list[str], rows: list[list[str]]) -> int:
+        parts = [title, *headers]
+        for row in rows[:20]:
+            parts.extend(row)
+        blob = " ".join(parts)
+        total = 3 if year_re.search(blob) else 0
+        total += sum(2 for keyword in keywords if keyword in blob)
+        total += (len(headers) >= 2) + (len(rows) >= 2)
+        return total
+
+    return score
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tables", type=int, default=500)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--extra-keywords", default="자본,현금흐름,종업원")
+    parser.add_argument(
+        "--large-vocab",
+        type=int,
+        default=60,
+        help="also run with this many synthetic extra keywords (0 to skip)",
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    pages = [make_page(args.tables, rng) for _ in range(args.pages)]
+    base = (*FINANCIAL_KEYWORDS, *filter(None, args.extra_keywords.split(",")))
+    vocabularies = [base]
+    if args.large_vocab:
+        # 앞 두 음절과 끝 음절을 다른 집합에서 골라 키워드끼리 겹쳐 이어지지 않게 함
+        heads = [chr(0xB098 + 28 * idx) for idx in range(20)]
+        tails = [chr(0xD0C0 + 28 * idx) for idx in range(20)]
+        vocab_rng = random.Random(3)
+        extra = (
+            "".join(vocab_rng.choices(heads, k=2)) + vocab_rng.choice(tails)
+            for _ in range(args.large_vocab)
+        )
+        vocabularies.append((*base, *extra))
+
+    for keywords in vocabularies:
+        scorer = TableScorer(keywords)
+        legacy = legacy_score(scorer.keywords)
+        mode = "single regex" if scorer._matcher is not None else "per-keyword in"
+        print(f"{len(scorer.keywords)} keywords ({mode})")
+
+        def full_features(title, headers, rows, scorer=scorer):
+            features = scorer.features(title, headers, rows)
+            return features.year_columns, features.numeric_ratio
+
+        for label, fn in (
+            ("legacy blob+in", legacy),
+            ("TableScorer", scorer.score),
+            ("features() all", full_features),
+        ):
+            started = time.perf_counter()
+            for page in pages:
+                for table in page:
+                    fn(*table)
+            elapsed = time.perf_counter() - started
+            print(f"  {label:<15} {elapsed * 1000 / args.pages:8.2f} ms/page")
+
+
+if __name__ == "__main__":
+    main()
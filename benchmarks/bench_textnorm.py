@@ -0,0 +1,79 @@
+"""Per-cell normalization cost on large detail tables (no browser needed).
+
+    python benchmarks/bench_textnorm.py --tables 200 --rows 40 --cols 12
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sminfo_app.textnorm import normalize_rows  # noqa: E402
+
+
+def make_tables(count: int, rows: int, cols: int, seed: int = 7) -> list[list[list[str]]]:
+    rng = random.Random(seed)
+    samples = [
+        "매출액",
+        "1,234,567",
+        "(12,345)",
+        "-",
+        "백만원",
+        " 2023 ",
+        "영업 이익",
+        "당기순이익\n",
+        "자산　총계",
+        "",
+    ]
+    return [
+        [[rng.choice(samples) for _ in range(cols)] for _ in range(rows)]
+        for _ in range(count)
+    ]
+
+
+def legacy_rows(rows: list[list[str]]) -> list[list[str]]:
+    # 이전 _build_tables: 셀마다 re.sub를 두 번 호출
+    def normalize(value: str) -> str:
+        return re.sub(r"\s+", " ", value or "").strip()
+
+    return [
+        [normalize(str(cell)) for cell in row]
+        for row in rows
+        if any(normalize(str(cell)) for cell in row)
+    ]
+
+
+def timed(label: str, fn, tables, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for table in tables:
+            fn(table)
+        best = min(best, time.perf_counter() - started)
+    cells = sum(len(row) for table in tables for row in table)
+    print(f"{label:<16} {best * 1000:8.1f} ms  ({best / cells * 1e9:6.0f} ns/cell)")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tables", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=40)
+    parser.add_argument("--cols", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tables = make_tables(args.tables, args.rows, args.cols)
+    legacy = timed("legacy re.sub x2", legacy_rows, tables, args.repeat)
+    batched = timed("normalize_rows", normalize_rows, tables, args.repeat)
+    print(f"speedup          {legacy / batched:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""Local stand-in for the sminfo search/detail pages used by the benchmarks."""
+
+from __future__ import annotations
+
+import argparse
+import html
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlparse
+
+SEARCH_PATH = "/gc/sf/GSF002R0.print"
+DETAIL_PATH = "/gc/sf/GSF003R0.print"
+PAGE_SIZE = 10
+
+_STYLE = "body { font-family: sans-serif; } table { border-collapse: collapse; }" * 200
+_BANNER = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64_000
+
+
+def _page(title: str, body: str) -> bytes:
+    return (
+        "<!doctype html><html lang='ko'><head><meta charset='utf-8'>"
+        f"<title>{html.escape(title)}</title>"
+        "<link rel='stylesheet' href='/static/site.css'>"
+        "</head><body>"
+        "<img src='/static/banner.png' alt='banner'>"
+        f"{body}</body></html>"
+    ).encode("utf-8")
+
+
+def _search_form(query: str) -> str:
+    return (
+        "<form name='search' method='post' action='/gc/sf/GSF002R0.print'>"
+        f"<input type='text' name='cmQuery' value='{html.escape(query)}'>"
+        "<input type='hidden' name='cmQueryEncoding'>"
+        "<input type='hidden' name='cmQueryOption'>"
+        "<input type='hidden' name='cmPageNo'>"
+        "<input type='hidden' name='mode'>"
+        "<input type='hidden' name='clickcontrol'>"
+        "<input type='hidden' name='htmlvalue'>"
+        "<button type='submit'>검색</button>"
+        "</form>"
+    )
+
+
+def _company_names(query: str, total: int) -> list[str]:
+    return [query] + [f"{query}{idx}" for idx in range(1, total)]
+
+
+def _results_page(query: str, page_no: int, total: int) -> bytes:
+    names = _company_names(query, total)
+    start = (page_no - 1) * PAGE_SIZE
+    rows = []
+    for offset, name in enumerate(names[start : start + PAGE_SIZE], start=start + 1):
+        rows.append(
+            "<tr>"
+            f"<td>{offset}</td>"
+            f"<td><a href='{DETAIL_PATH}?company={quote(name)}'>{html.escape(name)}</a></td>"
+            f"<td>서울특별시</td><td>제조업</td>"
+            "</tr>"
+        )
+    body = (
+        _search_form(query)
+        + f"<p>검색결과 {total:,}건</p>"
+        + "<h3>기업 검색 결과</h3>"
+        + "<table><thead><tr><th>번호</th><th>기업명</th><th>지역</th><th>업종</th></tr></thead>"
+        + f"<tbody>{''.join(rows)}</tbody></table>"
+    )
+    return _page("검색결과", body)
+
+
+def _detail_page(company: str, years: int = 5, filler_tables: int = 0) -> bytes:
+    year_cells = "".join(f"<th>{2020 + idx}</th>" for idx in range(years))
+    metric_rows = []
+    for metric_idx, metric in enumerate(("매출액", "영업이익", "당기순이익", "자산총계", "부채총계")):
+        cells = "".join(
+            f"<td>{(metric_idx + 1) * (idx + 1) * 1234567:,}</td>" for idx in range(years)
+        )
+        metric_rows.append(f"<tr><th>{metric}</th>{cells}</tr>")
+
+    filler = "".join(
+        f"<table><tr><td>안내 {idx}</td><td>내용 {idx}</td></tr></table>"
+        for idx in range(filler_tables)
+    )
+    body = (
+        f"<h2>{html.escape(company)}</h2>"
+        "<section><h3>재무 실적</h3><p>(단위: 백만원)</p>"
+        f"<table><thead><tr><th>구분</th>{year_cells}</tr></thead>"
+        f"<tbody>{''.join(metric_rows)}</tbody></table></section>"
+        f"{filler}"
+    )
+    return _page(company, body)
+
+
+def make_handler(delay_ms: int = 0, total_results: int = 25, filler_tables: int = 0):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args) -> None:  # noqa: A002
+            return
+
+        def _send(self, body: bytes, content_type: str = "text/html; charset=utf-8") -> None:
+            if delay_ms:
+                time.sleep(delay_ms / 1000)
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            if url.path == "/static/site.css":
+                self._send(_STYLE.encode("utf-8"), "text/css")
+                return
+            if url.path == "/static/banner.png":
+                self._send(_BANNER, "image/png")
+                return
+            if url.path == DETAIL_PATH:
+                company = parse_qs(url.query).get("company", [""])[0]
+                self._send(_detail_page(company, filler_tables=filler_tables))
+                return
+            if url.path == SEARCH_PATH:
+                self._send(_page("검색", _search_form("")))
+                return
+            self._send(_page("중소기업현황정보시스템", "<p>home</p>"))
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            form = parse_qs(self.rfile.read(length).decode("utf-8"))
+            query = form.get("cmQuery", [""])[0].strip()
+            try:
+                page_no = max(1, int(form.get("cmPageNo", ["1"])[0] or 1))
+            except ValueError:
+                page_no = 1
+
+            if urlparse(self.path).path != SEARCH_PATH or not query:
+                self._send(_page("검색", _search_form(query)))
+                return
+            self._send(_results_page(query, page_no, total_results))
+
+    return Handler
+
+
+def start_standin_site(
+    port: int = 0,
+    delay_ms: int = 0,
+    total_results: int = 25,
+    filler_tables: int = 0,
+) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", port),
+        make_handler(delay_ms, total_results, filler_tables),
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def site_url(server: ThreadingHTTPServer) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="sminfo stand-in site")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay-ms", type=int, default=0)
+    args = parser.parse_args()
+
+    server = start_standin_site(port=args.port, delay_ms=args.delay_ms)
+    print(f"stand-in site: {site_url(server)}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,636 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from typing import AsyncIterator, Iterable
+
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Frame,
+    Locator,
+    Page,
+    Playwright,
+    async_playwright,
+)
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from .config import (
+    BASE_URL,
+    DEFAULT_AUTO_RELOGIN,
+    DEFAULT_BROWSER_CHANNEL,
+    DEFAULT_READINESS,
+    DEFAULT_SINGLE_NAVIGATION,
+    DEFAULT_TIMEOUT_MS,
+    SEARCH_MENU_ID,
+    SEARCH_PATH,
+)
+from .models import (
+    EVENT_CANDIDATES,
+    EVENT_RESULT,
+    EVENT_SELECTED,
+    EVENT_TABLE,
+    BatchOutcome,
+    Candidate,
+    SearchEvent,
+    SearchResult,
+    TableData,
+)
+from .readiness import (
+    DETAIL,
+    SEARCH_FORM,
+    SEARCH_RESULTS,
+    mark_stale_async,
+    wait_until_ready_async,
+)
+from .resource_policy import ResourcePolicy, content_frames
+from .session_state import storage_state_arg
+from .sminfo_client import (
+    _FETCH_RESULT_PAGES_SCRIPT,
+    _JS_CLICK_LINK_SCRIPT,
+    _JS_SUBMIT_SEARCH_SCRIPT,
+    _LOGIN_BUTTON_SELECTORS,
+    _LOGIN_ID_SELECTORS,
+    _LOGIN_PW_SELECTORS,
+    _OPEN_SEARCH_PAGE_SCRIPT,
+    _PAGE_SNAPSHOT_SCRIPT,
+    _RANKED_TABLE_EXTRACT_SCRIPT,
+    _TABLE_EXTRACT_SCRIPT,
+    NotLoggedInError,
+    SearchError,
+    SminfoClientBase,
+    _PageSnapshot,
+)
+
+_EVALUATE_FAILED = object()
+
+
+async def launch_browser_async(pw: Playwright, channel: str, headless: bool) -> Browser:
+    channel = (channel or "").strip().lower()
+    if not channel or channel == "chromium":
+        return await pw.chromium.launch(headless=headless)
+
+    try:
+        return await pw.chromium.launch(headless=headless, channel=channel)
+    except PlaywrightError as exc:
+        print(
+            f"경고: 브라우저 채널 '{channel}' 실행 실패. Chromium으로 전환합니다. ({exc})"
+        )
+        return await pw.chromium.launch(headless=headless)
+
+
+class AsyncSminfoClient(SminfoClientBase):
+    """SminfoClient counterpart on ``playwright.async_api``.
+
+    One browser is launched lazily and shared by every concurrent
+    ``search_company`` call; each search gets its own context and page.
+    Use ``async with`` or call ``close()`` to shut the browser down.
+    """
+
+    def __init__(
+        self,
+        state_path: str | Path | None = None,
+        meta_path: str | Path | None = None,
+        headless: bool = True,
+        timeout_ms: int = DEFAULT_TIMEOUT_MS,
+        browser_channel: str | None = DEFAULT_BROWSER_CHANNEL,
+        resource_policy: ResourcePolicy | None = None,
+        readiness: bool = DEFAULT_READINESS,
+        single_navigation: bool = DEFAULT_SINGLE_NAVIGATION,
+        auto_relogin: bool = DEFAULT_AUTO_RELOGIN,
+    ) -> None:
+        super().__init__(
+            state_path=state_path,
+            meta_path=meta_path,
+            headless=headless,
+            timeout_ms=timeout_ms,
+            browser_channel=browser_channel,
+            resource_policy=resource_policy,
+            readiness=readiness,
+            single_navigation=single_navigation,
+            auto_relogin=auto_relogin,
+        )
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._browser_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> AsyncSminfoClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except PlaywrightError:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def login(
+        self,
+        username: str | None = None,
+        password: str | None = None,
+        headless: bool = False,
+        manual_wait_seconds: int = 300,
+    ) -> Path:
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+
+        async with async_playwright() as pw:
+            browser = await launch_browser_async(pw, self.browser_channel, headless)
+            try:
+                context = await browser.new_context(locale="ko-KR")
+                page = await context.new_page()
+                page.set_default_timeout(self.timeout_ms)
+
+                await self._open_search_page_via_post(page, query="")
+
+                if await self._is_login_page(page):
+                    if username and password:
+                        await self._perform_login(page, username, password)
+                    else:
+                        print(
+                            f"브라우저에서 로그인 완료 후 {manual_wait_seconds}초 이내에 자동으로 세션을 저장합니다."
+                        )
+                        ok = await self._wait_until_logged_in(
+                            page, timeout_seconds=manual_wait_seconds
+                        )
+                        if not ok:
+                            raise NotLoggedInError(
+                                "로그인 완료를 감지하지 못했습니다. 다시 시도하세요."
+                            )
+
+                snapshot = await self._page_snapshot(page)
+                if self._is_login_url(page.url) or snapshot.login_form:
+                    raise NotLoggedInError("로그인에 실패했습니다. 아이디/비밀번호를 확인하세요.")
+
+                detected_username = snapshot.username
+                fallback_username = self._normalize_space(username or "")
+                self._write_session_meta(detected_username or fallback_username or None)
+                # 다른 프로세스가 쓰다 만 파일을 읽지 않도록 sync 클라이언트와 같이 원자적으로 저장
+                self._write_json_atomic(self.state_path, await context.storage_state())
+            finally:
+                await browser.close()
+
+        return self.state_path
+
+    async def search_company(
+        self,
+        query: str,
+        company_name: str | None = None,
+    ) -> SearchResult:
+        async for event in self.iter_search(query, company_name):
+            if event.kind == EVENT_RESULT and event.result is not None:
+                return event.result
+        raise SearchError("검색 결과를 받지 못했습니다.")
+
+    async def iter_search(
+        self,
+        query: str,
+        company_name: str | None = None,
+    ) -> AsyncIterator[SearchEvent]:
+        """Async counterpart of :meth:`SminfoClientBase.iter_search`."""
+        state_key = self._state_key()
+        emitted = False
+        try:
+            async for event in self._iter_search_once(query, company_name):
+                emitted = True
+                yield event
+            return
+        except NotLoggedInError:
+            # 로그인은 sync Playwright로 진행되므로 별도 스레드에서 대기
+            if emitted or not await asyncio.to_thread(self._relogin_once, state_key):
+                raise
+        async for event in self._iter_search_once(query, company_name):
+            yield event
+
+    async def _iter_search_once(
+        self,
+        query: str,
+        company_name: str | None,
+    ) -> AsyncIterator[SearchEvent]:
+        query = self._normalize_query(query)
+        await asyncio.to_thread(self._check_session)
+
+        context = await self._new_search_context()
+        try:
+            page = await context.new_page()
+            page.set_default_timeout(self.timeout_ms)
+
+            if not self.single_navigation:
+                await self._open_search_page_via_post(page, query="")
+                if await self._is_login_page(page):
+                    raise self._session_expired_error()
+
+            async for event in self._iter_search_on_page(page, query, company_name):
+                yield event
+        finally:
+            try:
+                await context.close()
+            except PlaywrightError:
+                pass
+
+    async def search_many(
+        self,
+        queries: Iterable[str | tuple[str, str | None]],
+        concurrency: int = 4,
+    ) -> AsyncIterator[BatchOutcome]:
+        """Run a batch in one authenticated context with up to ``concurrency`` tabs.
+
+        The session is checked once for the whole batch; outcomes are yielded
+        in completion order and per-query failures do not stop the batch.
+        """
+        jobs = self._batch_jobs(queries)
+        if not jobs:
+            return
+
+        state_key = self._state_key()
+        try:
+            await asyncio.to_thread(self._check_session)
+        except NotLoggedInError:
+            if not await asyncio.to_thread(self._relogin_once, state_key):
+                raise
+        context = await self._new_search_context()
+        workers: list[asyncio.Task] = []
+        try:
+            pending: asyncio.Queue = asyncio.Queue()
+            for job in jobs:
+                pending.put_nowait(job)
+            outcomes: asyncio.Queue[BatchOutcome] = asyncio.Queue()
+
+            async def worker() -> None:
+                page = None
+                while not pending.empty():
+                    job = pending.get_nowait()
+                    try:
+                        if page is None or page.is_closed():
+                            page = await context.new_page()
+                            page.set_default_timeout(self.timeout_ms)
+                        outcome = await self._run_batch_job(page, job)
+                    except Exception as exc:
+                        outcome = self._batch_failure(job, exc)
+                        if page is not None:
+                            try:
+                                await page.close()
+                            except PlaywrightError:
+                                pass
+                        page = None
+                    await outcomes.put(outcome)
+
+            workers = [
+                asyncio.create_task(worker())
+                for _ in range(max(1, min(concurrency, len(jobs))))
+            ]
+            for _ in range(len(jobs)):
+                yield await outcomes.get()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            try:
+                await context.close()
+            except PlaywrightError:
+                pass
+
+    async def _run_batch_job(
+        self,
+        page: Page,
+        job: tuple[int, str, str | None],
+    ) -> BatchOutcome:
+        index, query, company_name = job
+        try:
+            query = self._normalize_query(query)
+            if not self.single_navigation and SEARCH_PATH not in (page.url or ""):
+                await self._open_search_page_via_post(page, query="")
+            result = await self._search_on_page(page, query, company_name)
+        except (NotLoggedInError, SearchError, ValueError, PlaywrightError) as exc:
+            return self._batch_failure(job, exc)
+        return BatchOutcome(
+            index=index,
+            query=query,
+            company_name=company_name,
+            result=result,
+        )
+
+    async def _search_on_page(
+        self,
+        page: Page,
+        query: str,
+        company_name: str | None,
+    ) -> SearchResult:
+        async for event in self._iter_search_on_page(page, query, company_name):
+            if event.kind == EVENT_RESULT and event.result is not None:
+                return event.result
+        raise SearchError("검색 결과를 받지 못했습니다.")
+
+    async def _iter_search_on_page(
+        self,
+        page: Page,
+        query: str,
+        company_name: str | None,
+    ) -> AsyncIterator[SearchEvent]:
+        if self.single_navigation:
+            await self._open_results_directly(page, query)
+        else:
+            await self._submit_search_query(page, query)
+        if self._is_login_url(page.url):
+            raise self._session_expired_error()
+
+        snapshot = await self._page_snapshot(page, query)
+        if self.single_navigation and snapshot.login_form:
+            raise self._session_expired_error()
+
+        if not snapshot.candidates:
+            raise self._no_candidates_error(query, snapshot.result_count)
+        candidates, pages = await self._paginate_candidates(page, query, snapshot)
+        yield SearchEvent(EVENT_CANDIDATES, query, candidates=candidates)
+
+        selected = self._choose_candidate(candidates, company_name)
+        tables: list[TableData] = []
+
+        if selected:
+            yield SearchEvent(EVENT_SELECTED, query, selected=selected)
+            page_no = pages.get((selected.name, selected.row_text))
+            if page_no is not None:
+                await self._open_results_directly(page, query, page_no)
+            await self._click_company_link(page, selected.name)
+            if not self.readiness:
+                await self._wait_for_page_settle(page)
+            tables = await self._extract_relevant_tables(page)
+            for table in tables:
+                yield SearchEvent(EVENT_TABLE, query, table=table)
+
+        self._session_probe().mark_valid()
+        result = SearchResult(
+            query=query,
+            candidates=candidates,
+            selected=selected,
+            performance_tables=tables,
+        )
+        yield SearchEvent(EVENT_RESULT, query, result=result)
+
+    async def _new_search_context(self) -> BrowserContext:
+        browser = await self._ensure_browser()
+        context = await browser.new_context(
+            storage_state=storage_state_arg(self.state_path), locale="ko-KR"
+        )
+        try:
+            await self.resource_policy.install_async(context)
+        except PlaywrightError:
+            await context.close()
+            raise
+        return context
+
+    async def _ensure_browser(self) -> Browser:
+        async with self._browser_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await launch_browser_async(
+                self._playwright, self.browser_channel, self.headless
+            )
+            return self._browser
+
+    async def _perform_login(self, page: Page, username: str, password: str) -> None:
+        id_input, pw_input = await asyncio.gather(
+            self._find_first_visible_locator(page, _LOGIN_ID_SELECTORS),
+            self._find_first_visible_locator(page, _LOGIN_PW_SELECTORS),
+        )
+
+        if id_input is None or pw_input is None:
+            raise SearchError("로그인 입력 필드를 찾지 못했습니다.")
+
+        await id_input.fill(username)
+        await pw_input.fill(password)
+
+        submit = await self._find_first_visible_locator(page, _LOGIN_BUTTON_SELECTORS)
+        if submit:
+            await submit.click()
+        else:
+            await pw_input.press("Enter")
+
+        ok = await self._wait_until_logged_in(page, timeout_seconds=30)
+        if not ok:
+            raise NotLoggedInError("로그인에 실패했습니다. 아이디/비밀번호를 확인하세요.")
+
+    async def _wait_until_logged_in(self, page: Page, timeout_seconds: int) -> bool:
+        deadline = time.time() + timeout_seconds
+        while time.time() < deadline:
+            await page.wait_for_timeout(1000)
+            if not await self._is_login_page(page):
+                return True
+        return False
+
+    async def _open_search_page_via_post(self, page: Page, query: str) -> None:
+        if not (page.url or "").startswith(BASE_URL):
+            await page.goto(BASE_URL, wait_until="domcontentloaded")
+        await self._begin_stage(page)
+        await page.evaluate(
+            _OPEN_SEARCH_PAGE_SCRIPT,
+            {
+                "baseUrl": BASE_URL,
+                "path": SEARCH_PATH,
+                "menuId": SEARCH_MENU_ID,
+                "keyword": query,
+            },
+        )
+        await self._wait_for_stage(page, SEARCH_RESULTS if query else SEARCH_FORM)
+
+    async def _paginate_candidates(
+        self,
+        page: Page,
+        query: str,
+        snapshot: _PageSnapshot,
+    ) -> tuple[list[Candidate], dict[tuple[str, str], int]]:
+        page_numbers = self._extra_result_pages(snapshot.result_count)
+        if not page_numbers:
+            return snapshot.candidates, {}
+        if not query.isascii():
+            self._remember_site_charset(await page.evaluate("document.characterSet"))
+        fetched = await page.evaluate(
+            _FETCH_RESULT_PAGES_SCRIPT, self._result_pages_arg(query, page_numbers)
+        )
+        # 페이지 안 fetch가 결과를 돌려주지 못하면 모든 페이지를 실패로 처리
+        fetched = fetched or [None] * len(page_numbers)
+        return self._merge_result_pages(query, snapshot.rows, page_numbers, fetched)
+
+    async def _open_results_directly(self, page: Page, query: str, page_no: int = 1) -> None:
+        url = BASE_URL + SEARCH_PATH
+        charset = self._site_charset
+        body = self._search_form_body(query, charset, page_no)
+
+        async def post_search(route) -> None:
+            headers = {**route.request.headers, "content-type": "application/x-www-form-urlencoded"}
+            await route.continue_(method="POST", post_data=body, headers=headers)
+
+        await page.route(url, post_search)
+        try:
+            await self._begin_stage(page)
+            await page.goto(url, referer=BASE_URL + "/", wait_until="commit")
+        finally:
+            await page.unroute(url, post_search)
+
+        if self._is_login_url(page.url):
+            raise self._session_expired_error()
+        await self._wait_for_stage(page, SEARCH_RESULTS)
+
+        if not query.isascii():
+            site_charset = self._remember_site_charset(await page.evaluate("document.characterSet"))
+            if site_charset != charset:
+                await self._open_results_directly(page, query, page_no)
+
+    async def _submit_search_query(self, page: Page, query: str) -> bool:
+        await self._begin_stage(page)
+        try:
+            submitted = await page.evaluate(_JS_SUBMIT_SEARCH_SCRIPT, {"keyword": query})
+        except Exception:
+            submitted = False
+
+        if submitted:
+            await self._wait_for_stage(page, SEARCH_RESULTS)
+            return True
+
+        await self._open_search_page_via_post(page, query=query)
+        return True
+
+    async def _evaluate_frames(
+        self,
+        page: Page,
+        script: str,
+        arg: object = None,
+    ) -> list[tuple[Frame, object]]:
+        frames = content_frames(page)
+
+        async def run(frame: Frame) -> object:
+            try:
+                return await frame.evaluate(script, arg)
+            except Exception:
+                return _EVALUATE_FAILED
+
+        results = await asyncio.gather(*(run(frame) for frame in frames))
+        return [
+            (frame, raw)
+            for frame, raw in zip(frames, results, strict=True)
+            if raw is not _EVALUATE_FAILED
+        ]
+
+    async def _page_snapshot(self, page: Page, query: str = "") -> _PageSnapshot:
+        results = await self._evaluate_frames(page, _PAGE_SNAPSHOT_SCRIPT, self._snapshot_arg(query))
+        return self._build_snapshot([raw for _, raw in results], query)
+
+    async def _click_company_link(self, page: Page, company_name: str) -> None:
+        target = self._normalize_space(company_name)
+        frames = content_frames(page)
+        await self._begin_stage(page)
+
+        async def first_match(locator: Locator) -> Locator | None:
+            try:
+                if await locator.count() > 0:
+                    return locator.first
+            except Exception:
+                pass
+            return None
+
+        for make_locator in (
+            lambda frame: frame.get_by_role("link", name=target, exact=True),
+            lambda frame: frame.locator("a").filter(has_text=target),
+        ):
+            matches = await asyncio.gather(
+                *(first_match(make_locator(frame)) for frame in frames)
+            )
+            for match in matches:
+                if match is None:
+                    continue
+                try:
+                    await match.click()
+                except Exception:
+                    continue
+                await self._wait_for_stage(page, DETAIL)
+                return
+
+        for _, clicked in await self._evaluate_frames(page, _JS_CLICK_LINK_SCRIPT, target):
+            if clicked:
+                await self._wait_for_stage(page, DETAIL)
+                return
+
+        raise SearchError(f"회사 링크를 클릭하지 못했습니다: {company_name}")
+
+    async def _extract_relevant_tables(self, page: Page) -> list[TableData]:
+        if self.in_page_table_scoring:
+            scored: list[tuple[int, TableData]] = []
+            results = await self._evaluate_frames(page, _RANKED_TABLE_EXTRACT_SCRIPT, self._ranked_tables_arg())
+            for frame, raw_tables in results:
+                scored.extend(self._build_scored_tables(raw_tables, frame.url))
+            return self._select_scored_tables(scored)
+
+        all_tables: list[TableData] = []
+        for frame, raw_tables in await self._evaluate_frames(page, _TABLE_EXTRACT_SCRIPT):
+            all_tables.extend(self._build_tables(raw_tables, frame.url))
+        return self._select_relevant_tables(all_tables)
+
+    async def _find_first_visible_locator(
+        self,
+        page: Page,
+        selectors: tuple[str, ...],
+    ) -> Locator | None:
+        async def probe(locator: Locator) -> bool:
+            try:
+                return await locator.count() > 0 and await locator.is_visible()
+            except Exception:
+                return False
+
+        locators = [
+            frame.locator(selector).first
+            for frame in content_frames(page)
+            for selector in selectors
+        ]
+        visible = await asyncio.gather(*(probe(locator) for locator in locators))
+        for locator, ok in zip(locators, visible, strict=True):
+            if ok:
+                return locator
+        return None
+
+    async def _is_login_page(self, page: Page) -> bool:
+        if self._is_login_url(page.url):
+            return True
+        return (await self._page_snapshot(page)).login_form
+
+    async def _begin_stage(self, page: Page) -> None:
+        if self.readiness:
+            await mark_stale_async(page)
+
+    async def _wait_for_stage(self, page: Page, stage: str) -> None:
+        if not self.readiness:
+            await self._wait_for_page_settle(page)
+            return
+
+        started = time.monotonic()
+        ready = await wait_until_ready_async(page, stage, self.ready_timeout_ms)
+        ready_ms = (time.monotonic() - started) * 1000
+        if not ready:
+            await self._wait_for_page_settle(page)
+            self.readiness_stats.record(stage, ready_ms, fallback=True)
+            return
+
+        saved_ms = None
+        if self.readiness_audit:
+            audit_started = time.monotonic()
+            await self._wait_for_page_settle(page)
+            saved_ms = (time.monotonic() - audit_started) * 1000
+        self.readiness_stats.record(stage, ready_ms, saved_ms=saved_ms)
+
+    async def _wait_for_page_settle(self, page: Page) -> None:
+        try:
+            await page.wait_for_load_state("networkidle", timeout=self.timeout_ms)
+        except PlaywrightTimeoutError:
+            pass
+        await page.wait_for_timeout(700)
+
@@ -0,0 +1,395 @@
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator
+
+from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
+from playwright.sync_api import Error as PlaywrightError
+
+from .config import (
+    DEFAULT_BROWSER_CHANNEL,
+    DEFAULT_POOL_MAX_BROWSERS,
+    DEFAULT_POOL_MAX_USES,
+)
+from .session_state import storage_state_arg
+
+
+def launch_browser(pw: Playwright, channel: str, headless: bool) -> Browser:
+    channel = (channel or "").strip().lower()
+    if not channel or channel == "chromium":
+        return pw.chromium.launch(headless=headless)
+
+    try:
+        return pw.chromium.launch(headless=headless, channel=channel)
+    except PlaywrightError as exc:
+        print(
+            f"경고: 브라우저 채널 '{channel}' 실행 실패. Chromium으로 전환합니다. ({exc})"
+        )
+        return pw.chromium.launch(headless=headless)
+
+
+@dataclass
+class _PooledBrowser:
+    browser: Browser
+    uses: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _ThreadState:
+    playwright: Playwright | None = None
+    idle: list[_PooledBrowser] = field(default_factory=list)
+    leased: int = 0
+
+
+class BrowserPool:
+    """Long-lived pool of launched browsers shared by repeated searches.
+
+    Playwright sync objects are bound to the thread that created them, so each
+    thread keeps its own driver and idle browsers. ``max_browsers`` bounds how
+    many browsers may be leased at the same time across all threads, and idle
+    browsers count against the same bound: a thread that returns a browser
+    while more than ``max_browsers`` are open closes it (and its driver when
+    it holds nothing else) instead of keeping it warm.
+    """
+
+    def __init__(
+        self,
+        channel: str | None = DEFAULT_BROWSER_CHANNEL,
+        headless: bool = True,
+        max_browsers: int = DEFAULT_POOL_MAX_BROWSERS,
+        max_uses: int = DEFAULT_POOL_MAX_USES,
+        max_idle_seconds: float = 600.0,
+    ) -> None:
+        self.channel = (channel or "").strip()
+        self.headless = headless
+        self.max_browsers = max(1, max_browsers)
+        self.max_uses = max(1, max_uses)
+        self.max_idle_seconds = max_idle_seconds
+
+        self._slots = threading.BoundedSemaphore(self.max_browsers)
+        self._local = threading.local()
+        self._closed = False
+        # 스레드별 상태와 전체 실행 중인 브라우저 수 (대여 중 + 대기 중)
+        self._lock = threading.Lock()
+        self._states: list[_ThreadState] = []
+        self._launched = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @contextmanager
+    def browser(self) -> Iterator[Browser]:
+        if self._closed:
+            raise RuntimeError("브라우저 풀이 이미 종료되었습니다.")
+
+        self._slots.acquire()
+        try:
+            entry = self._checkout()
+            healthy = True
+            try:
+                yield entry.browser
+            except PlaywrightError:
+                healthy = False
+                raise
+            finally:
+                self._checkin(entry, healthy)
+        finally:
+            self._slots.release()
+
+    def playwright(self) -> Playwright:
+        """Driver of the calling thread, for browser-less use such as ``pw.request``."""
+        state = self._state()
+        if state.playwright is None:
+            state.playwright = sync_playwright().start()
+        return state.playwright
+
+    @property
+    def launched(self) -> int:
+        """Browsers currently open across all threads, leased or idle."""
+        with self._lock:
+            return self._launched
+
+    def close(self) -> None:
+        """Close every idle browser and driver.
+
+        Sync Playwright objects only answer on their own thread; the calling
+        thread's are closed here, other threads' are tried and otherwise
+        closed by their owner on its next lease or return.
+        """
+        self._closed = True
+        own = self._state()
+        with self._lock:
+            states = list(self._states)
+        for state in states:
+            if state is own or not state.leased:
+                self._release_thread(state)
+
+    def _release_thread(self, state: _ThreadState) -> None:
+        while state.idle:
+            self._retire(state.idle.pop())
+        if state.playwright is not None and not state.leased:
+            try:
+                state.playwright.stop()
+            except Exception:
+                pass
+            state.playwright = None
+
+    def _state(self) -> _ThreadState:
+        state = getattr(self._local, "state", None)
+        if state is None:
+            state = _ThreadState()
+            self._local.state = state
+            with self._lock:
+                self._states.append(state)
+        return state
+
+    def _over_bound(self) -> bool:
+        with self._lock:
+            return self._launched > self.max_browsers
+
+    def _checkout(self) -> _PooledBrowser:
+        state = self._state()
+        state.leased += 1
+        try:
+            return self._checkout_entry(state)
+        except BaseException:
+            state.leased -= 1
+            raise
+
+    def _checkout_entry(self, state: _ThreadState) -> _PooledBrowser:
+        now = time.monotonic()
+
+        # 다른 스레드가 새로 띄워 전체 수가 한도를 넘었으면 이 스레드의 여분부터 정리
+        while state.idle and self._over_bound():
+            self._retire(state.idle.pop(0))
+
+        while state.idle:
+            entry = state.idle.pop()
+            if not entry.browser.is_connected():
+                self._retire(entry)
+                continue
+            if now - entry.last_used > self.max_idle_seconds:
+                self._retire(entry)
+                continue
+            entry.uses += 1
+            return entry
+
+        browser = launch_browser(self.playwright(), self.channel, self.headless)
+        with self._lock:
+            self._launched += 1
+        return _PooledBrowser(browser=browser, uses=1)
+
+    def _checkin(self, entry: _PooledBrowser, healthy: bool) -> None:
+        state = self._state()
+        state.leased -= 1
+        entry.last_used = time.monotonic()
+        if (
+            self._closed
+            or not healthy
+            or entry.uses >= self.max_uses
+            or not entry.browser.is_connected()
+        ):
+            self._retire(entry)
+            if self._closed:
+                self._release_thread(state)
+            return
+        if self._over_bound():
+            # 한도를 넘긴 만큼은 대기시키지 않고, 남은 것이 없으면 드라이버도 종료
+            self._retire(entry)
+            if not state.idle and not state.leased:
+                self._release_thread(state)
+            return
+        state.idle.append(entry)
+
+    def _retire(self, entry: _PooledBrowser) -> None:
+        with self._lock:
+            self._launched -= 1
+        try:
+            entry.browser.close()
+        except Exception:
+            pass
+
+
+@dataclass
+class _ParkedContext:
+    context: BrowserContext
+    page: Page
+    state_key: tuple[str, int]
+
+
+class ContextPool:
+    """Authenticated contexts kept open and parked on the search page.
+
+    ``park`` is called with a fresh page to bring it to the search form and
+    again when a lease ends, so the next search can submit immediately.
+    Contexts created from an older ``storage_state`` file are discarded.
+    """
+
+    def __init__(
+        self,
+        browser_pool: BrowserPool,
+        max_parked: int = 2,
+        locale: str = "ko-KR",
+    ) -> None:
+        self.browser_pool = browser_pool
+        self.max_parked = max(1, max_parked)
+        self.locale = locale
+        self._local = threading.local()
+
+    @contextmanager
+    def page(
+        self,
+        state_path: Path,
+        park: Callable[[Page], None],
+        timeout_ms: int,
+        setup_context: Callable[[BrowserContext], None] | None = None,
+    ) -> Iterator[Page]:
+        state_key = self._state_key(state_path)
+
+        with self.browser_pool.browser() as browser:
+            entry = self._take_parked(browser, state_key)
+            if entry is None:
+                entry = self._new_parked(browser, state_path, state_key, timeout_ms)
+                try:
+                    if setup_context is not None:
+                        setup_context(entry.context)
+                    park(entry.page)
+                except BaseException:
+                    self._discard(entry)
+                    raise
+
+            # 검색 0건 같은 일반 오류 뒤에는 컨텍스트를 계속 쓰고, 브라우저 오류·세션 만료·
+            # 호출자 중단(GeneratorExit 등)일 때만 닫음
+            reusable = False
+            try:
+                yield entry.page
+                reusable = True
+            except Exception as exc:
+                reusable = self._reusable_after(exc)
+                raise
+            finally:
+                self._release(entry, park, reusable)
+
+    def _release(
+        self,
+        entry: _ParkedContext,
+        park: Callable[[Page], None],
+        reusable: bool,
+    ) -> None:
+        if not reusable:
+            self._discard(entry)
+            return
+        try:
+            park(entry.page)
+        except Exception:
+            self._discard(entry)
+            return
+        self._park(entry)
+
+    @staticmethod
+    def _reusable_after(exc: Exception) -> bool:
+        from .sminfo_client import NotLoggedInError
+
+        return not isinstance(exc, (PlaywrightError, NotLoggedInError))
+
+    def close(self) -> None:
+        parked = self._parked()
+        while parked:
+            self._discard(parked.pop())
+
+    def _parked(self) -> list[_ParkedContext]:
+        parked = getattr(self._local, "parked", None)
+        if parked is None:
+            parked = []
+            self._local.parked = parked
+        return parked
+
+    def _take_parked(
+        self,
+        browser: Browser,
+        state_key: tuple[str, int],
+    ) -> _ParkedContext | None:
+        parked = self._parked()
+        found = None
+        for entry in list(parked):
+            stale = (
+                entry.page.is_closed()
+                or entry.context.browser is not browser
+                or entry.state_key != state_key
+            )
+            if stale:
+                parked.remove(entry)
+                self._discard(entry)
+                continue
+            if found is None:
+                parked.remove(entry)
+                found = entry
+        return found
+
+    def _new_parked(
+        self,
+        browser: Browser,
+        state_path: Path,
+        state_key: tuple[str, int],
+        timeout_ms: int,
+    ) -> _ParkedContext:
+        context = browser.new_context(storage_state=storage_state_arg(state_path), locale=self.locale)
+        page = context.new_page()
+        page.set_default_timeout(timeout_ms)
+        return _ParkedContext(context=context, page=page, state_key=state_key)
+
+    def _park(self, entry: _ParkedContext) -> None:
+        parked = self._parked()
+        if len(parked) >= self.max_parked:
+            self._discard(entry)
+            return
+        parked.append(entry)
+
+    @staticmethod
+    def _discard(entry: _ParkedContext) -> None:
+        try:
+            entry.context.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _state_key(state_path: Path) -> tuple[str, int]:
+        try:
+            return (str(state_path), state_path.stat().st_mtime_ns)
+        except OSError:
+            return (str(state_path), 0)
+
+
+_POOLS: dict[tuple[str, bool], BrowserPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_browser_pool(
+    channel: str | None = DEFAULT_BROWSER_CHANNEL,
+    headless: bool = True,
+) -> BrowserPool:
+    key = ((channel or "").strip().lower(), headless)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None or pool.closed:
+            pool = BrowserPool(channel=channel, headless=headless)
+            _POOLS[key] = pool
+        return pool
+
+
+def close_browser_pools() -> None:
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_browser_pools)
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import argparse
+import errno
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .browser_pool import BrowserPool, ContextPool
+from .config import (
+    DATA_DIR,
+    DEFAULT_BROWSER_CHANNEL,
+    DEFAULT_DAEMON_SOCKET,
+    DEFAULT_DAEMON_WORKERS,
+    DEFAULT_STATE_PATH,
+    DEFAULT_TIMEOUT_MS,
+)
+from .keepalive import start_keepalive_from_env
+from .readiness import get_readiness_stats
+from .resource_policy import get_default_resource_policy
+from .sminfo_client import NotLoggedInError, SearchError, SminfoClient
+
+_ERROR_TYPES: dict[str, type[Exception]] = {
+    "NotLoggedInError": NotLoggedInError,
+    "SearchError": SearchError,
+    "ValueError": ValueError,
+}
+
+
+def default_socket_path() -> Path:
+    return Path(DEFAULT_DAEMON_SOCKET) if DEFAULT_DAEMON_SOCKET else DATA_DIR / "browserd.sock"
+
+
+class BrowserDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix-socket server that runs search jobs on a fixed set of browser threads.
+
+    Connection threads only parse requests; every search runs on one of
+    ``workers`` executor threads, each holding at most one pooled browser, so
+    the node has a bounded browser fleet no matter how many web workers call in.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(
+        self,
+        socket_path: Path,
+        workers: int = DEFAULT_DAEMON_WORKERS,
+        state_path: Path = DEFAULT_STATE_PATH,
+        timeout_ms: int = DEFAULT_TIMEOUT_MS,
+        browser_channel: str | None = DEFAULT_BROWSER_CHANNEL,
+    ) -> None:
+        self.socket_path = Path(socket_path)
+        self.state_path = Path(state_path)
+        self.timeout_ms = timeout_ms
+        self.browser_channel = browser_channel
+        self.workers = max(1, workers)
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self._remove_stale_socket()
+
+        self.browser_pool = BrowserPool(
+            channel=browser_channel,
+            headless=True,
+            max_browsers=self.workers,
+        )
+        self.context_pool = ContextPool(self.browser_pool)
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix="sminfo-browser",
+        )
+
+        super().__init__(str(self.socket_path), _DaemonHandler)
+        os.chmod(self.socket_path, 0o600)
+
+    def _remove_stale_socket(self) -> None:
+        """Delete a socket file left by a dead daemon; refuse to take over a live one."""
+        if not self.socket_path.exists():
+            return
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            try:
+                sock.connect(str(self.socket_path))
+            except OSError:
+                self.socket_path.unlink(missing_ok=True)
+                return
+        raise OSError(
+            errno.EADDRINUSE,
+            "이미 실행 중인 브라우저 데몬이 소켓을 사용하고 있습니다",
+            str(self.socket_path),
+        )
+
+    def run_job(self, request: dict) -> dict:
+        op = request.get("op")
+        if op == "ping":
+            return {
+                "ok": True,
+                "workers": self.workers,
+                "resources": get_default_resource_policy().stats.snapshot(),
+                "readiness": get_readiness_stats().snapshot(),
+            }
+        if op != "search":
+            return {"ok": False, "error": "ValueError", "message": f"알 수 없는 요청: {op}"}
+
+        future = self.executor.submit(self._search, request)
+        try:
+            result = future.result()
+        except tuple(_ERROR_TYPES.values()) as exc:
+            return {"ok": False, "error": type(exc).__name__, "message": str(exc)}
+        except Exception as exc:
+            return {"ok": False, "error": "SearchError", "message": f"검색 처리 실패: {exc}"}
+        return {"ok": True, "result": result}
+
+    def _search(self, request: dict) -> dict:
+        client = SminfoClient(
+            state_path=request.get("state_path") or self.state_path,
+            timeout_ms=self.timeout_ms,
+            browser_channel=self.browser_channel,
+            browser_pool=self.browser_pool,
+            context_pool=self.context_pool,
+        )
+        return client.search_company(
+            query=str(request.get("query", "")),
+            company_name=request.get("company") or None,
+        ).to_dict()
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        try:
+            self.socket_path.unlink()
+        except OSError:
+            pass
+
+
+class _DaemonHandler(socketserver.StreamRequestHandler):
+    server: BrowserDaemon
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as exc:
+                response = {"ok": False, "error": "ValueError", "message": f"잘못된 요청: {exc}"}
+            else:
+                response = self.server.run_job(request)
+
+            payload = json.dumps(response, ensure_ascii=False) + "\n"
+            self.wfile.write(payload.encode("utf-8"))
+            self.wfile.flush()
+
+
+def call_daemon(socket_path: str | Path, request: dict, timeout: float | None = None) -> dict:
+    """Send one request to a running daemon and raise its error type on failure."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(socket_path))
+        except OSError as exc:
+            raise SearchError(f"브라우저 데몬에 연결하지 못했습니다: {socket_path} ({exc})") from exc
+
+        # 데몬이 바빠 작업이 밀리면 응답이 소켓 timeout보다 늦을 수 있음
+        try:
+            sock.sendall((json.dumps(request, ensure_ascii=False) + "\n").encode("utf-8"))
+            with sock.makefile("rb") as stream:
+                line = stream.readline()
+        except OSError as exc:
+            raise SearchError(f"브라우저 데몬 응답을 받지 못했습니다: {socket_path} ({exc})") from exc
+
+    if not line.strip():
+        raise SearchError("브라우저 데몬 응답이 없습니다.")
+
+    try:
+        response = json.loads(line)
+    except ValueError as exc:
+        raise SearchError(f"브라우저 데몬 응답을 해석하지 못했습니다: {exc}") from exc
+    if not isinstance(response, dict):
+        raise SearchError("브라우저 데몬 응답 형식이 올바르지 않습니다.")
+    if not response.get("ok"):
+        error_type = _ERROR_TYPES.get(str(response.get("error")), SearchError)
+        raise error_type(str(response.get("message", "")))
+    return response
+
+
+def serve(
+    socket_path: str | Path | None = None,
+    workers: int = DEFAULT_DAEMON_WORKERS,
+    state_path: str | Path | None = None,
+    timeout_ms: int = DEFAULT_TIMEOUT_MS,
+    browser_channel: str | None = DEFAULT_BROWSER_CHANNEL,
+) -> None:
+    daemon = BrowserDaemon(
+        socket_path=Path(socket_path) if socket_path else default_socket_path(),
+        workers=workers,
+        state_path=Path(state_path) if state_path else DEFAULT_STATE_PATH,
+        timeout_ms=timeout_ms,
+        browser_channel=browser_channel,
+    )
+
+    def _stop(signum, frame) -> None:
+        threading.Thread(target=daemon.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, _stop)
+    keeper = start_keepalive_from_env(daemon.state_path, timeout_ms=timeout_ms)
+    print(f"브라우저 데몬 시작: {daemon.socket_path} (workers={daemon.workers})")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if keeper is not None:
+            keeper.stop()
+        daemon.server_close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="sminfo-browserd",
+        description="gunicorn 워커들이 공유하는 브라우저 데몬",
+    )
+    parser.add_argument("--socket", default=None, help="Unix 소켓 경로 (기본: ./.data/browserd.sock)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_DAEMON_WORKERS, help="동시 실행 브라우저 수")
+    parser.add_argument("--state-path", default=None, help="로그인 세션 저장 파일 경로")
+    parser.add_argument("--timeout-ms", type=int, default=DEFAULT_TIMEOUT_MS, help="Playwright 기본 타임아웃(ms)")
+    args = parser.parse_args(argv)
+
+    try:
+        serve(
+            socket_path=args.socket,
+            workers=args.workers,
+            state_path=args.state_path,
+            timeout_ms=args.timeout_ms,
+        )
+    except OSError as exc:
+        print(f"오류: {exc}", file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import argparse
+import csv
 import json
 import os
 import sys
 from pathlib import Path
+from typing import TextIO
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -17,12 +19,33 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="로그인 세션 저장 파일 경로 (기본: ./.data/storage_state.json)",
     )
+    parser.add_argument(
+        "--meta-path",
+        default=None,
+        help="로그인 사용자 정보 파일 경로 (기본: ./.data/session_meta.json)",
+    )
+    parser.add_argument(
+        "--session-pool",
+        default=os.getenv("SMINFO_SESSION_POOL") or None,
+        help="여러 계정 세션을 나눠 쓰는 세션 풀 설정(JSON) 경로",
+    )
     parser.add_argument(
         "--timeout-ms",
         type=int,
         default=45000,
         help="Playwright 기본 타임아웃(ms)",
     )
+    parser.add_argument(
+        "--daemon-socket",
+        default=os.getenv("SMINFO_DAEMON_SOCKET") or None,
+        help="검색을 위임할 브라우저 데몬 Unix 소켓 경로",
+    )
+    parser.add_argument(
+        "--http",
+        action="store_true",
+        default=os.getenv("SMINFO_HTTP_CLIENT", "0") == "1",
+        help="브라우저 없이 HTTP 요청만으로 검색 (로그인은 브라우저 사용)",
+    )
 
     sub = parser.add_subparsers(dest="command", required=True)
 
@@ -59,46 +82,280 @@ def build_parser() -> argparse.ArgumentParser:
         help="터미널에 표 미리보기로 출력할 최대 row 수",
     )
 
+    batch = sub.add_parser("batch", help="CSV/JSONL 파일의 검색어를 일괄 조회 (JSONL 출력)")
+    batch.add_argument("input", help="검색어 파일 (CSV 또는 JSONL, query/company 컬럼)")
+    batch.add_argument(
+        "--format",
+        choices=("csv", "jsonl"),
+        default=None,
+        help="입력 형식 (기본: 확장자로 판단)",
+    )
+    batch.add_argument("--query-column", default="query", help="검색어 컬럼명")
+    batch.add_argument("--company-column", default="company", help="선택 회사명 컬럼명")
+    batch.add_argument("--workers", type=int, default=4, help="동시에 조회할 탭 수")
+    batch.add_argument(
+        "--output",
+        default="-",
+        help="결과 JSONL 경로 (기본: 표준출력)",
+    )
+    batch.add_argument(
+        "--checkpoint",
+        default=None,
+        help="재개용 체크포인트 파일 (기본: <output 또는 input>.checkpoint)",
+    )
+
+    keepalive = sub.add_parser("keepalive", help="로그인 세션을 주기적으로 갱신 (만료 시 자동 재로그인)")
+    keepalive.add_argument(
+        "--interval",
+        type=int,
+        default=int(os.getenv("SMINFO_KEEPALIVE_INTERVAL", "0")) or 600,
+        help="갱신 주기(초)",
+    )
+    keepalive.add_argument("--once", action="store_true", help="한 번만 갱신하고 종료")
+
+    daemon = sub.add_parser("daemon", help="브라우저 데몬 실행 (gunicorn 워커 공용)")
+    daemon.add_argument(
+        "--socket",
+        default=None,
+        help="Unix 소켓 경로 (기본: ./.data/browserd.sock)",
+    )
+    daemon.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("SMINFO_DAEMON_WORKERS", "2")),
+        help="동시 실행 브라우저 수",
+    )
+
     return parser
 
 
-def _print_result(result: dict, show_rows: int) -> None:
-    print(f"검색어: {result['query']}")
-    print(f"후보 수: {len(result['candidates'])}")
+def _print_candidates(query: str, candidates: list) -> None:
+    print(f"검색어: {query}")
+    print(f"후보 수: {len(candidates)}")
 
-    if result["candidates"]:
+    if candidates:
         print("\n후보 목록:")
-        for idx, candidate in enumerate(result["candidates"][:10], start=1):
-            table_title = candidate["table_title"] or "(제목 없음)"
+        for idx, candidate in enumerate(candidates[:10], start=1):
+            table_title = candidate.table_title or "(제목 없음)"
             print(
-                f"{idx:>2}. {candidate['name']}  | score={candidate['match_score']} | table={table_title}"
+                f"{idx:>2}. {candidate.name}  | score={candidate.match_score} | table={table_title}"
             )
 
-    if result["selected"]:
-        print(f"\n선택 회사: {result['selected']['name']}")
 
-    tables = result["performance_tables"]
-    print(f"추출 표 수: {len(tables)}")
+def _print_table(idx: int, table, show_rows: int) -> None:
+    title = table.title or f"Table {idx}"
+    print(f"\n[{idx}] {title}")
+    if table.headers:
+        print("  " + " | ".join(table.headers))
+
+    for row in table.rows[:show_rows]:
+        print("  " + " | ".join(row))
+
+    if len(table.rows) > show_rows:
+        remain = len(table.rows) - show_rows
+        print(f"  ... {remain} rows more")
+
+
+def _stream_search(events, show_rows: int):
+    """Print each search stage as it arrives and return the final result."""
+    from .models import EVENT_CANDIDATES, EVENT_RESULT, EVENT_SELECTED, EVENT_TABLE
+    from .sminfo_client import SearchError
+
+    table_count = 0
+    for event in events:
+        if event.kind == EVENT_CANDIDATES:
+            _print_candidates(event.query, event.candidates)
+        elif event.kind == EVENT_SELECTED:
+            print(f"\n선택 회사: {event.selected.name}")
+        elif event.kind == EVENT_TABLE:
+            table_count += 1
+            _print_table(table_count, event.table, show_rows)
+        elif event.kind == EVENT_RESULT:
+            print(f"\n추출 표 수: {table_count}")
+            return event.result
+    raise SearchError("검색 결과를 받지 못했습니다.")
+
+
+def _read_batch_queries(
+    path: Path,
+    fmt: str | None,
+    query_column: str,
+    company_column: str,
+) -> list[tuple[str, str | None]]:
+    fmt = fmt or ("jsonl" if path.suffix.lower() in (".jsonl", ".ndjson") else "csv")
+    queries: list[tuple[str, str | None]] = []
+
+    with path.open(encoding="utf-8-sig", newline="") as fp:
+        if fmt == "csv":
+            reader = csv.DictReader(fp)
+            if not reader.fieldnames or query_column not in reader.fieldnames:
+                raise ValueError(f"CSV에 '{query_column}' 컬럼이 없습니다: {path}")
+            for row in reader:
+                query = (row.get(query_column) or "").strip()
+                company = (row.get(company_column) or "").strip()
+                queries.append((query, company or None))
+            return queries
+
+        for line_no, line in enumerate(fp, start=1):
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"JSONL {line_no}행을 읽지 못했습니다: {exc}") from exc
+            if isinstance(item, str):
+                queries.append((item.strip(), None))
+                continue
+            query = str(item.get(query_column) or "").strip()
+            company = str(item.get(company_column) or "").strip()
+            queries.append((query, company or None))
+    return queries
+
+
+def _batch_key(query: str, company: str | None) -> str:
+    return json.dumps([query, company or ""], ensure_ascii=False)
+
+
+def _load_checkpoint(path: Path) -> set[str]:
+    if not path.exists():
+        return set()
+
+    done: set[str] = set()
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError:
+            # 중단 시점에 잘린 마지막 줄은 무시
+            continue
+        done.add(_batch_key(item.get("query", ""), item.get("company")))
+    return done
+
+
+def _drop_retried_lines(output_path: Path, retry_keys: set[str]) -> None:
+    """Remove earlier error lines for rows that are about to be looked up again.
+
+    Transient failures are written to the output but not checkpointed, so a
+    resumed run would otherwise append a second line for the same row.
+    """
+    if not output_path.exists():
+        return
+
+    kept: list[str] = []
+    for line in output_path.read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError:
+            # 중단 시점에 잘린 마지막 줄은 버림
+            continue
+        key = _batch_key(item.get("query", ""), item.get("company_name"))
+        if not item.get("ok") and key in retry_keys:
+            continue
+        kept.append(line)
+
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text("".join(line + "\n" for line in kept), encoding="utf-8")
+        os.replace(tmp_path, output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _run_batch(args: argparse.Namespace, client) -> int:
+    input_path = Path(args.input)
+    if not input_path.exists():
+        raise ValueError(f"입력 파일이 없습니다: {input_path}")
+
+    queries = _read_batch_queries(
+        input_path,
+        args.format,
+        args.query_column,
+        args.company_column,
+    )
 
-    for idx, table in enumerate(tables, start=1):
-        title = table["title"] or f"Table {idx}"
-        print(f"\n[{idx}] {title}")
-        if table["headers"]:
-            print("  " + " | ".join(table["headers"]))
+    to_stdout = args.output == "-"
+    if args.checkpoint:
+        checkpoint_path = Path(args.checkpoint)
+    elif to_stdout:
+        checkpoint_path = input_path.with_name(input_path.name + ".checkpoint")
+    else:
+        checkpoint_path = Path(args.output + ".checkpoint")
+
+    done = _load_checkpoint(checkpoint_path)
+    pending = [
+        (index, query, company)
+        for index, (query, company) in enumerate(queries)
+        if _batch_key(query, company) not in done
+    ]
+    print(
+        f"일괄 조회: 전체 {len(queries)}건, 완료 {len(queries) - len(pending)}건, 남은 {len(pending)}건",
+        file=sys.stderr,
+    )
+    if not pending:
+        return 0
+
+    checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+    out: TextIO
+    if to_stdout:
+        out = sys.stdout
+    else:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if done:
+            _drop_retried_lines(
+                output_path, {_batch_key(query, company) for _, query, company in pending}
+            )
+        out = output_path.open("a" if done else "w", encoding="utf-8")
 
-        for row in table["rows"][:show_rows]:
-            print("  " + " | ".join(row))
+    from .sminfo_client import NotLoggedInError
 
-        if len(table["rows"]) > show_rows:
-            remain = len(table["rows"]) - show_rows
-            print(f"  ... {remain} rows more")
+    exit_code = 0
+    try:
+        with checkpoint_path.open("a", encoding="utf-8") as checkpoint:
+            outcomes = client.search_many(
+                [(query, company) for _, query, company in pending],
+                concurrency=args.workers,
+            )
+            for finished, outcome in enumerate(outcomes, start=1):
+                index, query, company = pending[outcome.index]
+                payload = outcome.to_dict()
+                payload["index"] = index
+                out.write(json.dumps(payload, ensure_ascii=False) + "\n")
+                out.flush()
+
+                status = "ok" if outcome.ok else f"{outcome.error_type}: {outcome.error}"
+                print(f"[{finished}/{len(pending)}] {query} - {status}", file=sys.stderr)
+
+                if outcome.error_type == NotLoggedInError.__name__:
+                    print(
+                        "오류: 로그인 세션이 만료되어 일괄 조회를 중단합니다. 다시 로그인 후 같은 명령으로 재개하세요.",
+                        file=sys.stderr,
+                    )
+                    exit_code = 2
+                    break
+
+                # 결과가 확정된 건만 기록하고, 일시적 오류는 재개 시 다시 조회
+                if outcome.ok or outcome.error_type in ("SearchError", "ValueError"):
+                    checkpoint.write(
+                        json.dumps({"query": query, "company": company}, ensure_ascii=False) + "\n"
+                    )
+                    checkpoint.flush()
+            outcomes.close()
+    finally:
+        if not to_stdout:
+            out.close()
+
+    return exit_code
 
 
 def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
 
-    from .config import DEFAULT_STATE_PATH
+    from .config import DEFAULT_BROWSER_CHANNEL, DEFAULT_STATE_PATH
 
     state_path = Path(args.state_path) if args.state_path else DEFAULT_STATE_PATH
 
@@ -119,11 +376,83 @@ def main(argv: list[str] | None = None) -> int:
         print(f"상세: {exc}", file=sys.stderr)
         return 3
 
-    client = SminfoClient(
-        state_path=state_path,
-        timeout_ms=args.timeout_ms,
-        headless=True,
-    )
+    if args.command == "keepalive":
+        from .keepalive import SessionKeeper
+
+        keeper = SessionKeeper(
+            state_path=state_path,
+            interval_seconds=args.interval,
+            timeout_ms=args.timeout_ms,
+        )
+        if args.once:
+            return 0 if keeper.run_once(force=True) else 2
+        try:
+            keeper.run_forever()
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    if args.command == "daemon":
+        from .browserd import serve
+
+        try:
+            serve(
+                socket_path=args.socket or args.daemon_socket,
+                workers=args.workers,
+                state_path=state_path,
+                timeout_ms=args.timeout_ms,
+            )
+        except OSError as exc:
+            print(f"오류: {exc}", file=sys.stderr)
+            return 2
+        return 0
+
+    def make_client(state_path: Path, meta_path: Path | None, **kwargs):
+        if args.http and args.command in ("search", "batch"):
+            from .http_client import SminfoHttpClient
+
+            return SminfoHttpClient(
+                state_path=state_path,
+                meta_path=meta_path,
+                timeout_ms=args.timeout_ms,
+                **kwargs,
+            )
+        return SminfoClient(
+            state_path=state_path,
+            meta_path=meta_path,
+            timeout_ms=args.timeout_ms,
+            headless=True,
+            daemon_socket=args.daemon_socket,
+            **kwargs,
+        )
+
+    browser_pool = None
+    if args.session_pool and args.command in ("search", "batch"):
+        from .session_pool import SessionPool, SessionPoolClient
+
+        try:
+            pool = SessionPool.from_file(args.session_pool)
+        except ValueError as exc:
+            print(f"오류: {exc}", file=sys.stderr)
+            return 2
+        # 풀의 계정들은 SMINFO_ID 계정으로 자동 재로그인하지 않음
+        slot_kwargs: dict = {"auto_relogin": False}
+        if not args.http and not args.daemon_socket:
+            from .browser_pool import BrowserPool
+
+            # 조회마다 브라우저를 새로 띄우지 않도록 계정 클라이언트들이 한 풀을 공유
+            browser_pool = BrowserPool(
+                channel=DEFAULT_BROWSER_CHANNEL,
+                headless=True,
+                max_browsers=getattr(args, "workers", 1),
+            )
+            slot_kwargs["browser_pool"] = browser_pool
+        client = SessionPoolClient(
+            pool,
+            lambda slot: make_client(slot.state_path, slot.meta_path, **slot_kwargs),
+        )
+    else:
+        client = make_client(state_path, Path(args.meta_path) if args.meta_path else None)
 
     try:
         if args.command == "login":
@@ -137,13 +466,11 @@ def main(argv: list[str] | None = None) -> int:
             return 0
 
         if args.command == "search":
-            result = client.search_company(
-                query=args.query,
-                company_name=args.company,
+            result = _stream_search(
+                client.iter_search(args.query, company_name=args.company),
+                show_rows=args.show_rows,
             ).to_dict()
 
-            _print_result(result, show_rows=args.show_rows)
-
             if args.json_output:
                 output_path = Path(args.json_output)
                 output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -155,9 +482,15 @@ def main(argv: list[str] | None = None) -> int:
 
             return 0
 
+        if args.command == "batch":
+            return _run_batch(args, client)
+
     except (NotLoggedInError, SearchError, ValueError) as exc:
         print(f"오류: {exc}", file=sys.stderr)
         return 2
+    finally:
+        if browser_pool is not None:
+            browser_pool.close()
 
     return 0
 
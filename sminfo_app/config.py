@@ -3,7 +3,7 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
-BASE_URL = "https://sminfo.mss.go.kr"
+BASE_URL = os.getenv("SMINFO_BASE_URL", "https://sminfo.mss.go.kr").rstrip("/")
 SEARCH_PATH = "/gc/sf/GSF002R0.print"
 SEARCH_MENU_ID = "421010100"
 
@@ -17,3 +17,34 @@ DEFAULT_META_PATH = Path(
 )
 DEFAULT_TIMEOUT_MS = int(os.getenv("SMINFO_TIMEOUT_MS", "45000"))
 DEFAULT_BROWSER_CHANNEL = os.getenv("SMINFO_BROWSER_CHANNEL", "chrome").strip()
+DEFAULT_POOL_MAX_BROWSERS = int(os.getenv("SMINFO_POOL_MAX_BROWSERS", "2"))
+DEFAULT_POOL_MAX_USES = int(os.getenv("SMINFO_POOL_MAX_USES", "100"))
+DEFAULT_DAEMON_SOCKET = os.getenv("SMINFO_DAEMON_SOCKET", "").strip()
+DEFAULT_DAEMON_WORKERS = int(os.getenv("SMINFO_DAEMON_WORKERS", "2"))
+DEFAULT_BLOCK_RESOURCES = os.getenv("SMINFO_BLOCK_RESOURCES", "image,font,media")
+DEFAULT_ALLOW_URL_PATTERNS = os.getenv("SMINFO_ALLOW_URL_PATTERNS", "")
+DEFAULT_DENY_URL_PATTERNS = os.getenv("SMINFO_DENY_URL_PATTERNS", "")
+DEFAULT_BLOCK_THIRD_PARTY_SCRIPTS = os.getenv("SMINFO_BLOCK_THIRD_PARTY_SCRIPTS", "0") == "1"
+DEFAULT_READINESS = os.getenv("SMINFO_READINESS", "1") == "1"
+DEFAULT_READY_TIMEOUT_MS = int(os.getenv("SMINFO_READY_TIMEOUT_MS", "10000"))
+DEFAULT_READINESS_AUDIT = os.getenv("SMINFO_READINESS_AUDIT", "0") == "1"
+DEFAULT_HTTP_FAST_PATH = os.getenv("SMINFO_HTTP_FAST_PATH", "0") == "1"
+DEFAULT_HTTP_CLIENT = os.getenv("SMINFO_HTTP_CLIENT", "0") == "1"
+DEFAULT_HTTP_MAX_CONNECTIONS = int(os.getenv("SMINFO_HTTP_MAX_CONNECTIONS", "4"))
+DEFAULT_SINGLE_NAVIGATION = os.getenv("SMINFO_SINGLE_NAVIGATION", "1") == "1"
+DEFAULT_SESSION_PROBE_TTL = float(os.getenv("SMINFO_SESSION_PROBE_TTL", "60"))
+DEFAULT_SESSION_PROBE_PATH = os.getenv("SMINFO_SESSION_PROBE_PATH", SEARCH_PATH)
+DEFAULT_KEEPALIVE_INTERVAL = int(os.getenv("SMINFO_KEEPALIVE_INTERVAL", "0"))
+DEFAULT_SESSION_POOL_PATH = os.getenv("SMINFO_SESSION_POOL", "").strip()
+DEFAULT_AUTO_RELOGIN = os.getenv("SMINFO_AUTO_RELOGIN", "0") == "1"
+DEFAULT_SKIP_FRAME_PATTERNS = os.getenv(
+    "SMINFO_SKIP_FRAME_PATTERNS",
+    "*doubleclick.net/*,*googlesyndication.com/*,*google-analytics.com/*,"
+    "*googletagmanager.com/*,*facebook.com/*,*facebook.net/*",
+)
+DEFAULT_TABLE_LIMIT = int(os.getenv("SMINFO_TABLE_LIMIT", "10"))
+DEFAULT_IN_PAGE_TABLE_SCORING = os.getenv("SMINFO_IN_PAGE_TABLE_SCORING", "1") == "1"
+DEFAULT_TABLE_KEYWORDS = os.getenv("SMINFO_TABLE_KEYWORDS", "")
+DEFAULT_RESULT_MAX_PAGES = int(os.getenv("SMINFO_RESULT_MAX_PAGES", "1"))
+DEFAULT_RESULT_PAGE_CONCURRENCY = int(os.getenv("SMINFO_RESULT_PAGE_CONCURRENCY", "4"))
+DEFAULT_RESULT_PAGE_SIZE = int(os.getenv("SMINFO_RESULT_PAGE_SIZE", "10"))
@@ -0,0 +1,369 @@
+"""Python ports of the in-page extraction scripts.
+
+Each ``extract_*`` function returns the same raw dicts as the matching
+``page.evaluate`` script in ``sminfo_client`` so the client's merge/build
+helpers can consume either. ``innerText`` is approximated by element text
+with cell/block boundaries turned into spaces, which is what the scripts'
+whitespace normalisation reduces it to anyway.
+"""
+
+from __future__ import annotations
+
+import re
+from html.parser import HTMLParser
+from typing import Iterator
+
+from .textnorm import normalize_text
+
+_VOID_TAGS = frozenset(
+    {
+        "area", "base", "br", "col", "embed", "hr", "img", "input",
+        "link", "meta", "param", "source", "track", "wbr",
+    }
+)
+_SKIP_TEXT_TAGS = frozenset({"script", "style", "template", "noscript", "head"})
+_BREAK_TAGS = frozenset(
+    {
+        "address", "article", "aside", "blockquote", "br", "caption", "dd", "div",
+        "dl", "dt", "fieldset", "figcaption", "figure", "footer", "form", "h1",
+        "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol",
+        "p", "pre", "section", "table", "tbody", "td", "tfoot", "th", "thead",
+        "tr", "ul",
+    }
+)
+# 열린 <p>를 암묵적으로 닫는 태그
+_P_CLOSERS = frozenset(
+    {
+        "address", "article", "aside", "blockquote", "div", "dl", "fieldset",
+        "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr",
+        "main", "nav", "ol", "p", "pre", "section", "table", "ul",
+    }
+)
+_SECTION_TAGS = frozenset({"thead", "tbody", "tfoot"})
+
+_LOGIN_ID_NAMES = frozenset({"id", "login_id"})
+_LOGIN_PW_NAMES = frozenset({"pwd", "login_password"})
+_HIDDEN_STYLE_RE = re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden", re.IGNORECASE)
+
+_BLOCKED_LINK_TEXT = frozenset(
+    {"로그인", "회원가입", "홈", "사이트맵", "검색", "조회", "닫기", "메뉴", "다음", "이전", "상세보기", "more"}
+)
+
+_RESULT_COUNT_RE = re.compile(r"검색결과\s*([0-9,]+)\s*건")
+_HEADER_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+_KOREAN_CHARSETS = frozenset({"euc-kr", "euc_kr", "ks_c_5601-1987", "ksc5601", "x-windows-949"})
+
+
+_normalize = normalize_text
+
+
+class Element:
+    __slots__ = ("tag", "attrs", "children", "parent")
+
+    def __init__(self, tag: str, attrs: dict[str, str], parent: Element | None) -> None:
+        self.tag = tag
+        self.attrs = attrs
+        self.children: list[Element | str] = []
+        self.parent = parent
+
+    def get(self, name: str, default: str = "") -> str:
+        return self.attrs.get(name, default)
+
+    def iter(self, *tags: str) -> Iterator[Element]:
+        """Descendant elements in document order, optionally filtered by tag."""
+        stack = [child for child in reversed(self.children) if isinstance(child, Element)]
+        while stack:
+            node = stack.pop()
+            if not tags or node.tag in tags:
+                yield node
+            stack.extend(child for child in reversed(node.children) if isinstance(child, Element))
+
+    def find(self, *tags: str) -> Element | None:
+        return next(self.iter(*tags), None)
+
+    def closest(self, *tags: str) -> Element | None:
+        node = self.parent
+        while node is not None:
+            if node.tag in tags:
+                return node
+            node = node.parent
+        return None
+
+    def previous_siblings(self) -> Iterator[Element]:
+        """Element siblings before this one, nearest first."""
+        if self.parent is None:
+            return
+        siblings = self.parent.children
+        index = next(i for i, child in enumerate(siblings) if child is self)
+        for child in reversed(siblings[:index]):
+            if isinstance(child, Element):
+                yield child
+
+    def text(self) -> str:
+        parts: list[str] = []
+        self._collect_text(parts)
+        return _normalize("".join(parts))
+
+    def _collect_text(self, parts: list[str]) -> None:
+        for child in self.children:
+            if isinstance(child, str):
+                parts.append(child)
+                continue
+            if child.tag in _SKIP_TEXT_TAGS:
+                continue
+            if child.tag in _BREAK_TAGS:
+                parts.append(" ")
+                child._collect_text(parts)
+                parts.append(" ")
+            else:
+                child._collect_text(parts)
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.root = Element("#document", {}, None)
+        self._stack = [self.root]
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._close_implied(tag)
+        element = Element(tag, {name: value or "" for name, value in attrs}, self._stack[-1])
+        self._stack[-1].children.append(element)
+        if tag not in _VOID_TAGS:
+            self._stack.append(element)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._close_implied(tag)
+        element = Element(tag, {name: value or "" for name, value in attrs}, self._stack[-1])
+        self._stack[-1].children.append(element)
+
+    def handle_endtag(self, tag: str) -> None:
+        for index in range(len(self._stack) - 1, 0, -1):
+            if self._stack[index].tag == tag:
+                del self._stack[index:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        self._stack[-1].children.append(data)
+
+    def _close_implied(self, tag: str) -> None:
+        if tag in ("td", "th"):
+            self._pop_until(("td", "th"), boundary=("tr", "table"))
+        elif tag == "tr":
+            self._pop_until(("tr",), boundary=("table",))
+        elif tag in _SECTION_TAGS:
+            self._pop_until(_SECTION_TAGS, boundary=("table",))
+        elif tag == "li":
+            self._pop_until(("li",), boundary=("ul", "ol"))
+        elif tag == "option":
+            self._pop_until(("option",), boundary=("select",))
+
+        if tag in _P_CLOSERS:
+            self._pop_until(("p",), boundary=("td", "th", "table", "button"))
+
+    def _pop_until(self, tags, boundary) -> None:
+        for index in range(len(self._stack) - 1, 0, -1):
+            node_tag = self._stack[index].tag
+            if node_tag in tags:
+                del self._stack[index:]
+                return
+            if node_tag in boundary:
+                return
+
+
+def parse_html(markup: str) -> Element:
+    builder = _TreeBuilder()
+    builder.feed(markup or "")
+    builder.close()
+    return builder.root
+
+
+def normalize_charset(charset: str) -> str:
+    charset = (charset or "utf-8").strip().lower()
+    if charset in _KOREAN_CHARSETS:
+        # EUC-KR로 선언된 페이지도 확장 완성형 글자를 섞어 쓰므로 상위 집합으로 디코딩
+        return "cp949"
+    return charset
+
+
+def detect_charset(body: bytes, content_type: str | None = None) -> str:
+    match = _HEADER_CHARSET_RE.search(content_type or "")
+    if match is None:
+        meta = _META_CHARSET_RE.search(body[:4096])
+        charset = meta.group(1).decode("ascii", "ignore") if meta else "utf-8"
+    else:
+        charset = match.group(1)
+    return normalize_charset(charset)
+
+
+def decode_html(body: bytes, content_type: str | None = None) -> str:
+    try:
+        return body.decode(detect_charset(body, content_type), errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def _guess_title(table: Element, max_len: int) -> str:
+    caption = table.find("caption")
+    if caption is not None and caption.text():
+        return caption.text()
+
+    for prev in table.previous_siblings():
+        text = prev.text()
+        if text and len(text) <= max_len:
+            return text
+    return ""
+
+
+def _score(name: str, row_text: str, keyword: str) -> int:
+    score = 0
+    if keyword:
+        lower = name.lower()
+        if lower == keyword:
+            score += 100
+        if keyword in lower:
+            score += 60
+        if keyword in row_text.lower():
+            score += 20
+    return score
+
+
+def extract_candidates(root: Element, keyword: str) -> list[dict]:
+    """Port of ``_CANDIDATE_TABLE_EXTRACT_SCRIPT``; rows also carry the link ``href``."""
+    kw = _normalize(keyword).lower()
+    out = []
+
+    for table in root.iter("table"):
+        title = _guess_title(table, 60)
+        for row in table.iter("tr"):
+            links = list(row.iter("a"))
+            if not links:
+                continue
+            row_text = row.text()
+            for link in links:
+                name = link.text()
+                if not name:
+                    continue
+                out.append(
+                    {
+                        "name": name,
+                        "row_text": row_text,
+                        "table_title": title,
+                        "match_score": _score(name, row_text, kw),
+                        "href": link.get("href"),
+                    }
+                )
+    return out
+
+
+def extract_link_candidates(root: Element, keyword: str) -> list[dict]:
+    """Port of ``_GENERIC_LINK_CANDIDATE_SCRIPT``."""
+    kw = _normalize(keyword).lower()
+    out = []
+
+    for link in root.iter("a"):
+        text = link.text()
+        if not text or len(text) < 2 or len(text) > 70:
+            continue
+        lower = text.lower()
+        if lower in _BLOCKED_LINK_TEXT:
+            continue
+
+        score = 0
+        if kw:
+            if lower == kw:
+                score += 100
+            if kw in lower:
+                score += 60
+        out.append(
+            {
+                "name": text,
+                "row_text": "",
+                "table_title": "",
+                "match_score": score,
+                "href": link.get("href"),
+            }
+        )
+    return out
+
+
+def _table_title(table: Element) -> str:
+    caption = table.find("caption")
+    if caption is not None and caption.text():
+        return caption.text()
+
+    container = table.closest("section", "article", "div")
+    if container is not None:
+        title_node = container.find("h1", "h2", "h3", "h4", "strong")
+        if title_node is not None and title_node.text():
+            return title_node.text()
+
+    for prev in table.previous_siblings():
+        text = prev.text()
+        if text and len(text) <= 80:
+            return text
+    return ""
+
+
+def extract_tables(root: Element) -> list[dict]:
+    """Port of ``_TABLE_EXTRACT_SCRIPT``."""
+    out = []
+    for table in root.iter("table"):
+        body_rows = list(_within(table, "tbody", "tr"))
+        rows = body_rows or list(table.iter("tr"))
+        cells = [[cell.text() for cell in tr.iter("th", "td")] for tr in rows]
+        cells = [row for row in cells if row and any(cell != "" for cell in row)]
+        if not cells:
+            continue
+
+        headers = [text for th in _within(table, "thead", "th") if (text := th.text())]
+        out.append({"title": _table_title(table), "headers": headers, "rows": cells})
+    return out
+
+
+def _within(root: Element, section: str, tag: str) -> Iterator[Element]:
+    """``root.querySelectorAll("<section> <tag>")``."""
+    for node in root.iter(tag):
+        parent = node.parent
+        while parent is not None and parent is not root:
+            if parent.tag == section:
+                yield node
+                break
+            parent = parent.parent
+
+
+def read_result_count(root: Element) -> str | None:
+    """Port of ``_RESULT_COUNT_SCRIPT``."""
+    body = root.find("body") or root
+    match = _RESULT_COUNT_RE.search(body.text())
+    return match.group(1) if match else None
+
+
+def _is_hidden(field: Element) -> bool:
+    """Hidden input, or inside an element hidden by attribute or inline style.
+
+    Stylesheets are not applied, so this only approximates the browser's
+    ``is_visible`` check the Playwright clients use.
+    """
+    if field.get("type").lower() == "hidden":
+        return True
+    node: Element | None = field
+    while node is not None:
+        if "hidden" in node.attrs or _HIDDEN_STYLE_RE.search(node.get("style")):
+            return True
+        node = node.parent
+    return False
+
+
+def has_login_form(root: Element) -> bool:
+    """Port of ``_LOGIN_FORM_SCRIPT``: visible ID and password inputs on the page."""
+    has_id = has_pw = False
+    for field in root.iter("input"):
+        if _is_hidden(field):
+            continue
+        name = field.get("name")
+        ident = field.get("id")
+        has_id = has_id or name in _LOGIN_ID_NAMES or ident in _LOGIN_ID_NAMES
+        has_pw = has_pw or name in _LOGIN_PW_NAMES or ident in _LOGIN_PW_NAMES
+    return has_id and has_pw
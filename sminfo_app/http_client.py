@@ -0,0 +1,557 @@
+from __future__ import annotations
+
+import gzip
+import http.client
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from email.message import Message
+from http.cookies import SimpleCookie
+from pathlib import Path
+from typing import Iterable, Iterator
+from urllib.parse import urlencode, urljoin, urlparse
+
+from .config import (
+    BASE_URL,
+    DEFAULT_AUTO_RELOGIN,
+    DEFAULT_BROWSER_CHANNEL,
+    DEFAULT_HTTP_MAX_CONNECTIONS,
+    DEFAULT_SESSION_PROBE_PATH,
+    DEFAULT_SESSION_PROBE_TTL,
+    DEFAULT_TIMEOUT_MS,
+    SEARCH_PATH,
+)
+from .html_extract import (
+    Element,
+    detect_charset,
+    extract_tables,
+    has_login_form,
+    parse_html,
+    read_result_count,
+)
+from .models import (
+    EVENT_CANDIDATES,
+    EVENT_RESULT,
+    EVENT_SELECTED,
+    EVENT_TABLE,
+    BatchOutcome,
+    SearchEvent,
+    SearchResult,
+)
+from .session_state import JsonFileCache, load_json_file
+from .sminfo_client import NotLoggedInError, SearchError, SminfoClientBase
+
+_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+)
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 5
+
+
+@dataclass
+class _HttpResponse:
+    status: int
+    url: str
+    headers: Message
+    body: bytes
+
+    @property
+    def charset(self) -> str:
+        return detect_charset(self.body, self.headers.get("Content-Type"))
+
+    def text(self) -> str:
+        try:
+            return self.body.decode(self.charset, errors="replace")
+        except LookupError:
+            return self.body.decode("utf-8", errors="replace")
+
+
+class _CookieJar:
+    """Cookies of a Playwright ``storage_state`` file, reloaded when the file changes."""
+
+    def __init__(self, state_path: Path, host: str) -> None:
+        self.state_path = state_path
+        self.host = host
+        self._lock = threading.Lock()
+        self._cookies: list[dict] = []
+        self._loaded_key: tuple[int, int, int] | None = None
+
+    def header(self, path: str, secure: bool) -> str:
+        now = time.time()
+        with self._lock:
+            self._reload_if_changed()
+            pairs = [
+                f"{cookie['name']}={cookie['value']}"
+                for cookie in self._cookies
+                if self._matches(cookie, path, secure, now)
+            ]
+        return "; ".join(pairs)
+
+    def update(self, set_cookie_headers: list[str]) -> None:
+        if not set_cookie_headers:
+            return
+
+        with self._lock:
+            for raw in set_cookie_headers:
+                parsed = SimpleCookie()
+                try:
+                    parsed.load(raw)
+                except Exception:
+                    continue
+                for name, morsel in parsed.items():
+                    path = morsel["path"] or "/"
+                    self._cookies = [
+                        cookie
+                        for cookie in self._cookies
+                        if not (cookie["name"] == name and cookie.get("path", "/") == path)
+                    ]
+                    if morsel["max-age"] == "0" or not morsel.value:
+                        continue
+                    self._cookies.append(
+                        {
+                            "name": name,
+                            "value": morsel.value,
+                            "domain": morsel["domain"] or self.host,
+                            "path": path,
+                            "expires": -1,
+                            "secure": bool(morsel["secure"]),
+                        }
+                    )
+
+    def _reload_if_changed(self) -> None:
+        key = JsonFileCache.file_key(self.state_path)
+        if key is None:
+            raise NotLoggedInError(f"저장된 로그인 세션이 없습니다: {self.state_path}")
+        if key == self._loaded_key:
+            return
+
+        raw = load_json_file(self.state_path)
+        if raw is None:
+            raise NotLoggedInError(f"로그인 세션 파일을 읽지 못했습니다: {self.state_path}")
+        self._cookies = [cookie for cookie in raw.get("cookies", []) if cookie.get("name")]
+        self._loaded_key = key
+
+    def _matches(self, cookie: dict, path: str, secure: bool, now: float) -> bool:
+        domain = str(cookie.get("domain", "")).lstrip(".").lower()
+        if domain and self.host != domain and not self.host.endswith("." + domain):
+            return False
+        if not path.startswith(cookie.get("path") or "/"):
+            return False
+        if cookie.get("secure") and not secure:
+            return False
+        expires = cookie.get("expires", -1)
+        return expires is None or expires < 0 or expires > now
+
+
+class _ConnectionPool:
+    """Keep-alive connections to a single origin, reused across threads."""
+
+    def __init__(self, base_url: str, max_connections: int, timeout: float) -> None:
+        parsed = urlparse(base_url)
+        self.secure = parsed.scheme == "https"
+        self.host = parsed.hostname or ""
+        self.port = parsed.port
+        self.timeout = timeout
+
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max(1, max_connections))
+
+    @contextmanager
+    def connection(self) -> Iterator[http.client.HTTPConnection]:
+        self._slots.acquire()
+        try:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                conn = self._connect()
+
+            try:
+                yield conn
+            except Exception:
+                conn.close()
+                raise
+            with self._lock:
+                self._idle.append(conn)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self.secure:
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+
+class SminfoHttpClient(SminfoClientBase):
+    """Browser-free search client replaying the site's form requests over HTTP.
+
+    Cookies come from the storage state written by ``SminfoClient.login``,
+    which is the only step that still needs Playwright. A lookup is the
+    search POST plus one detail GET over pooled keep-alive connections, and
+    both pages are parsed with ``html_extract``. Result lists whose company
+    links are ``javascript:`` handlers cannot be followed and raise
+    ``SearchError``; use the browser client for those.
+    """
+
+    def __init__(
+        self,
+        state_path: str | Path | None = None,
+        meta_path: str | Path | None = None,
+        timeout_ms: int = DEFAULT_TIMEOUT_MS,
+        max_connections: int = DEFAULT_HTTP_MAX_CONNECTIONS,
+        auto_relogin: bool = DEFAULT_AUTO_RELOGIN,
+    ) -> None:
+        super().__init__(
+            state_path=state_path,
+            meta_path=meta_path,
+            timeout_ms=timeout_ms,
+            auto_relogin=auto_relogin,
+        )
+        self._pool = _ConnectionPool(BASE_URL, max_connections, timeout=timeout_ms / 1000)
+        self._cookies = _CookieJar(self.state_path, self._pool.host)
+
+    def __enter__(self) -> SminfoHttpClient:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def login(
+        self,
+        username: str | None = None,
+        password: str | None = None,
+        headless: bool = False,
+        manual_wait_seconds: int = 300,
+        browser_channel: str | None = DEFAULT_BROWSER_CHANNEL,
+    ) -> Path:
+        from .sminfo_client import SminfoClient
+
+        return SminfoClient(
+            state_path=self.state_path,
+            meta_path=self.meta_path,
+            timeout_ms=self.timeout_ms,
+            browser_channel=browser_channel,
+        ).login(
+            username=username,
+            password=password,
+            headless=headless,
+            manual_wait_seconds=manual_wait_seconds,
+        )
+
+    def _iter_search_once(
+        self,
+        query: str,
+        company_name: str | None,
+    ) -> Iterator[SearchEvent]:
+        query = self._normalize_query(query)
+        self._ensure_saved_session()
+
+        response = self._post_form(SEARCH_PATH, self._search_form_fields(query))
+        root = self._parse_page(response)
+
+        rows, links = self._rows_from_html(root, query)
+        result_count = self._parse_result_count(read_result_count(root))
+        candidates = self._rank_candidates(rows, query)
+        if not candidates:
+            raise self._no_candidates_error(query, result_count)
+
+        page_numbers = self._extra_result_pages(result_count)
+        if page_numbers:
+            candidates, _ = self._merge_result_pages(
+                query, rows, page_numbers, self._fetch_result_pages(query, page_numbers), links
+            )
+        yield SearchEvent(EVENT_CANDIDATES, query, candidates=candidates)
+
+        selected = self._choose_candidate(candidates, company_name)
+        detail_url = self._detail_url(response.url, links.get((selected.name, selected.row_text), ""))
+        if detail_url is None or not detail_url.startswith(BASE_URL):
+            raise SearchError(
+                f"'{selected.name}' 상세 링크를 HTTP로 열 수 없습니다. 브라우저 클라이언트를 사용하세요."
+            )
+        yield SearchEvent(EVENT_SELECTED, query, selected=selected)
+
+        detail = self._request("GET", detail_url, referer=response.url)
+        detail_root = self._parse_page(detail)
+        tables = self._select_relevant_tables(
+            self._build_tables(extract_tables(detail_root), detail.url)
+        )
+        for table in tables:
+            yield SearchEvent(EVENT_TABLE, query, table=table)
+
+        result = SearchResult(
+            query=query,
+            candidates=candidates,
+            selected=selected,
+            performance_tables=tables,
+        )
+        yield SearchEvent(EVENT_RESULT, query, result=result)
+
+    def search_many(
+        self,
+        queries: Iterable[str | tuple[str, str | None]],
+        concurrency: int = 4,
+    ) -> Iterator[BatchOutcome]:
+        """Same contract as ``SminfoClient.search_many``; concurrency is bounded by the pool."""
+        jobs = self._batch_jobs(queries)
+        if not jobs:
+            return
+
+        yield from self._thread_batch(jobs, self.search_company, concurrency)
+
+    def _fetch_result_pages(self, query: str, page_numbers: list[int]) -> list[dict | None]:
+        """POST the remaining result pages concurrently; a failed page is ``None``."""
+
+        def fetch(page_no: int) -> dict | None:
+            try:
+                response = self._post_form(SEARCH_PATH, self._search_form_fields(query, page_no))
+            except SearchError:
+                return None
+            if response.status >= 400:
+                return None
+            return {"url": response.url, "html": response.text()}
+
+        workers = max(1, min(self.result_page_concurrency, len(page_numbers)))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sminfo-result-page")
+        try:
+            futures = [executor.submit(fetch, page_no) for page_no in page_numbers]
+            return [future.result() for future in futures]
+        finally:
+            # 중간에 예외나 중단이 나면 아직 시작하지 않은 페이지 요청은 보내지 않음
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _parse_page(self, response: _HttpResponse) -> Element:
+        if self._is_login_url(response.url):
+            raise self._session_expired_error()
+        if response.status >= 400:
+            raise SearchError(f"요청 실패 (HTTP {response.status}): {response.url}")
+
+        root = parse_html(response.text())
+        if has_login_form(root):
+            raise self._session_expired_error()
+        return root
+
+    def _post_form(self, path: str, fields: dict[str, str]) -> _HttpResponse:
+        charset = self._site_charset
+        response = self._request("POST", path, body=urlencode(fields, encoding=charset))
+
+        # 브라우저는 폼 값을 페이지 인코딩으로 보내므로, 응답에서 알게 된 인코딩으로 다시 요청
+        site_charset = self._remember_site_charset(response.charset)
+        if site_charset != charset and not all(value.isascii() for value in fields.values()):
+            response = self._request("POST", path, body=urlencode(fields, encoding=site_charset))
+        return response
+
+    def check_session(self, path: str = DEFAULT_SESSION_PROBE_PATH) -> bool | None:
+        """One GET of ``path`` with the saved cookies, redirects not followed.
+
+        False when it lands on the login page or shows a login form, True
+        otherwise, None when the answer is unknown (network error or HTTP error).
+        """
+        url = BASE_URL + path
+        try:
+            response = self._send("GET", url, None, None)
+        except NotLoggedInError:
+            return False
+        except SearchError:
+            return None
+
+        location = response.headers.get("Location")
+        if response.status in _REDIRECT_STATUSES and location:
+            return not self._is_login_url(urljoin(url, location))
+        if response.status >= 400:
+            return None
+        if response.body and has_login_form(parse_html(response.text())):
+            return False
+        return True
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        body: str | None = None,
+        referer: str | None = None,
+    ) -> _HttpResponse:
+        url = urljoin(BASE_URL + "/", url)
+        for _ in range(_MAX_REDIRECTS + 1):
+            response = self._send(method, url, body, referer)
+            location = response.headers.get("Location")
+            if response.status not in _REDIRECT_STATUSES or not location:
+                return response
+
+            referer, url = url, urljoin(url, location)
+            if self._is_login_url(url) or not url.startswith(BASE_URL):
+                return _HttpResponse(response.status, url, response.headers, b"")
+            if response.status == 303 or (response.status in (301, 302) and method == "POST"):
+                method, body = "GET", None
+
+        raise SearchError(f"리다이렉트가 너무 많습니다: {url}")
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: str | None,
+        referer: str | None,
+    ) -> _HttpResponse:
+        parsed = urlparse(url)
+        target = parsed.path or "/"
+        if parsed.query:
+            target += "?" + parsed.query
+
+        headers = {
+            "User-Agent": _USER_AGENT,
+            "Accept": "text/html,application/xhtml+xml,*/*;q=0.8",
+            "Accept-Language": "ko-KR,ko;q=0.9",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        }
+        cookie = self._cookies.header(parsed.path or "/", secure=self._pool.secure)
+        if cookie:
+            headers["Cookie"] = cookie
+        if referer:
+            headers["Referer"] = referer
+        payload = None
+        if body is not None:
+            payload = body.encode("ascii")
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+
+        # 서버가 닫은 keep-alive 연결을 재사용한 경우 한 번만 새 연결로 재시도
+        for attempt in range(2):
+            try:
+                with self._pool.connection() as conn:
+                    conn.request(method, target, body=payload, headers=headers)
+                    raw = conn.getresponse()
+                    data = raw.read()
+                    if raw.will_close:
+                        conn.close()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if attempt:
+                    raise SearchError(f"서버 연결이 끊어졌습니다: {url}") from None
+                continue
+            except (OSError, http.client.HTTPException) as exc:
+                raise SearchError(f"요청 실패: {url} ({exc})") from exc
+            break
+
+        self._cookies.update(raw.headers.get_all("Set-Cookie") or [])
+        return _HttpResponse(
+            status=raw.status,
+            url=url,
+            headers=raw.headers,
+            body=self._decode_body(data, raw.headers.get("Content-Encoding")),
+        )
+
+    @staticmethod
+    def _decode_body(data: bytes, encoding: str | None) -> bytes:
+        encoding = (encoding or "").strip().lower()
+        if encoding == "gzip":
+            return gzip.decompress(data)
+        if encoding == "deflate":
+            try:
+                return zlib.decompress(data)
+            except zlib.error:
+                return zlib.decompress(data, -zlib.MAX_WBITS)
+        return data
+
+
+class SessionProbe:
+    """Cheap, cached answer to "is the saved session still logged in?".
+
+    One GET of ``probe_path`` with the saved cookies; a redirect to the login
+    page or a login form in the body means expired. Answers are cached for
+    ``ttl_seconds`` per version of the storage state file, and concurrent
+    callers share one probe when the cache runs out. Network errors are not
+    cached and count as valid so the search itself decides.
+    """
+
+    def __init__(
+        self,
+        state_path: str | Path,
+        ttl_seconds: float = DEFAULT_SESSION_PROBE_TTL,
+        probe_path: str = DEFAULT_SESSION_PROBE_PATH,
+        timeout_ms: int = 5000,
+    ) -> None:
+        self.state_path = Path(state_path)
+        self.ttl_seconds = ttl_seconds
+        self.probe_path = probe_path
+        self._http = SminfoHttpClient(
+            state_path=self.state_path,
+            timeout_ms=timeout_ms,
+            max_connections=1,
+            auto_relogin=False,
+        )
+        self._lock = threading.Lock()
+        self._probe_lock = threading.Lock()
+        self._cached: tuple[float, int, bool] | None = None
+
+    def is_valid(self) -> bool:
+        if self.ttl_seconds <= 0:
+            return True
+
+        state_key = self._state_key()
+        cached = self._fresh(state_key)
+        if cached is not None:
+            return cached
+
+        # 캐시가 만료된 순간 동시에 들어온 호출은 한 번의 확인 결과를 공유
+        with self._probe_lock:
+            cached = self._fresh(state_key)
+            if cached is not None:
+                return cached
+            valid = self._http.check_session(self.probe_path)
+            if valid is None:
+                return True
+            self._remember(state_key, valid)
+            return valid
+
+    def _fresh(self, state_key: int) -> bool | None:
+        with self._lock:
+            cached = self._cached
+        if (
+            cached is not None
+            and cached[1] == state_key
+            and time.monotonic() - cached[0] < self.ttl_seconds
+        ):
+            return cached[2]
+        return None
+
+    def mark_valid(self) -> None:
+        self._remember(self._state_key(), True)
+
+    def mark_expired(self) -> None:
+        self._remember(self._state_key(), False)
+
+    def _remember(self, state_key: int, valid: bool) -> None:
+        with self._lock:
+            self._cached = (time.monotonic(), state_key, valid)
+
+    def _state_key(self) -> int:
+        try:
+            return self.state_path.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+
+_PROBES: dict[str, SessionProbe] = {}
+_PROBES_LOCK = threading.Lock()
+
+
+def get_session_probe(state_path: str | Path) -> SessionProbe:
+    key = str(Path(state_path).resolve())
+    with _PROBES_LOCK:
+        probe = _PROBES.get(key)
+        if probe is None:
+            probe = SessionProbe(state_path)
+            _PROBES[key] = probe
+        return probe
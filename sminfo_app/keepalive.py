@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+from .config import (
+    DEFAULT_BROWSER_CHANNEL,
+    DEFAULT_KEEPALIVE_INTERVAL,
+    DEFAULT_STATE_PATH,
+    DEFAULT_TIMEOUT_MS,
+)
+from .locks import exclusive_lock
+from .sminfo_client import NotLoggedInError, SminfoClient
+
+DEFAULT_INTERVAL_SECONDS = DEFAULT_KEEPALIVE_INTERVAL or 600
+
+
+class SessionKeeper:
+    """Periodically touches the saved session so lookups never find it expired.
+
+    Each tick opens the search page with the saved cookies and re-saves the
+    storage state atomically. If the site shows the login page and
+    ``SMINFO_ID``/``SMINFO_PASSWORD`` are available, the headless login runs
+    right away. The file is only rewritten when the cookies changed. Several
+    processes (gunicorn workers, the daemon) may run a keeper; a lock file
+    next to the storage state lets one of them do each tick, and a tick is
+    skipped when another process already refreshed within the interval.
+    """
+
+    def __init__(
+        self,
+        state_path: str | Path | None = None,
+        interval_seconds: float = DEFAULT_INTERVAL_SECONDS,
+        username: str | None = None,
+        password: str | None = None,
+        timeout_ms: int = DEFAULT_TIMEOUT_MS,
+        browser_channel: str | None = DEFAULT_BROWSER_CHANNEL,
+    ) -> None:
+        self.state_path = Path(state_path) if state_path else DEFAULT_STATE_PATH
+        self.interval_seconds = max(30.0, interval_seconds)
+        self.username = username if username is not None else os.getenv("SMINFO_ID")
+        self.password = password if password is not None else os.getenv("SMINFO_PASSWORD")
+        self.timeout_ms = timeout_ms
+        self.browser_channel = browser_channel
+        self.lock_path = self.state_path.with_name(self.state_path.name + ".keepalive.lock")
+        self.stamp_path = self.state_path.with_name(self.state_path.name + ".keepalive.stamp")
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self, force: bool = False) -> bool:
+        """Refresh the session now; returns False when it is expired and could not be renewed.
+
+        Unless ``force`` is set, the tick is skipped when any process
+        refreshed the session within the last interval.
+        """
+        with exclusive_lock(self.lock_path, blocking=False) as acquired:
+            if not acquired:
+                # 다른 프로세스가 이번 주기를 처리 중
+                return True
+            if not force and self._refreshed_recently():
+                return True
+
+            client = SminfoClient(
+                state_path=self.state_path,
+                timeout_ms=self.timeout_ms,
+                browser_channel=self.browser_channel,
+            )
+            started = time.monotonic()
+            try:
+                # 요청 중 자동 재로그인과 겹치지 않도록 같은 로그인 잠금을 사용
+                with exclusive_lock(client._login_lock_path()):
+                    client.refresh_session(username=self.username, password=self.password)
+            except NotLoggedInError as exc:
+                print(f"세션 유지 실패: {exc}", file=sys.stderr)
+                return False
+            except Exception as exc:
+                print(f"세션 유지 중 오류: {exc}", file=sys.stderr)
+                return False
+
+            self._stamp_refresh()
+            elapsed = time.monotonic() - started
+            print(f"세션 갱신 완료: {self.state_path} ({elapsed:.1f}s)", file=sys.stderr)
+            return True
+
+    def _refreshed_recently(self) -> bool:
+        # 마지막 갱신 시각을 스탬프 파일의 수정 시각으로 프로세스 간 공유
+        try:
+            age = time.time() - self.stamp_path.stat().st_mtime
+        except OSError:
+            return False
+        return age < self.interval_seconds * 0.9
+
+    def _stamp_refresh(self) -> None:
+        try:
+            self.stamp_path.touch()
+        except OSError:
+            pass
+
+    def run_forever(self) -> None:
+        while True:
+            self.run_once()
+            if self._stop.wait(self.interval_seconds):
+                return
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name="sminfo-keepalive", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+def start_keepalive_from_env(
+    state_path: str | Path | None = None,
+    timeout_ms: int = DEFAULT_TIMEOUT_MS,
+) -> SessionKeeper | None:
+    """Start a background keeper when ``SMINFO_KEEPALIVE_INTERVAL`` is set."""
+    if DEFAULT_KEEPALIVE_INTERVAL <= 0:
+        return None
+    keeper = SessionKeeper(
+        state_path=state_path,
+        interval_seconds=DEFAULT_KEEPALIVE_INTERVAL,
+        timeout_ms=timeout_ms,
+    )
+    keeper.start()
+    return keeper
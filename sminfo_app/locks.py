@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import fcntl
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+
+@contextmanager
+def exclusive_lock(path: Path, blocking: bool = True) -> Iterator[bool]:
+    """Cross-process ``flock`` on ``path``; yields False if non-blocking and already held."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as fp:
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(fp, flags)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(fp, fcntl.LOCK_UN)
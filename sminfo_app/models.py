@@ -1,31 +1,91 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, field
+from sys import intern
 
+from .table_values import TypedTable
 
-@dataclass
+# 배치 결과 수만 건을 메모리에 두므로 모델은 __slots__로 만들고,
+# 결과마다 반복되는 짧은 문자열(표 제목, 머리글, 행 이름, frame URL)은 intern해 공유
+
+
+def _intern_label(value: str) -> str:
+    return intern(value) if len(value) <= 64 else value
+
+
+@dataclass(slots=True)
 class Candidate:
     name: str
     row_text: str
     table_title: str
     match_score: int
 
+    def __post_init__(self) -> None:
+        self.table_title = _intern_label(self.table_title)
+
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "name": self.name,
+            "row_text": self.row_text,
+            "table_title": self.table_title,
+            "match_score": self.match_score,
+        }
 
+    @classmethod
+    def from_dict(cls, raw: dict) -> Candidate:
+        return cls(
+            name=str(raw.get("name", "")),
+            row_text=str(raw.get("row_text", "")),
+            table_title=str(raw.get("table_title", "")),
+            match_score=int(raw.get("match_score", 0)),
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class TableData:
     title: str
     headers: list[str]
     rows: list[list[str]]
     frame_url: str
+    _typed: TypedTable | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.title = _intern_label(self.title)
+        self.headers = [_intern_label(header) for header in self.headers]
+        self.frame_url = intern(self.frame_url)
+        for row in self.rows:
+            if row:
+                row[0] = _intern_label(row[0])
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "title": self.title,
+            "headers": list(self.headers),
+            "rows": [list(row) for row in self.rows],
+            "frame_url": self.frame_url,
+        }
+
+    @property
+    def typed(self) -> TypedTable:
+        """Numeric columns by year, parsed on first access (see :class:`TypedTable`)."""
+        if self._typed is None:
+            self._typed = TypedTable.from_table(self.title, self.headers, self.rows)
+        return self._typed
+
+    def as_series(self, metric: str) -> dict[int, float]:
+        return self.typed.as_series(metric)
 
+    @classmethod
+    def from_dict(cls, raw: dict) -> TableData:
+        return cls(
+            title=str(raw.get("title", "")),
+            headers=[str(header) for header in raw.get("headers", [])],
+            rows=[[str(cell) for cell in row] for row in raw.get("rows", [])],
+            frame_url=str(raw.get("frame_url", "")),
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class SearchResult:
     query: str
     candidates: list[Candidate]
@@ -39,3 +99,79 @@ class SearchResult:
             "selected": self.selected.to_dict() if self.selected else None,
             "performance_tables": [t.to_dict() for t in self.performance_tables],
         }
+
+    def as_series(self, metric: str) -> dict[int, float]:
+        """``{year: value in won}`` for ``metric`` across all tables; earlier tables win."""
+        series: dict[int, float] = {}
+        for table in self.performance_tables:
+            for year, value in table.as_series(metric).items():
+                series.setdefault(year, value)
+        return dict(sorted(series.items()))
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> SearchResult:
+        selected = raw.get("selected")
+        return cls(
+            query=str(raw.get("query", "")),
+            candidates=[Candidate.from_dict(c) for c in raw.get("candidates", [])],
+            selected=Candidate.from_dict(selected) if selected else None,
+            performance_tables=[
+                TableData.from_dict(t) for t in raw.get("performance_tables", [])
+            ],
+        )
+
+
+# SearchEvent.kind 값: 단계가 끝날 때마다 이 순서로 나옴 (selected/table은 선택된 회사가 있을 때만)
+EVENT_CANDIDATES = "candidates"
+EVENT_SELECTED = "selected"
+EVENT_TABLE = "table"
+EVENT_RESULT = "result"
+
+
+@dataclass(slots=True)
+class SearchEvent:
+    """One completed stage of a streaming search; the last event carries the whole result."""
+
+    kind: str
+    query: str
+    candidates: list[Candidate] | None = None
+    selected: Candidate | None = None
+    table: TableData | None = None
+    result: SearchResult | None = None
+
+    def to_dict(self) -> dict:
+        payload: dict = {"event": self.kind, "query": self.query}
+        if self.kind == EVENT_CANDIDATES:
+            payload["candidates"] = [c.to_dict() for c in self.candidates or []]
+        elif self.kind == EVENT_SELECTED:
+            payload["selected"] = self.selected.to_dict() if self.selected else None
+        elif self.kind == EVENT_TABLE:
+            payload["table"] = self.table.to_dict() if self.table else None
+        elif self.kind == EVENT_RESULT:
+            payload["result"] = self.result.to_dict() if self.result else None
+        return payload
+
+
+@dataclass(slots=True)
+class BatchOutcome:
+    index: int
+    query: str
+    company_name: str | None
+    result: SearchResult | None = None
+    error_type: str | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.result is not None
+
+    def to_dict(self) -> dict:
+        return {
+            "index": self.index,
+            "query": self.query,
+            "company_name": self.company_name,
+            "ok": self.ok,
+            "result": self.result.to_dict() if self.result else None,
+            "error_type": self.error_type,
+            "error": self.error,
+        }
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import weakref
+from collections import defaultdict
+
+from .resource_policy import content_frames
+
+SEARCH_FORM = "search_form"
+SEARCH_RESULTS = "search_results"
+DETAIL = "detail"
+
+# stale 표시와 함께, 표/행/폼이 새로 붙는지 지켜보는 MutationObserver를 설치
+_MARK_STALE_SCRIPT = """
+() => {
+  window.__sminfoStale = true;
+  window.__sminfoContentChanged = false;
+  if (window.__sminfoObserver) window.__sminfoObserver.disconnect();
+  const touchesContent = (node) =>
+    node.nodeType === 1 && (node.matches("table, tr, form") || !!node.querySelector("table, tr, form"));
+  const observer = new MutationObserver((records) => {
+    if (records.some((record) => Array.from(record.addedNodes).some(touchesContent))) {
+      window.__sminfoContentChanged = true;
+      observer.disconnect();
+    }
+  });
+  observer.observe(document.documentElement, { childList: true, subtree: true });
+  window.__sminfoObserver = observer;
+}
+"""
+
+# 같은 문서의 내용이 실제로 바뀐 경우에만 stale 표시를 지움
+_CLEAR_STALE_SCRIPT = """
+() => {
+  if (!window.__sminfoStale || !window.__sminfoContentChanged) return false;
+  delete window.__sminfoStale;
+  return true;
+}
+"""
+
+# 이 시간이 지나도록 네비게이션 요청이 없고 표/행/폼이 새로 붙었으면 단계가 같은 문서 안에서(AJAX 등) 진행됐다고 봄
+_NAVIGATION_GRACE_MS = 500
+
+# 직전 문서(표시 완료된 이전 페이지)를 stale로 표시해 두고, 새 문서에서 조건이 성립하면 준비 완료로 본다.
+_STAGE_READY_SCRIPT = """
+(stage) => {
+  if (window.__sminfoStale || document.readyState === "loading" || !document.body) return false;
+
+  const hasLoginForm = () =>
+    !!document.querySelector("#id, input[name='id'], #login_id, input[name='login_id']") &&
+    !!document.querySelector("#pwd, input[name='pwd'], #login_password, input[name='login_password']");
+
+  if (stage === "search_form") {
+    return !!(document.forms["search"] || document.querySelector("form[name='search']")) || hasLoginForm();
+  }
+
+  if (stage === "search_results") {
+    if (hasLoginForm()) return true;
+    const hasLinkRow = !!document.querySelector("table tr a");
+    const match = (document.body.innerText || "").match(/검색결과\\s*([0-9,]+)\\s*건/);
+    if (match) return match[1].replace(/,/g, "") === "0" || hasLinkRow;
+    return hasLinkRow;
+  }
+
+  if (stage === "detail") {
+    const tables = Array.from(document.querySelectorAll("table"));
+    if (!tables.length) return false;
+    const relevant = /20\\d{2}|재무|실적|매출|영업|순이익|자산|부채/;
+    if (tables.some((table) => relevant.test(table.innerText || ""))) return true;
+    return document.readyState === "complete";
+  }
+
+  return true;
+}
+"""
+
+
+class ReadinessStats:
+    """Per-stage timings of the readiness engine.
+
+    ``ready_ms`` is how long the DOM predicate took to hold. When auditing is
+    on, the legacy networkidle + fixed-sleep wait is also run afterwards so
+    ``saved_ms`` is measured rather than estimated.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stages: dict[str, dict[str, float]] = defaultdict(
+            lambda: {"count": 0, "ready_ms": 0.0, "fallbacks": 0, "audited": 0, "saved_ms": 0.0}
+        )
+
+    def record(
+        self,
+        stage: str,
+        ready_ms: float,
+        fallback: bool = False,
+        saved_ms: float | None = None,
+    ) -> None:
+        with self._lock:
+            entry = self._stages[stage]
+            entry["count"] += 1
+            entry["ready_ms"] += ready_ms
+            if fallback:
+                entry["fallbacks"] += 1
+            if saved_ms is not None:
+                entry["audited"] += 1
+                entry["saved_ms"] += saved_ms
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            out = {}
+            for stage, entry in self._stages.items():
+                count = entry["count"] or 1
+                audited = entry["audited"] or 1
+                out[stage] = {
+                    **entry,
+                    "avg_ready_ms": round(entry["ready_ms"] / count, 1),
+                    "avg_saved_ms": round(entry["saved_ms"] / audited, 1),
+                }
+            return out
+
+
+_STATS = ReadinessStats()
+
+
+def get_readiness_stats() -> ReadinessStats:
+    return _STATS
+
+
+class _NavigationWatch:
+    """Records whether a navigation request went out since a stage began.
+
+    Stale marks only disappear with a new document, so a step that updates
+    the DOM in place would never look ready. Once the grace period passes
+    without a navigation request, the marks are cleared in frames where
+    tables, rows or forms were added since marking; a page that is merely
+    slow to navigate keeps its marks.
+    """
+
+    def __init__(self, page) -> None:
+        self.page = page
+        self.started = time.monotonic()
+        self.navigated = False
+        page.on("request", self._on_request)
+
+    def _on_request(self, request) -> None:
+        try:
+            if request.is_navigation_request():
+                self.navigated = True
+        except Exception:
+            pass
+
+    def should_clear(self) -> bool:
+        if self.navigated:
+            return False
+        return (time.monotonic() - self.started) * 1000 >= _NAVIGATION_GRACE_MS
+
+    def detach(self) -> None:
+        try:
+            self.page.remove_listener("request", self._on_request)
+        except Exception:
+            pass
+
+
+_WATCHES: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_WATCHES_LOCK = threading.Lock()
+
+
+def _start_watch(page) -> None:
+    watch = _NavigationWatch(page)
+    with _WATCHES_LOCK:
+        previous = _WATCHES.get(page)
+        _WATCHES[page] = watch
+    if previous is not None:
+        previous.detach()
+
+
+def _take_watch(page) -> _NavigationWatch | None:
+    with _WATCHES_LOCK:
+        return _WATCHES.pop(page, None)
+
+
+def mark_stale(page) -> None:
+    _start_watch(page)
+    for frame in content_frames(page):
+        try:
+            frame.evaluate(_MARK_STALE_SCRIPT)
+        except Exception:
+            continue
+
+
+def wait_until_ready(page, stage: str, timeout_ms: int, poll_ms: int = 100) -> bool:
+    watch = _take_watch(page)
+    deadline = time.monotonic() + timeout_ms / 1000
+    try:
+        while True:
+            if watch is not None and watch.should_clear():
+                for frame in content_frames(page):
+                    try:
+                        frame.evaluate(_CLEAR_STALE_SCRIPT)
+                    except Exception:
+                        continue
+            for frame in content_frames(page):
+                try:
+                    if frame.evaluate(_STAGE_READY_SCRIPT, stage):
+                        return True
+                except Exception:
+                    # 네비게이션 중 실행 컨텍스트가 사라진 경우
+                    continue
+            if time.monotonic() >= deadline:
+                return False
+            page.wait_for_timeout(poll_ms)
+    finally:
+        if watch is not None:
+            watch.detach()
+
+
+async def mark_stale_async(page) -> None:
+    async def mark(frame) -> None:
+        try:
+            await frame.evaluate(_MARK_STALE_SCRIPT)
+        except Exception:
+            pass
+
+    _start_watch(page)
+    await asyncio.gather(*(mark(frame) for frame in content_frames(page)))
+
+
+async def wait_until_ready_async(page, stage: str, timeout_ms: int, poll_ms: int = 100) -> bool:
+    async def check(frame) -> bool:
+        try:
+            return bool(await frame.evaluate(_STAGE_READY_SCRIPT, stage))
+        except Exception:
+            return False
+
+    async def clear(frame) -> None:
+        try:
+            await frame.evaluate(_CLEAR_STALE_SCRIPT)
+        except Exception:
+            pass
+
+    watch = _take_watch(page)
+    deadline = time.monotonic() + timeout_ms / 1000
+    try:
+        while True:
+            if watch is not None and watch.should_clear():
+                await asyncio.gather(*(clear(frame) for frame in content_frames(page)))
+            results = await asyncio.gather(*(check(frame) for frame in content_frames(page)))
+            if any(results):
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            await page.wait_for_timeout(poll_ms)
+    finally:
+        if watch is not None:
+            watch.detach()
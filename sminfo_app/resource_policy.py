@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import fnmatch
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+from .config import (
+    BASE_URL,
+    DEFAULT_ALLOW_URL_PATTERNS,
+    DEFAULT_BLOCK_RESOURCES,
+    DEFAULT_BLOCK_THIRD_PARTY_SCRIPTS,
+    DEFAULT_DENY_URL_PATTERNS,
+    DEFAULT_SKIP_FRAME_PATTERNS,
+)
+
+
+def _split_setting(value: str) -> tuple[str, ...]:
+    return tuple(part.strip() for part in value.split(",") if part.strip())
+
+
+def _compile_globs(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+
+
+class ResourceStats:
+    """Thread-safe per-resource-type counters of intercepted requests."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._blocked: Counter[str] = Counter()
+        self._allowed: Counter[str] = Counter()
+
+    def record(self, resource_type: str, blocked: bool) -> None:
+        with self._lock:
+            if blocked:
+                self._blocked[resource_type] += 1
+            else:
+                self._allowed[resource_type] += 1
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {
+                "blocked": dict(self._blocked),
+                "allowed": dict(self._allowed),
+            }
+
+
+@dataclass
+class ResourcePolicy:
+    """Which subresources search contexts may load.
+
+    Pages are only read through table/link text, so images, fonts, media and
+    (optionally) stylesheets and third-party scripts can be aborted before they
+    hit the network. ``allow_patterns`` win over everything else; URL patterns
+    are shell-style globs matched against the full request URL.
+    """
+
+    block_resources: frozenset[str] = frozenset()
+    allow_patterns: tuple[str, ...] = ()
+    deny_patterns: tuple[str, ...] = ()
+    block_third_party_scripts: bool = False
+    first_party_host: str = field(default_factory=lambda: urlparse(BASE_URL).hostname or "")
+    stats: ResourceStats = field(default_factory=ResourceStats, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.block_resources = frozenset(t.lower() for t in self.block_resources)
+        self._allow_re = _compile_globs(tuple(self.allow_patterns))
+        self._deny_re = _compile_globs(tuple(self.deny_patterns))
+
+    @classmethod
+    def from_env(cls) -> ResourcePolicy:
+        return cls(
+            block_resources=frozenset(_split_setting(DEFAULT_BLOCK_RESOURCES)),
+            allow_patterns=_split_setting(DEFAULT_ALLOW_URL_PATTERNS),
+            deny_patterns=_split_setting(DEFAULT_DENY_URL_PATTERNS),
+            block_third_party_scripts=DEFAULT_BLOCK_THIRD_PARTY_SCRIPTS,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(
+            self.block_resources
+            or self._deny_re is not None
+            or self.block_third_party_scripts
+        )
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        if self._allow_re is not None and self._allow_re.match(url):
+            return False
+        if self._deny_re is not None and self._deny_re.match(url):
+            return True
+        # 문서 요청(검색/상세 페이지와 frame)은 유형만으로 막지 않음
+        if resource_type == "document":
+            return False
+        if resource_type in self.block_resources:
+            return True
+        if self.block_third_party_scripts and resource_type == "script":
+            return not self._is_first_party(url)
+        return False
+
+    def install(self, context) -> None:
+        if self.enabled:
+            context.route("**/*", self._handle_route)
+
+    async def install_async(self, context) -> None:
+        if self.enabled:
+            await context.route("**/*", self._handle_route_async)
+
+    def _handle_route(self, route) -> None:
+        if self._decide(route.request):
+            route.abort("blockedbyclient")
+        else:
+            route.fallback()
+
+    async def _handle_route_async(self, route) -> None:
+        if self._decide(route.request):
+            await route.abort("blockedbyclient")
+        else:
+            await route.fallback()
+
+    def _decide(self, request) -> bool:
+        resource_type = request.resource_type
+        blocked = self.should_block(request.url, resource_type)
+        self.stats.record(resource_type, blocked)
+        return blocked
+
+    def _is_first_party(self, url: str) -> bool:
+        host = urlparse(url).hostname or ""
+        first_party = self.first_party_host
+        return not first_party or host == first_party or host.endswith("." + first_party)
+
+
+_SKIP_FRAME_RE = _compile_globs(_split_setting(DEFAULT_SKIP_FRAME_PATTERNS))
+# about:srcdoc 프레임은 부모 문서가 채운 실제 내용이므로 about:blank만 정확히 제외
+_PLACEHOLDER_FRAME_URLS = frozenset({"about:blank"})
+_PLACEHOLDER_FRAME_PREFIXES = ("data:", "javascript:", "chrome-error:")
+
+
+def is_content_frame_url(url: str) -> bool:
+    """Whether a subframe at ``url`` can hold site content worth evaluating."""
+    if not url or url in _PLACEHOLDER_FRAME_URLS or url.startswith(_PLACEHOLDER_FRAME_PREFIXES):
+        return False
+    return _SKIP_FRAME_RE is None or not _SKIP_FRAME_RE.match(url)
+
+
+def content_frames(page) -> list:
+    """The main frame plus subframes that are not blank placeholders or ad/tracking frames.
+
+    Works for sync and async pages alike; filtering happens on the frame URL
+    only, so skipped frames cost no evaluate round trip.
+    """
+    return [
+        frame
+        for frame in page.frames
+        if frame.parent_frame is None or is_content_frame_url(frame.url or "")
+    ]
+
+
+_DEFAULT_POLICY: ResourcePolicy | None = None
+_DEFAULT_POLICY_LOCK = threading.Lock()
+
+
+def get_default_resource_policy() -> ResourcePolicy:
+    global _DEFAULT_POLICY
+    with _DEFAULT_POLICY_LOCK:
+        if _DEFAULT_POLICY is None:
+            _DEFAULT_POLICY = ResourcePolicy.from_env()
+        return _DEFAULT_POLICY
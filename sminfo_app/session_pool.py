@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, TypeVar
+
+from .config import DEFAULT_SESSION_POOL_PATH
+from .models import BatchOutcome, SearchEvent, SearchResult
+from .sminfo_client import NotLoggedInError, SearchError, SminfoClientBase
+
+T = TypeVar("T")
+
+_BUDGET_WINDOW_SECONDS = 60.0
+
+
+@dataclass
+class SessionSlot:
+    """One sminfo account: its saved session files and request limits."""
+
+    name: str
+    state_path: Path
+    meta_path: Path
+    budget_per_minute: int = 30
+    cooldown_seconds: float = 0.0
+
+    in_flight: int = field(default=0, repr=False)
+    started: deque = field(default_factory=deque, repr=False)
+    dead_state_key: int | None = field(default=None, repr=False)
+
+    def state_key(self) -> int:
+        try:
+            return self.state_path.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    @property
+    def dead(self) -> bool:
+        # 로그인 페이지를 만난 세션은 세션 파일이 다시 저장될 때(재로그인)까지 제외
+        if self.dead_state_key is None:
+            return False
+        if self.dead_state_key != self.state_key():
+            self.dead_state_key = None
+            return False
+        return True
+
+    def wait_seconds(self, now: float) -> float:
+        """How long until this slot may start another request (0 = now)."""
+        while self.started and now - self.started[0] >= _BUDGET_WINDOW_SECONDS:
+            self.started.popleft()
+
+        wait = 0.0
+        if self.started and self.cooldown_seconds > 0:
+            wait = max(wait, self.started[-1] + self.cooldown_seconds - now)
+        if len(self.started) >= max(1, self.budget_per_minute):
+            wait = max(wait, self.started[0] + _BUDGET_WINDOW_SECONDS - now)
+        return wait
+
+
+class SessionPool:
+    """Spreads lookups over several accounts.
+
+    Each search takes the least-loaded live session that still has budget
+    (fewest in-flight requests, then fewest requests in the last minute) and
+    waits when every live session is rate limited. A session is marked dead
+    when its search hits the login page and comes back once its storage
+    state file is rewritten by a new login.
+    """
+
+    def __init__(self, slots: Iterable[SessionSlot], acquire_timeout: float = 60.0) -> None:
+        self.slots = list(slots)
+        if not self.slots:
+            raise ValueError("세션 풀에 세션이 없습니다.")
+        self.acquire_timeout = acquire_timeout
+        self.config_path: Path | None = None
+        self._cond = threading.Condition()
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> SessionPool:
+        """Load ``[{"name", "state_path", "meta_path", "budget_per_minute", "cooldown_seconds"}, ...]``.
+
+        Relative paths are resolved against the config file's directory.
+        """
+        path = Path(path)
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            raise ValueError(f"세션 풀 설정을 읽지 못했습니다: {path} ({exc})") from exc
+
+        if not isinstance(raw, list):
+            raise ValueError(f"세션 풀 설정은 세션 객체의 JSON 배열이어야 합니다: {path}")
+
+        base_dir = path.parent
+        slots = []
+        for idx, item in enumerate(raw):
+            where = f"{path} {idx + 1}번째 세션"
+            if not isinstance(item, dict):
+                raise ValueError(f"세션 풀 설정 항목이 객체가 아닙니다: {where}")
+            if not isinstance(item.get("state_path"), str) or not item["state_path"]:
+                raise ValueError(f"세션 풀 설정에 state_path 문자열이 없습니다: {where}")
+            if item.get("meta_path") is not None and not isinstance(item["meta_path"], str):
+                raise ValueError(f"세션 풀 설정의 meta_path가 문자열이 아닙니다: {where}")
+
+            state_path = base_dir / item["state_path"]
+            meta_path = (
+                base_dir / item["meta_path"]
+                if item.get("meta_path")
+                else state_path.with_name("session_meta.json")
+            )
+            try:
+                budget_per_minute = int(item.get("budget_per_minute", 30))
+                cooldown_seconds = float(item.get("cooldown_seconds", 0.0))
+            except (TypeError, ValueError) as exc:
+                raise ValueError(f"세션 풀 설정의 숫자 값이 올바르지 않습니다: {where} ({exc})") from exc
+            slots.append(
+                SessionSlot(
+                    name=str(item.get("name") or f"session-{idx + 1}"),
+                    state_path=state_path,
+                    meta_path=meta_path,
+                    budget_per_minute=budget_per_minute,
+                    cooldown_seconds=cooldown_seconds,
+                )
+            )
+        pool = cls(slots)
+        pool.config_path = path
+        return pool
+
+    def healthy_slots(self) -> list[SessionSlot]:
+        with self._cond:
+            return [slot for slot in self.slots if slot.state_path.exists() and not slot.dead]
+
+    @contextmanager
+    def acquire(self, exclude: set[str] | None = None) -> Iterator[SessionSlot]:
+        exclude = exclude or set()
+        deadline = time.monotonic() + self.acquire_timeout
+
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                live = [
+                    slot
+                    for slot in self.slots
+                    if slot.name not in exclude and slot.state_path.exists() and not slot.dead
+                ]
+                if not live:
+                    raise NotLoggedInError(
+                        "사용 가능한 로그인 세션이 없습니다. 세션 풀의 계정으로 다시 로그인하세요."
+                    )
+
+                ready = [slot for slot in live if slot.wait_seconds(now) <= 0]
+                if ready:
+                    slot = min(ready, key=lambda s: (s.in_flight, len(s.started)))
+                    slot.in_flight += 1
+                    slot.started.append(now)
+                    break
+
+                wait = min(slot.wait_seconds(now) for slot in live)
+                if now + wait > deadline:
+                    raise SearchError("모든 세션이 요청 한도에 도달했습니다. 잠시 후 다시 시도하세요.")
+                self._cond.wait(timeout=wait)
+
+        try:
+            yield slot
+        finally:
+            with self._cond:
+                slot.in_flight -= 1
+                self._cond.notify_all()
+
+    def mark_dead(self, slot: SessionSlot) -> None:
+        with self._cond:
+            slot.dead_state_key = slot.state_key()
+            self._cond.notify_all()
+
+    def run(self, fn: Callable[[SessionSlot], T]) -> T:
+        """Call ``fn`` with a session, moving on to the next one when it turns out expired."""
+        tried: set[str] = set()
+        while True:
+            with self.acquire(exclude=tried) as slot:
+                try:
+                    return fn(slot)
+                except NotLoggedInError:
+                    self.mark_dead(slot)
+                    tried.add(slot.name)
+
+
+class SessionPoolClient:
+    """``search_company``/``search_many`` facade over a :class:`SessionPool`.
+
+    ``make_client`` builds the per-session client (browser, HTTP, ...) from
+    a slot, so pooling and session selection stay independent of how the
+    lookup itself is done.
+    """
+
+    def __init__(
+        self,
+        pool: SessionPool,
+        make_client: Callable[[SessionSlot], SminfoClientBase],
+    ) -> None:
+        self.pool = pool
+        self.make_client = make_client
+        self.state_path = pool.config_path or pool.slots[0].state_path
+
+    def has_saved_session(self) -> bool:
+        return bool(self.pool.healthy_slots())
+
+    def get_login_status_text(self) -> str:
+        healthy = len(self.pool.healthy_slots())
+        total = len(self.pool.slots)
+        if not healthy:
+            return "로그인 세션 없음"
+        return f"로그인 세션 {healthy}/{total}개 사용 중"
+
+    def search_company(self, query: str, company_name: str | None = None) -> SearchResult:
+        return self.pool.run(
+            lambda slot: self.make_client(slot).search_company(query, company_name)
+        )
+
+    def iter_search(
+        self,
+        query: str,
+        company_name: str | None = None,
+    ) -> Iterator[SearchEvent]:
+        """Stream a search on one pooled session.
+
+        Like :meth:`SessionPool.run`, an expired session is skipped for the
+        next one, but only until the first event has been yielded.
+        """
+        tried: set[str] = set()
+        while True:
+            emitted = False
+            with self.pool.acquire(exclude=tried) as slot:
+                try:
+                    for event in self.make_client(slot).iter_search(query, company_name):
+                        emitted = True
+                        yield event
+                    return
+                except NotLoggedInError:
+                    self.pool.mark_dead(slot)
+                    if emitted:
+                        raise
+                    tried.add(slot.name)
+
+    def search_many(
+        self,
+        queries: Iterable[str | tuple[str, str | None]],
+        concurrency: int = 4,
+    ) -> Iterator[BatchOutcome]:
+        jobs = SminfoClientBase._batch_jobs(queries)
+        if not jobs:
+            return
+
+        yield from SminfoClientBase._thread_batch(jobs, self.search_company, concurrency)
+
+
+def load_session_pool() -> SessionPool | None:
+    if not DEFAULT_SESSION_POOL_PATH:
+        return None
+    return SessionPool.from_file(DEFAULT_SESSION_POOL_PATH)
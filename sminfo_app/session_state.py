@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+
+_FileKey = tuple[int, int, int]
+
+
+class JsonFileCache:
+    """Parsed JSON files shared by the whole process.
+
+    A file is parsed once and parsed again only after its inode, mtime or
+    size changes (atomic rewrites replace the inode), so a status check or a
+    new browser context costs a ``stat`` instead of a read and a parse.
+    Returned dicts are shared between callers and must not be modified.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[Path, tuple[_FileKey, dict | None]] = {}
+
+    @staticmethod
+    def file_key(path: Path) -> _FileKey | None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def load(self, path: str | Path) -> dict | None:
+        """Return the parsed object, or None if the file is missing, unreadable or not an object."""
+        path = Path(path)
+        key = self.file_key(path)
+        if key is None:
+            with self._lock:
+                self._entries.pop(path, None)
+            return None
+
+        with self._lock:
+            cached = self._entries.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            raw = None
+        data = raw if isinstance(raw, dict) else None
+
+        with self._lock:
+            self._entries[path] = (key, data)
+        return data
+
+
+_cache = JsonFileCache()
+
+
+def load_json_file(path: str | Path) -> dict | None:
+    return _cache.load(path)
+
+
+def storage_state_arg(path: str | Path) -> dict | str:
+    """``storage_state`` argument for ``new_context``: the cached dict, else the path.
+
+    Falling back to the path keeps Playwright's own error for a missing or
+    broken file.
+    """
+    return _cache.load(path) or str(path)
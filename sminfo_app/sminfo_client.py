@@ -1,38 +1,93 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
-import re
+import queue
+import sys
+import threading
 import time
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Callable, Iterable, Iterator
+from urllib.parse import quote, urlencode, urljoin, urlparse
 
 from playwright.sync_api import Error as PlaywrightError
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-from playwright.sync_api import Browser, Locator, Page, Playwright, sync_playwright
+from playwright.sync_api import (
+    APIRequestContext,
+    APIResponse,
+    Browser,
+    Locator,
+    Page,
+    Playwright,
+    sync_playwright,
+)
 
+from .browser_pool import BrowserPool, ContextPool, launch_browser
 from .config import (
     BASE_URL,
+    DEFAULT_AUTO_RELOGIN,
     DEFAULT_BROWSER_CHANNEL,
+    DEFAULT_HTTP_FAST_PATH,
+    DEFAULT_IN_PAGE_TABLE_SCORING,
     DEFAULT_META_PATH,
+    DEFAULT_READINESS,
+    DEFAULT_READINESS_AUDIT,
+    DEFAULT_READY_TIMEOUT_MS,
+    DEFAULT_RESULT_MAX_PAGES,
+    DEFAULT_RESULT_PAGE_CONCURRENCY,
+    DEFAULT_RESULT_PAGE_SIZE,
+    DEFAULT_SINGLE_NAVIGATION,
     DEFAULT_STATE_PATH,
+    DEFAULT_TABLE_LIMIT,
     DEFAULT_TIMEOUT_MS,
     SEARCH_MENU_ID,
     SEARCH_PATH,
 )
-from .models import Candidate, SearchResult, TableData
-
-_FINANCIAL_KEYWORDS = (
-    "재무",
-    "실적",
-    "매출",
-    "영업",
-    "순이익",
-    "당기",
-    "자산",
-    "부채",
-    "회계",
-    "연도",
+from .html_extract import (
+    Element,
+    decode_html,
+    detect_charset,
+    extract_candidates,
+    extract_link_candidates,
+    has_login_form,
+    normalize_charset,
+    parse_html,
+    read_result_count,
+)
+from .locks import exclusive_lock
+from .models import (
+    EVENT_CANDIDATES,
+    EVENT_RESULT,
+    EVENT_SELECTED,
+    EVENT_TABLE,
+    BatchOutcome,
+    Candidate,
+    SearchEvent,
+    SearchResult,
+    TableData,
 )
+from .readiness import (
+    DETAIL,
+    SEARCH_FORM,
+    SEARCH_RESULTS,
+    get_readiness_stats,
+    mark_stale,
+    wait_until_ready,
+)
+from .resource_policy import ResourcePolicy, content_frames, get_default_resource_policy
+from .session_state import load_json_file, storage_state_arg
+from .table_score import RELEVANT_SCORE, get_table_scorer
+from .textnorm import normalize_cells, normalize_rows, normalize_text
+
+# 관련 표가 없을 때 대신 돌려주는 앞쪽 표 개수
+_FALLBACK_TABLE_COUNT = 3
+# 결과 한 페이지 분량의 후보 상한 (여러 페이지를 받으면 페이지 수만큼 늘어남)
+_CANDIDATE_LIMIT = 50
 
 _QUERY_INPUT_SELECTORS = (
     "input[name='cmQuery']",
@@ -70,6 +125,17 @@ _LOGIN_BUTTON_SELECTORS = (
     ".login_btn",
 )
 
+_LOGIN_FORM_SCRIPT = """
+({ idSelectors, pwSelectors }) => {
+  const visible = (selectors) => selectors.some((selector) =>
+    Array.from(document.querySelectorAll(selector)).some(
+      (el) => el.getClientRects().length > 0 && getComputedStyle(el).visibility !== "hidden"
+    )
+  );
+  return visible(idSelectors) && visible(pwSelectors);
+}
+"""
+
 _CANDIDATE_TABLE_EXTRACT_SCRIPT = """
 (keyword) => {
   const normalize = (s) => (s || "").replace(/\\s+/g, " ").trim();
@@ -237,6 +303,29 @@ _TABLE_EXTRACT_SCRIPT = """
 }
 """
 
+# _TABLE_EXTRACT_SCRIPT 결과를 페이지 안에서 TableFeatures.score와 같은 규칙으로 채점해 상위 표만 반환
+_RANKED_TABLE_EXTRACT_SCRIPT = (
+    "({ keywords, limit }) => {\n"
+    "  const tables = (" + _TABLE_EXTRACT_SCRIPT.strip() + ")();\n"
+    """  const score = (table) => {
+    const blob = [table.title, ...table.headers, ...table.rows.slice(0, 20).flat()].join(" ");
+    let total = 0;
+    if (/20\\d{2}/.test(blob)) total += 3;
+    keywords.forEach((keyword) => {
+      if (blob.includes(keyword)) total += 2;
+    });
+    if (table.headers.length >= 2) total += 1;
+    if (table.rows.length >= 2) total += 1;
+    return total;
+  };
+  return tables
+    .map((table) => ({ ...table, score: score(table) }))
+    .sort((a, b) => b.score - a.score)
+    .slice(0, limit);
+}
+"""
+)
+
 _JS_CLICK_LINK_SCRIPT = """
 (targetName) => {
   const normalize = (s) => (s || "").replace(/\\s+/g, " ").trim();
@@ -262,6 +351,117 @@ _JS_CLICK_LINK_SCRIPT = """
 """
 
 
+_OPEN_SEARCH_PAGE_SCRIPT = """
+({ baseUrl, path, menuId, keyword }) => {
+  const form = document.createElement("form");
+  form.method = "POST";
+  form.action = `${baseUrl}${path}`;
+
+  const add = (name, value) => {
+    const input = document.createElement("input");
+    input.type = "hidden";
+    input.name = name;
+    input.value = value;
+    form.appendChild(input);
+  };
+
+  add("cmMenuId", menuId);
+  add("cmQuery", keyword);
+  add("mode", "fast");
+
+  document.body.appendChild(form);
+  form.submit();
+}
+"""
+
+_RESULT_COUNT_SCRIPT = """
+() => {
+  const text = (document.body && document.body.innerText) || "";
+  const match = text.match(/검색결과\\s*([0-9,]+)\\s*건/);
+  return match ? match[1] : null;
+}
+"""
+
+_USERNAME_EXTRACT_SCRIPT = """
+() => {
+  const normalize = (s) => (s || "").replace(/\\s+/g, " ").trim();
+  const blocked = new Set(["로그인", "로그아웃", "회원가입", "나의정보"]);
+  const out = [];
+
+  const push = (value) => {
+    const v = normalize(value);
+    if (!v) return;
+    if (v.length < 2 || v.length > 60) return;
+    if (blocked.has(v)) return;
+    out.push(v);
+  };
+
+  document.querySelectorAll("input[name='cmId'], input[name='id']").forEach((input) => {
+    push(input.value || input.getAttribute("value") || "");
+  });
+
+  const profileNode = document.querySelector(".user, .my_info, .member, .login_info");
+  if (profileNode) push(profileNode.textContent || "");
+
+  const anchors = Array.from(document.querySelectorAll("a"));
+  anchors.forEach((a) => {
+    const t = normalize(a.innerText || a.textContent || "");
+    if (t.endsWith("님")) push(t.replace(/님$/, ""));
+  });
+
+  const unique = Array.from(new Set(out));
+  return unique.length ? unique[0] : null;
+}
+"""
+
+# 결과 페이지에서 필요한 값을 프레임당 한 번의 evaluate로 수집 (위 스크립트들을 그대로 조합)
+_PAGE_SNAPSHOT_SCRIPT = (
+    "({ keyword, idSelectors, pwSelectors }) => {\n"
+    "  const tableCandidates = (" + _CANDIDATE_TABLE_EXTRACT_SCRIPT.strip() + ")(keyword);\n"
+    "  return {\n"
+    "    table_candidates: tableCandidates,\n"
+    "    link_candidates: tableCandidates.length ? [] : ("
+    + _GENERIC_LINK_CANDIDATE_SCRIPT.strip()
+    + ")(keyword),\n"
+    "    result_count: (" + _RESULT_COUNT_SCRIPT.strip() + ")(),\n"
+    "    login_form: (" + _LOGIN_FORM_SCRIPT.strip() + ")({ idSelectors, pwSelectors }),\n"
+    "    username: (" + _USERNAME_EXTRACT_SCRIPT.strip() + ")(),\n"
+    "  };\n"
+    "}\n"
+)
+
+
+# 검색 결과 2페이지 이후를 페이지 안에서 fetch로 동시에 받아옴 (세션 쿠키 공유, 문서 인코딩으로 디코딩)
+_FETCH_RESULT_PAGES_SCRIPT = """
+async ({ url, bodies, concurrency }) => {
+  const out = new Array(bodies.length).fill(null);
+  const decoder = new TextDecoder(document.characterSet || "utf-8");
+  let next = 0;
+
+  const worker = async () => {
+    while (next < bodies.length) {
+      const i = next++;
+      try {
+        const res = await fetch(url, {
+          method: "POST",
+          credentials: "same-origin",
+          headers: { "Content-Type": "application/x-www-form-urlencoded" },
+          body: bodies[i],
+        });
+        if (!res.ok) continue;
+        out[i] = { url: res.url, html: decoder.decode(await res.arrayBuffer()) };
+      } catch (e) {
+        out[i] = null;
+      }
+    }
+  };
+
+  await Promise.all(Array.from({ length: Math.max(1, Math.min(concurrency, bodies.length)) }, worker));
+  return out;
+}
+"""
+
+
 class NotLoggedInError(RuntimeError):
     """Raised when the session is missing or expired."""
 
@@ -270,7 +470,23 @@ class SearchError(RuntimeError):
     """Raised when search page interaction fails."""
 
 
-class SminfoClient:
+@dataclass
+class _PageSnapshot:
+    """Everything a search step reads from the current page, from one pass over its frames."""
+
+    candidates: list[Candidate] = field(default_factory=list)
+    rows: dict[tuple[str, str], Candidate] = field(default_factory=dict)
+    result_count: int | None = None
+    login_form: bool = False
+    username: str | None = None
+
+
+class SminfoClientBase(ABC):
+    """Session bookkeeping and page-independent parsing shared by all clients."""
+
+    # 직접 만든 폼 요청을 브라우저처럼 사이트 문서 인코딩으로 보내기 위해 응답에서 갱신
+    _site_charset = "utf-8"
+
     def __init__(
         self,
         state_path: str | Path | None = None,
@@ -278,24 +494,38 @@ class SminfoClient:
         headless: bool = True,
         timeout_ms: int = DEFAULT_TIMEOUT_MS,
         browser_channel: str | None = DEFAULT_BROWSER_CHANNEL,
+        resource_policy: ResourcePolicy | None = None,
+        readiness: bool = DEFAULT_READINESS,
+        single_navigation: bool = DEFAULT_SINGLE_NAVIGATION,
+        auto_relogin: bool = DEFAULT_AUTO_RELOGIN,
     ) -> None:
         self.state_path = Path(state_path) if state_path else DEFAULT_STATE_PATH
         self.meta_path = Path(meta_path) if meta_path else DEFAULT_META_PATH
         self.headless = headless
         self.timeout_ms = timeout_ms
         self.browser_channel = (browser_channel or "").strip()
+        self.resource_policy = (
+            resource_policy if resource_policy is not None else get_default_resource_policy()
+        )
+        self.readiness = readiness
+        self.ready_timeout_ms = min(DEFAULT_READY_TIMEOUT_MS, timeout_ms)
+        self.readiness_audit = DEFAULT_READINESS_AUDIT
+        self.readiness_stats = get_readiness_stats()
+        self.single_navigation = single_navigation
+        self.table_limit = max(1, DEFAULT_TABLE_LIMIT)
+        self.in_page_table_scoring = DEFAULT_IN_PAGE_TABLE_SCORING
+        self.table_scorer = get_table_scorer()
+        self.auto_relogin = auto_relogin
+        self.result_max_pages = max(1, DEFAULT_RESULT_MAX_PAGES)
+        self.result_page_concurrency = max(1, DEFAULT_RESULT_PAGE_CONCURRENCY)
+        self.result_page_size = max(1, DEFAULT_RESULT_PAGE_SIZE)
 
     def has_saved_session(self) -> bool:
-        return self.state_path.exists()
+        return load_json_file(self.state_path) is not None
 
     def get_saved_username(self) -> str | None:
-        if not self.meta_path.exists():
-            env_name = self._normalize_space(os.getenv("SMINFO_ID", ""))
-            return env_name or None
-
-        try:
-            raw = json.loads(self.meta_path.read_text(encoding="utf-8"))
-        except Exception:
+        raw = load_json_file(self.meta_path)
+        if raw is None:
             env_name = self._normalize_space(os.getenv("SMINFO_ID", ""))
             return env_name or None
 
@@ -314,6 +544,602 @@ class SminfoClient:
             return "로그인 세션 사용 중"
         return "로그인 세션 없음"
 
+    def _normalize_query(self, query: str) -> str:
+        query = self._normalize_space(query)
+        if not query:
+            raise ValueError("검색어를 입력하세요.")
+        return query
+
+    def _ensure_saved_session(self) -> None:
+        if not self.has_saved_session():
+            raise NotLoggedInError(
+                f"저장된 로그인 세션이 없습니다: {self.state_path}"
+            )
+
+    def _check_session(self) -> None:
+        """Fail fast on a known-expired session before any page is opened."""
+        self._ensure_saved_session()
+        if not self._session_probe().is_valid():
+            raise NotLoggedInError(
+                "로그인 세션이 만료되었습니다. login 명령으로 다시 로그인하세요."
+            )
+
+    def _state_key(self) -> int:
+        try:
+            return self.state_path.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    def _login_lock_path(self) -> Path:
+        return self.state_path.with_name(self.state_path.name + ".login.lock")
+
+    def _relogin_once(self, failed_state_key: int) -> bool:
+        """Renew an expired session once across all processes sharing it.
+
+        The first caller takes the login lock next to the storage state and
+        logs in headlessly; callers queued behind it find the file already
+        rewritten and only retry. Returns False when auto re-login is off or
+        no credentials are configured.
+        """
+        username = os.getenv("SMINFO_ID")
+        password = os.getenv("SMINFO_PASSWORD")
+        if not (self.auto_relogin and username and password):
+            return False
+
+        with exclusive_lock(self._login_lock_path()):
+            if self._state_key() != failed_state_key:
+                return True
+            try:
+                self._refresh_on_own_thread(username, password)
+            except Exception as exc:
+                print(f"자동 재로그인 실패: {exc}", file=sys.stderr)
+                return False
+        return True
+
+    def _refresh_on_own_thread(self, username: str, password: str) -> None:
+        """Run the headless re-login on a fresh thread and wait for it.
+
+        The calling thread may already drive a sync Playwright driver (a
+        pooled browser in a web worker or daemon thread), and a second
+        ``sync_playwright()`` cannot start there.
+        """
+        errors: list[BaseException] = []
+
+        def run() -> None:
+            try:
+                SminfoClient(
+                    state_path=self.state_path,
+                    meta_path=self.meta_path,
+                    timeout_ms=self.timeout_ms,
+                    browser_channel=self.browser_channel,
+                ).refresh_session(username=username, password=password)
+            except BaseException as exc:
+                errors.append(exc)
+
+        thread = threading.Thread(target=run, name="sminfo-relogin", daemon=True)
+        thread.start()
+        thread.join()
+        if errors:
+            raise errors[0]
+
+    def iter_search(
+        self,
+        query: str,
+        company_name: str | None = None,
+    ) -> Iterator[SearchEvent]:
+        """Search like ``search_company`` but yield each stage as soon as it completes.
+
+        Events come in order: ``candidates``, then ``selected`` and one
+        ``table`` per performance table when a company was chosen, and a
+        final ``result`` with the full :class:`SearchResult`. An expired
+        session is renewed and retried (see ``auto_relogin``) only while
+        nothing has been yielded yet.
+        """
+        state_key = self._state_key()
+        emitted = False
+        try:
+            for event in self._iter_search_once(query, company_name):
+                emitted = True
+                yield event
+            return
+        except NotLoggedInError:
+            if emitted or not self._relogin_once(state_key):
+                raise
+        yield from self._iter_search_once(query, company_name)
+
+    def search_company(
+        self,
+        query: str,
+        company_name: str | None = None,
+    ) -> SearchResult:
+        return self._final_result(self.iter_search(query, company_name))
+
+    @abstractmethod
+    def _iter_search_once(self, query: str, company_name: str | None) -> Iterator[SearchEvent]:
+        """One search attempt as a stream of events; ``iter_search`` adds the re-login retry."""
+
+    @staticmethod
+    def _final_result(events: Iterable[SearchEvent]) -> SearchResult:
+        for event in events:
+            if event.kind == EVENT_RESULT and event.result is not None:
+                return event.result
+        raise SearchError("검색 결과를 받지 못했습니다.")
+
+    @staticmethod
+    def _result_events(result: SearchResult) -> Iterator[SearchEvent]:
+        """Events for a result that was produced in one piece (daemon, HTTP fast path)."""
+        yield SearchEvent(EVENT_CANDIDATES, result.query, candidates=result.candidates)
+        if result.selected is not None:
+            yield SearchEvent(EVENT_SELECTED, result.query, selected=result.selected)
+            for table in result.performance_tables:
+                yield SearchEvent(EVENT_TABLE, result.query, table=table)
+        yield SearchEvent(EVENT_RESULT, result.query, result=result)
+
+    def _session_probe(self):
+        from .http_client import get_session_probe
+
+        return get_session_probe(self.state_path)
+
+    @staticmethod
+    def _is_login_url(url: str | None) -> bool:
+        url = url or ""
+        return "CMM004R0" in url or "CMM004R1" in url
+
+    @staticmethod
+    def _thread_batch(
+        jobs: list[tuple[int, str, str | None]],
+        search: Callable[[str, str | None], SearchResult],
+        concurrency: int,
+    ) -> Iterator[BatchOutcome]:
+        """Run ``search`` per job on up to ``concurrency`` threads, yielding outcomes as they complete.
+
+        Only ``concurrency`` jobs are submitted at a time, and closing the
+        generator early (consumer ``break``, Ctrl-C) cancels the jobs not yet
+        started instead of waiting for the whole batch.
+        """
+        workers = max(1, concurrency)
+        pending = iter(jobs)
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures: dict[Future, tuple[int, str, str | None]] = {}
+
+        def submit_next() -> None:
+            job = next(pending, None)
+            if job is not None:
+                futures[executor.submit(search, job[1], job[2])] = job
+
+        try:
+            for _ in range(workers):
+                submit_next()
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = futures.pop(future)
+                    submit_next()
+                    try:
+                        result = future.result()
+                    except Exception as exc:
+                        yield SminfoClientBase._batch_failure(job, exc)
+                        continue
+                    yield BatchOutcome(
+                        index=job[0],
+                        query=result.query,
+                        company_name=job[2],
+                        result=result,
+                    )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _batch_jobs(
+        queries: Iterable[str | tuple[str, str | None]],
+    ) -> list[tuple[int, str, str | None]]:
+        jobs = []
+        for index, item in enumerate(queries):
+            if isinstance(item, str):
+                jobs.append((index, item, None))
+            else:
+                query, company_name = item
+                jobs.append((index, query, company_name or None))
+        return jobs
+
+    @staticmethod
+    def _batch_failure(
+        job: tuple[int, str, str | None],
+        exc: Exception,
+    ) -> BatchOutcome:
+        index, query, company_name = job
+        return BatchOutcome(
+            index=index,
+            query=query,
+            company_name=company_name,
+            error_type=type(exc).__name__,
+            error=str(exc),
+        )
+
+    @staticmethod
+    def _search_form_fields(query: str, page_no: int = 1) -> dict[str, str]:
+        # _JS_SUBMIT_SEARCH_SCRIPT가 검색 폼에 채우는 값과 동일 (encodeURIComponent 포함)
+        return {
+            "cmMenuId": SEARCH_MENU_ID,
+            "cmQuery": query,
+            "cmQueryEncoding": quote(query, safe="-_.!~*'()"),
+            "cmQueryOption": "00",
+            "cmPageNo": str(page_no),
+            "mode": "",
+            "clickcontrol": "disable",
+            "htmlvalue": query,
+        }
+
+    def _search_form_body(self, query: str, charset: str, page_no: int = 1) -> str:
+        return urlencode(self._search_form_fields(query, page_no), encoding=charset)
+
+    @staticmethod
+    def _remember_site_charset(charset: str) -> str:
+        charset = normalize_charset(charset)
+        SminfoClientBase._site_charset = charset
+        return charset
+
+    def _candidates_from_html(
+        self,
+        root: Element,
+        query: str,
+    ) -> tuple[list[Candidate], dict[tuple[str, str], str]]:
+        rows, links = self._rows_from_html(root, query)
+        return self._rank_candidates(rows, query), links
+
+    def _rows_from_html(
+        self,
+        root: Element,
+        query: str,
+    ) -> tuple[dict[tuple[str, str], Candidate], dict[tuple[str, str], str]]:
+        """Unranked candidate rows of one result page, plus each row's link ``href``."""
+        raw = extract_candidates(root, query)
+        deduped: dict[tuple[str, str], Candidate] = {}
+        self._merge_raw_candidates(raw, deduped)
+        if not deduped:
+            raw = extract_link_candidates(root, query)
+            self._merge_raw_candidates(raw, deduped)
+
+        links: dict[tuple[str, str], str] = {}
+        for item in raw:
+            key = (self._normalize_space(item["name"]), self._normalize_space(item["row_text"]))
+            links.setdefault(key, item.get("href") or "")
+        return deduped, links
+
+    def _extra_result_pages(self, result_count: int | None) -> list[int]:
+        """Result page numbers after the first that pagination should fetch.
+
+        The page count uses the site's page size, not the rows parsed from the
+        first page: those also pick up paging and menu links, and an overcount
+        would silently skip result pages.
+        """
+        if self.result_max_pages <= 1 or not result_count:
+            return []
+        page_count = min(-(-result_count // self.result_page_size), self.result_max_pages)
+        return list(range(2, page_count + 1))
+
+    def _result_pages_arg(self, query: str, page_numbers: list[int]) -> dict[str, object]:
+        return {
+            "url": BASE_URL + SEARCH_PATH,
+            "bodies": [
+                self._search_form_body(query, self._site_charset, page_no)
+                for page_no in page_numbers
+            ],
+            "concurrency": self.result_page_concurrency,
+        }
+
+    def _rows_from_page_markup(
+        self,
+        url: str | None,
+        markup: str,
+        query: str,
+    ) -> tuple[dict[tuple[str, str], Candidate], dict[tuple[str, str], str]]:
+        if self._is_login_url(url):
+            raise self._session_expired_error()
+        root = parse_html(markup)
+        if has_login_form(root):
+            raise self._session_expired_error()
+        return self._rows_from_html(root, query)
+
+    def _merge_result_pages(
+        self,
+        query: str,
+        first_rows: dict[tuple[str, str], Candidate],
+        page_numbers: list[int],
+        fetched: list[object],
+        links: dict[tuple[str, str], str] | None = None,
+    ) -> tuple[list[Candidate], dict[tuple[str, str], int]]:
+        """Rank the first page's rows together with the extra pages fetched for it.
+
+        ``fetched`` holds one ``{"url", "html"}`` item (or ``None`` when that
+        page failed) per entry of ``page_numbers``, as returned by
+        ``_FETCH_RESULT_PAGES_SCRIPT``. The returned map gives the result
+        page of every row not found on the first page, so it can be opened
+        from there.
+        """
+        rows = dict(first_rows)
+        pages: dict[tuple[str, str], int] = {}
+        for page_no, item in zip(page_numbers, fetched, strict=True):
+            if not isinstance(item, dict):
+                continue
+            page_rows, page_links = self._rows_from_page_markup(
+                item.get("url"), str(item.get("html") or ""), query
+            )
+            self._merge_rows(page_rows, rows)
+            for key in page_rows:
+                if key not in first_rows:
+                    pages.setdefault(key, page_no)
+            if links is not None:
+                for key, href in page_links.items():
+                    links.setdefault(key, href)
+        return self._rank_candidates(rows, query), pages
+
+    @staticmethod
+    def _merge_rows(
+        source: dict[tuple[str, str], Candidate],
+        deduped: dict[tuple[str, str], Candidate],
+    ) -> None:
+        for key, candidate in source.items():
+            prev = deduped.get(key)
+            if prev is None or candidate.match_score > prev.match_score:
+                deduped[key] = candidate
+
+    @staticmethod
+    def _detail_url(page_url: str, href: str) -> str | None:
+        href = (href or "").strip()
+        if not href or href.startswith("#") or href.lower().startswith("javascript:"):
+            return None
+        url = urljoin(page_url, href)
+        if urlparse(url).scheme not in ("http", "https"):
+            return None
+        return url
+
+    def _session_expired_error(self) -> NotLoggedInError:
+        # 로그인 페이지를 만난 즉시 캐시된 세션 확인 결과를 무효화
+        self._session_probe().mark_expired()
+        return NotLoggedInError(
+            "로그인 세션이 만료되었습니다. login 명령으로 다시 로그인하세요."
+        )
+
+    def _merge_raw_candidates(
+        self,
+        raw: object,
+        deduped: dict[tuple[str, str], Candidate],
+    ) -> None:
+        if not isinstance(raw, list):
+            return
+
+        for item in raw:
+            name = self._normalize_space(str(item.get("name", "")))
+            if not name:
+                continue
+
+            row_text = self._normalize_space(str(item.get("row_text", "")))
+            table_title = self._normalize_space(str(item.get("table_title", "")))
+            score = int(item.get("match_score", 0))
+
+            key = (name, row_text)
+            prev = deduped.get(key)
+            candidate = Candidate(
+                name=name,
+                row_text=row_text,
+                table_title=table_title,
+                match_score=score,
+            )
+            if prev is None or candidate.match_score > prev.match_score:
+                deduped[key] = candidate
+
+    def _rank_candidates(
+        self,
+        deduped: dict[tuple[str, str], Candidate],
+        query: str,
+    ) -> list[Candidate]:
+        ordered = sorted(
+            deduped.values(),
+            key=lambda c: (c.match_score, len(c.row_text), -len(c.name), c.name),
+            reverse=True,
+        )
+
+        # 페이지를 더 받아오는 만큼 후보 상한도 늘림
+        limit = _CANDIDATE_LIMIT * self.result_max_pages
+        if query:
+            matched = [candidate for candidate in ordered if candidate.match_score > 0]
+            if matched:
+                return matched[:limit]
+            return []
+
+        return ordered[:limit]
+
+    def _no_candidates_error(self, query: str, result_count: int | None) -> SearchError:
+        if result_count == 0:
+            return SearchError(
+                f"'{query}' 검색 결과가 0건입니다. (사이트 제한 또는 조회 조건 문제일 수 있습니다.)"
+            )
+        return SearchError(
+            f"'{query}' 검색 결과 후보를 찾지 못했습니다. 로그인 세션을 갱신 후 다시 시도하세요."
+        )
+
+    def _choose_candidate(
+        self,
+        candidates: list[Candidate],
+        company_name: str | None,
+    ) -> Candidate | None:
+        if not candidates:
+            return None
+
+        if company_name:
+            target = self._normalize_space(company_name).lower()
+            exact = [c for c in candidates if c.name.lower() == target]
+            if exact:
+                return sorted(exact, key=lambda c: c.match_score, reverse=True)[0]
+
+            contains = [c for c in candidates if target in c.name.lower()]
+            if contains:
+                return sorted(contains, key=lambda c: c.match_score, reverse=True)[0]
+
+            raise SearchError(f"'{company_name}' 후보를 찾지 못했습니다.")
+
+        return candidates[0]
+
+    def _build_tables(self, raw_tables: object, frame_url: str) -> list[TableData]:
+        if not isinstance(raw_tables, list):
+            return []
+
+        tables: list[TableData] = []
+        for item in raw_tables:
+            table = self._build_table(item, frame_url)
+            if table is not None:
+                tables.append(table)
+        return tables
+
+    def _build_scored_tables(self, raw_tables: object, frame_url: str) -> list[tuple[int, TableData]]:
+        """Tables from ``_RANKED_TABLE_EXTRACT_SCRIPT``, paired with the score computed in the page."""
+        if not isinstance(raw_tables, list):
+            return []
+
+        scored: list[tuple[int, TableData]] = []
+        for item in raw_tables:
+            table = self._build_table(item, frame_url)
+            if table is not None:
+                scored.append((int(item.get("score", 0)), table))
+        return scored
+
+    def _build_table(self, item: dict, frame_url: str) -> TableData | None:
+        rows = item.get("rows", [])
+        if not rows:
+            return None
+
+        table = TableData(
+            title=self._normalize_space(str(item.get("title", ""))),
+            headers=normalize_cells(item.get("headers", [])),
+            rows=normalize_rows(rows),
+            frame_url=frame_url,
+        )
+        return table if table.rows else None
+
+    def _ranked_tables_arg(self) -> dict[str, object]:
+        # 프레임마다 상위 표만 받아도 전체 선택 결과는 같도록 대체 표 개수도 포함
+        return {
+            "keywords": list(self.table_scorer.keywords),
+            "limit": max(self.table_limit, _FALLBACK_TABLE_COUNT),
+        }
+
+    def _select_relevant_tables(self, all_tables: list[TableData]) -> list[TableData]:
+        return self._select_scored_tables([(self._score_table(table), table) for table in all_tables])
+
+    def _select_scored_tables(self, scored: list[tuple[int, TableData]]) -> list[TableData]:
+        if not scored:
+            return []
+
+        scored = sorted(scored, key=lambda pair: pair[0], reverse=True)
+        relevant = [table for score, table in scored if score >= RELEVANT_SCORE]
+
+        if relevant:
+            return relevant[: self.table_limit]
+
+        # 키워드를 못 찾은 경우라도 첫 3개 표는 반환
+        return [table for _, table in scored[:_FALLBACK_TABLE_COUNT]]
+
+    def _score_table(self, table: TableData) -> int:
+        return self.table_scorer.score(table.title, table.headers, table.rows)
+
+    @staticmethod
+    def _login_form_selectors() -> dict[str, list[str]]:
+        return {
+            "idSelectors": list(_LOGIN_ID_SELECTORS),
+            "pwSelectors": list(_LOGIN_PW_SELECTORS),
+        }
+
+    def _snapshot_arg(self, query: str) -> dict[str, object]:
+        return {"keyword": query, **self._login_form_selectors()}
+
+    def _build_snapshot(self, payloads: list[object], query: str) -> _PageSnapshot:
+        """Merge per-frame ``_PAGE_SNAPSHOT_SCRIPT`` results, main frame first."""
+        snapshot = _PageSnapshot()
+        table_rows: dict[tuple[str, str], Candidate] = {}
+        link_rows: dict[tuple[str, str], Candidate] = {}
+
+        for raw in payloads:
+            if not isinstance(raw, dict):
+                continue
+            self._merge_raw_candidates(raw.get("table_candidates"), table_rows)
+            self._merge_raw_candidates(raw.get("link_candidates"), link_rows)
+            if snapshot.result_count is None:
+                snapshot.result_count = self._parse_result_count(raw.get("result_count"))
+            snapshot.login_form = snapshot.login_form or bool(raw.get("login_form"))
+            if snapshot.username is None:
+                snapshot.username = self._normalize_space(str(raw.get("username") or "")) or None
+
+        # 표 안의 링크가 하나도 없을 때만 일반 링크를 후보로 사용
+        snapshot.rows = table_rows or link_rows
+        snapshot.candidates = self._rank_candidates(snapshot.rows, query)
+        return snapshot
+
+    @staticmethod
+    def _parse_result_count(raw: object) -> int | None:
+        if raw is None:
+            return None
+        try:
+            return int(str(raw).replace(",", "").strip())
+        except ValueError:
+            return None
+
+    def _write_session_meta(self, username: str | None) -> None:
+        payload = {"username": self._normalize_space(username or ""), "saved_at": int(time.time())}
+        self._write_json_atomic(self.meta_path, payload)
+
+    @staticmethod
+    def _write_json_atomic(path: Path, payload: object) -> None:
+        # 검색 중인 다른 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_text(
+                json.dumps(payload, ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _normalize_space(value: str) -> str:
+        return normalize_text(value)
+
+
+class SminfoClient(SminfoClientBase):
+    def __init__(
+        self,
+        state_path: str | Path | None = None,
+        meta_path: str | Path | None = None,
+        headless: bool = True,
+        timeout_ms: int = DEFAULT_TIMEOUT_MS,
+        browser_channel: str | None = DEFAULT_BROWSER_CHANNEL,
+        resource_policy: ResourcePolicy | None = None,
+        readiness: bool = DEFAULT_READINESS,
+        single_navigation: bool = DEFAULT_SINGLE_NAVIGATION,
+        browser_pool: BrowserPool | None = None,
+        context_pool: ContextPool | None = None,
+        daemon_socket: str | Path | None = None,
+        http_fast_path: bool = DEFAULT_HTTP_FAST_PATH,
+        auto_relogin: bool = DEFAULT_AUTO_RELOGIN,
+    ) -> None:
+        super().__init__(
+            state_path=state_path,
+            meta_path=meta_path,
+            headless=headless,
+            timeout_ms=timeout_ms,
+            browser_channel=browser_channel,
+            resource_policy=resource_policy,
+            readiness=readiness,
+            single_navigation=single_navigation,
+            auto_relogin=auto_relogin,
+        )
+        self.browser_pool = browser_pool
+        self.context_pool = context_pool
+        self.daemon_socket = Path(daemon_socket) if daemon_socket else None
+        self.http_fast_path = http_fast_path
+
     def login(
         self,
         username: str | None = None,
@@ -345,73 +1171,298 @@ class SminfoClient:
                             "로그인 완료를 감지하지 못했습니다. 다시 시도하세요."
                         )
 
-            if self._is_login_page(page):
+            snapshot = self._page_snapshot(page)
+            if self._is_login_url(page.url) or snapshot.login_form:
                 browser.close()
                 raise NotLoggedInError("로그인에 실패했습니다. 아이디/비밀번호를 확인하세요.")
 
-            detected_username = self._extract_logged_in_username(page)
+            detected_username = snapshot.username
             fallback_username = self._normalize_space(username or "")
             self._write_session_meta(detected_username or fallback_username or None)
-            context.storage_state(path=str(self.state_path))
+            self._save_storage_state(context)
             browser.close()
 
         return self.state_path
 
-    def search_company(
+    def refresh_session(
         self,
-        query: str,
-        company_name: str | None = None,
-    ) -> SearchResult:
-        query = self._normalize_space(query)
-        if not query:
-            raise ValueError("검색어를 입력하세요.")
+        username: str | None = None,
+        password: str | None = None,
+    ) -> Path:
+        """Touch the saved session and re-save its cookies.
 
+        When the session has expired and credentials are given, the headless
+        login flow runs on the same page. Without credentials an expired
+        session raises ``NotLoggedInError``.
+        """
         if not self.has_saved_session():
-            raise NotLoggedInError(
-                f"저장된 로그인 세션이 없습니다: {self.state_path}"
-            )
+            if not (username and password):
+                raise NotLoggedInError(f"저장된 로그인 세션이 없습니다: {self.state_path}")
+            return self.login(username=username, password=password, headless=True)
 
-        with sync_playwright() as pw:
-            browser = self._launch_browser(pw, headless=self.headless)
-            context = browser.new_context(
-                storage_state=str(self.state_path), locale="ko-KR"
-            )
-            page = context.new_page()
-            page.set_default_timeout(self.timeout_ms)
+        with self._open_browser(headless=True) as browser:
+            context = browser.new_context(storage_state=storage_state_arg(self.state_path), locale="ko-KR")
+            try:
+                page = context.new_page()
+                page.set_default_timeout(self.timeout_ms)
+                self._open_search_page_via_post(page, query="")
+
+                relogged = False
+                if self._is_login_page(page):
+                    if not (username and password):
+                        raise self._session_expired_error()
+                    self._perform_login(page, username, password)
+                    relogged = True
 
-            self._open_search_page_via_post(page, query="")
+                self._save_storage_state(context)
+                if relogged:
+                    detected_username = self._extract_logged_in_username(page)
+                    self._write_session_meta(detected_username or self._normalize_space(username))
+            finally:
+                try:
+                    context.close()
+                except PlaywrightError:
+                    pass
 
-            if self._is_login_page(page):
-                browser.close()
-                raise NotLoggedInError(
-                    "로그인 세션이 만료되었습니다. login 명령으로 다시 로그인하세요."
-                )
+        self._session_probe().mark_valid()
+        return self.state_path
 
-            self._submit_search_query(page, query)
-            candidates = self._extract_candidates(page, query)
-            if not candidates:
-                result_count = self._read_result_count(page)
-                if result_count == 0:
-                    browser.close()
-                    raise SearchError(
-                        f"'{query}' 검색 결과가 0건입니다. (사이트 제한 또는 조회 조건 문제일 수 있습니다.)"
-                    )
+    def _save_storage_state(self, context) -> bool:
+        """Write the context's storage state; returns False when it matches the saved file.
 
-                browser.close()
-                raise SearchError(
-                    f"'{query}' 검색 결과 후보를 찾지 못했습니다. 로그인 세션을 갱신 후 다시 시도하세요."
-                )
+        An unchanged rewrite is skipped so the file keeps its mtime, which
+        parked contexts and the session probe are keyed on.
+        """
+        state = context.storage_state()
+        if state == load_json_file(self.state_path):
+            return False
+        self._write_json_atomic(self.state_path, state)
+        return True
+
+    def _iter_search_once(
+        self,
+        query: str,
+        company_name: str | None,
+    ) -> Iterator[SearchEvent]:
+        query = self._normalize_query(query)
+
+        if self.daemon_socket is not None:
+            yield from self._result_events(self._search_remote(query, company_name))
+            return
+
+        self._check_session()
+
+        if self.http_fast_path:
+            fetched = self._post_search_http(query)
+            if fetched is not None:
+                result = self._search_from_html(query, company_name, *fetched)
+                if result is not None:
+                    yield from self._result_events(result)
+                    return
+
+        with self._search_page() as page:
+            if self.single_navigation:
+                self._open_results_directly(page, query)
+            else:
+                self._submit_search_query(page, query)
+            snapshot = self._page_snapshot(page, query)
+            if (self.single_navigation or self.context_pool is not None) and (
+                self._is_login_url(page.url) or snapshot.login_form
+            ):
+                raise self._session_expired_error()
+
+            if not snapshot.candidates:
+                raise self._no_candidates_error(query, snapshot.result_count)
+            candidates, pages = self._paginate_candidates(page, query, snapshot)
+            yield SearchEvent(EVENT_CANDIDATES, query, candidates=candidates)
 
             selected = self._choose_candidate(candidates, company_name)
             tables: list[TableData] = []
 
             if selected:
+                yield SearchEvent(EVENT_SELECTED, query, selected=selected)
+                page_no = pages.get((selected.name, selected.row_text))
+                if page_no is not None:
+                    self._open_results_directly(page, query, page_no)
                 self._click_company_link(page, selected.name)
-                self._wait_for_page_settle(page)
+                if not self.readiness:
+                    self._wait_for_page_settle(page)
                 tables = self._extract_relevant_tables(page)
+                for table in tables:
+                    yield SearchEvent(EVENT_TABLE, query, table=table)
 
-            browser.close()
+        self._session_probe().mark_valid()
+        result = SearchResult(
+            query=query,
+            candidates=candidates,
+            selected=selected,
+            performance_tables=tables,
+        )
+        yield SearchEvent(EVENT_RESULT, query, result=result)
+
+    def search_many(
+        self,
+        queries: Iterable[str | tuple[str, str | None]],
+        concurrency: int = 4,
+    ) -> Iterator[BatchOutcome]:
+        """Search many companies, yielding outcomes in completion order.
+
+        ``queries`` holds plain queries or ``(query, company_name)`` pairs.
+        One authenticated context is opened for the whole batch and up to
+        ``concurrency`` tabs run in parallel; per-query failures are yielded
+        as outcomes with ``error_type`` set instead of being raised.
+        """
+        jobs = self._batch_jobs(queries)
+        if not jobs:
+            return
+
+        if self.daemon_socket is not None:
+            yield from self._search_many_remote(jobs, concurrency)
+            return
+
+        from .async_client import AsyncSminfoClient
+
+        outcomes: queue.Queue = queue.Queue()
+        finished = object()
+        loop = asyncio.new_event_loop()
+        # 소비자가 일찍 멈출 때 보내는 취소와 작업 스레드의 loop.close()가 엇갈리지 않도록 함
+        loop_lock = threading.Lock()
+
+        async def produce() -> None:
+            async with AsyncSminfoClient(
+                state_path=self.state_path,
+                meta_path=self.meta_path,
+                headless=self.headless,
+                timeout_ms=self.timeout_ms,
+                browser_channel=self.browser_channel,
+                resource_policy=self.resource_policy,
+                readiness=self.readiness,
+                single_navigation=self.single_navigation,
+                auto_relogin=self.auto_relogin,
+            ) as client:
+                async for outcome in client.search_many(
+                    [(query, company_name) for _, query, company_name in jobs],
+                    concurrency=concurrency,
+                ):
+                    outcomes.put(outcome)
+
+        task = loop.create_task(produce())
+
+        def run() -> None:
+            try:
+                loop.run_until_complete(task)
+            except asyncio.CancelledError:
+                pass
+            except Exception as exc:
+                outcomes.put(exc)
+            finally:
+                with loop_lock:
+                    loop.close()
+                outcomes.put(finished)
+
+        worker = threading.Thread(target=run, name="sminfo-search-many", daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = outcomes.get()
+                if item is finished:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            with loop_lock:
+                if not loop.is_closed():
+                    loop.call_soon_threadsafe(task.cancel)
+            worker.join()
+
+    def _search_many_remote(
+        self,
+        jobs: list[tuple[int, str, str | None]],
+        concurrency: int,
+    ) -> Iterator[BatchOutcome]:
+        yield from self._thread_batch(
+            jobs,
+            lambda query, company_name: self._search_remote(
+                self._normalize_query(query), company_name
+            ),
+            concurrency,
+        )
+
+    def _post_search_http(self, query: str) -> tuple[str, Element] | None:
+        """POST the search form without rendering; ``None`` means use a real page."""
+        try:
+            with self._api_request() as request:
+                # form=은 항상 UTF-8로 보내므로 브라우저처럼 사이트 문서 인코딩으로 직접 인코딩
+                charset = self._site_charset
+                response = self._post_search_form(request, query, charset)
+                site_charset = self._remember_site_charset(
+                    detect_charset(response.body(), response.headers.get("content-type"))
+                )
+                if site_charset != charset and not query.isascii():
+                    response = self._post_search_form(request, query, site_charset)
+                if not response.ok:
+                    return None
+                url = response.url
+                markup = decode_html(response.body(), response.headers.get("content-type"))
+        except PlaywrightError:
+            return None
+
+        if self._is_login_url(url):
+            return None
+        root = parse_html(markup)
+        if has_login_form(root):
+            return None
+        return url, root
+
+    def _post_search_form(
+        self,
+        request: APIRequestContext,
+        query: str,
+        charset: str,
+    ) -> APIResponse:
+        return request.post(
+            SEARCH_PATH,
+            data=self._search_form_body(query, charset),
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+
+    def _search_from_html(
+        self,
+        query: str,
+        company_name: str | None,
+        url: str,
+        root: Element,
+    ) -> SearchResult | None:
+        rows, links = self._rows_from_html(root, query)
+        candidates = self._rank_candidates(rows, query)
+        result_count = self._parse_result_count(read_result_count(root))
+        if not candidates:
+            if result_count == 0:
+                raise self._no_candidates_error(query, result_count)
+            # 파싱 실패일 수 있으므로 실제 페이지로 다시 확인
+            return None
+        if self._extra_result_pages(result_count):
+            # 나머지 결과 페이지는 브라우저 흐름에서 페이지 안 fetch로 함께 받아옴
+            return None
 
+        selected = self._choose_candidate(candidates, company_name)
+        detail_url = self._detail_url(url, links.get((selected.name, selected.row_text), ""))
+        if detail_url is None:
+            # javascript: 링크는 클릭으로만 열 수 있음
+            return None
+
+        # 풀의 페이지는 사용 후 검색 페이지로 되돌아가지만, 새 페이지는 검색 폼을 거칠 필요가 없음
+        opened = self._search_page() if self.context_pool is not None else self._open_page()
+        with opened as page:
+            self._begin_stage(page)
+            page.goto(detail_url, wait_until="domcontentloaded")
+            self._wait_for_stage(page, DETAIL)
+            if self._is_login_page(page):
+                raise self._session_expired_error()
+            tables = self._extract_relevant_tables(page)
+
+        self._session_probe().mark_valid()
         return SearchResult(
             query=query,
             candidates=candidates,
@@ -419,6 +1470,101 @@ class SminfoClient:
             performance_tables=tables,
         )
 
+    @contextmanager
+    def _api_request(self) -> Iterator[APIRequestContext]:
+        owned = None
+        if self.browser_pool is not None:
+            pw = self.browser_pool.playwright()
+        else:
+            owned = sync_playwright().start()
+            pw = owned
+
+        request = pw.request.new_context(
+            base_url=BASE_URL,
+            storage_state=storage_state_arg(self.state_path),
+            timeout=self.timeout_ms,
+        )
+        try:
+            yield request
+        finally:
+            request.dispose()
+            if owned is not None:
+                owned.stop()
+
+    def _search_remote(self, query: str, company_name: str | None) -> SearchResult:
+        from .browserd import call_daemon
+
+        response = call_daemon(
+            self.daemon_socket,
+            {
+                "op": "search",
+                "query": query,
+                "company": company_name,
+                "state_path": str(self.state_path),
+            },
+            timeout=self.timeout_ms / 1000 * 4,
+        )
+        return SearchResult.from_dict(response.get("result") or {})
+
+    @contextmanager
+    def _open_browser(self, headless: bool) -> Iterator[Browser]:
+        pool = self.browser_pool
+        if pool is not None and pool.headless == headless and not pool.closed:
+            with pool.browser() as browser:
+                yield browser
+            return
+
+        with sync_playwright() as pw:
+            browser = self._launch_browser(pw, headless=headless)
+            try:
+                yield browser
+            finally:
+                browser.close()
+
+    @contextmanager
+    def _open_page(self) -> Iterator[Page]:
+        with self._open_browser(self.headless) as browser:
+            context = browser.new_context(
+                storage_state=storage_state_arg(self.state_path), locale="ko-KR"
+            )
+            try:
+                self.resource_policy.install(context)
+                page = context.new_page()
+                page.set_default_timeout(self.timeout_ms)
+                yield page
+            finally:
+                try:
+                    context.close()
+                except PlaywrightError:
+                    pass
+
+    @contextmanager
+    def _search_page(self) -> Iterator[Page]:
+        if self.context_pool is not None:
+            with self.context_pool.page(
+                self.state_path,
+                park=self._park_page,
+                timeout_ms=self.timeout_ms,
+                setup_context=self.resource_policy.install,
+            ) as page:
+                yield page
+            return
+
+        with self._open_page() as page:
+            self._park_page(page)
+            yield page
+
+    def _park_page(self, page: Page) -> None:
+        # 한 번의 네비게이션으로 결과 페이지를 여는 경우 검색 폼에 미리 가 있을 필요가 없음
+        if not self.single_navigation:
+            self._park_on_search_page(page)
+
+    def _park_on_search_page(self, page: Page) -> None:
+        self._open_search_page_via_post(page, query="")
+
+        if self._is_login_page(page):
+            raise self._session_expired_error()
+
     def _perform_login(self, page: Page, username: str, password: str) -> None:
         id_input = self._find_first_visible_locator(page, _LOGIN_ID_SELECTORS)
         pw_input = self._find_first_visible_locator(page, _LOGIN_PW_SELECTORS)
@@ -448,30 +1594,12 @@ class SminfoClient:
         return False
 
     def _open_search_page_via_post(self, page: Page, query: str) -> None:
-        page.goto(BASE_URL, wait_until="domcontentloaded")
+        # 이미 사이트 origin에 있으면 홈 이동 없이 바로 POST
+        if not (page.url or "").startswith(BASE_URL):
+            page.goto(BASE_URL, wait_until="domcontentloaded")
+        self._begin_stage(page)
         page.evaluate(
-            """
-            ({ baseUrl, path, menuId, keyword }) => {
-              const form = document.createElement("form");
-              form.method = "POST";
-              form.action = `${baseUrl}${path}`;
-
-              const add = (name, value) => {
-                const input = document.createElement("input");
-                input.type = "hidden";
-                input.name = name;
-                input.value = value;
-                form.appendChild(input);
-              };
-
-              add("cmMenuId", menuId);
-              add("cmQuery", keyword);
-              add("mode", "fast");
-
-              document.body.appendChild(form);
-              form.submit();
-            }
-            """,
+            _OPEN_SEARCH_PAGE_SCRIPT,
             {
                 "baseUrl": BASE_URL,
                 "path": SEARCH_PATH,
@@ -479,7 +1607,54 @@ class SminfoClient:
                 "keyword": query,
             },
         )
-        self._wait_for_page_settle(page)
+        self._wait_for_stage(page, SEARCH_RESULTS if query else SEARCH_FORM)
+
+    def _paginate_candidates(
+        self,
+        page: Page,
+        query: str,
+        snapshot: _PageSnapshot,
+    ) -> tuple[list[Candidate], dict[tuple[str, str], int]]:
+        page_numbers = self._extra_result_pages(snapshot.result_count)
+        if not page_numbers:
+            return snapshot.candidates, {}
+        if not query.isascii():
+            self._remember_site_charset(page.evaluate("document.characterSet"))
+        fetched = page.evaluate(_FETCH_RESULT_PAGES_SCRIPT, self._result_pages_arg(query, page_numbers))
+        # 페이지 안 fetch가 결과를 돌려주지 못하면 모든 페이지를 실패로 처리
+        fetched = fetched or [None] * len(page_numbers)
+        return self._merge_result_pages(query, snapshot.rows, page_numbers, fetched)
+
+    def _open_results_directly(self, page: Page, query: str, page_no: int = 1) -> None:
+        """Load the result list for ``query`` in one navigation.
+
+        ``goto`` cannot POST, so the navigation request is rewritten into the
+        search form POST on its way out; redirects to the login page show up
+        on the same response.
+        """
+        url = BASE_URL + SEARCH_PATH
+        charset = self._site_charset
+        body = self._search_form_body(query, charset, page_no)
+
+        def post_search(route) -> None:
+            headers = {**route.request.headers, "content-type": "application/x-www-form-urlencoded"}
+            route.continue_(method="POST", post_data=body, headers=headers)
+
+        page.route(url, post_search)
+        try:
+            self._begin_stage(page)
+            page.goto(url, referer=BASE_URL + "/", wait_until="commit")
+        finally:
+            page.unroute(url, post_search)
+
+        if self._is_login_url(page.url):
+            raise self._session_expired_error()
+        self._wait_for_stage(page, SEARCH_RESULTS)
+
+        if not query.isascii():
+            site_charset = self._remember_site_charset(page.evaluate("document.characterSet"))
+            if site_charset != charset:
+                self._open_results_directly(page, query, page_no)
 
     def _fill_query_and_submit(self, page: Page, query: str) -> bool:
         query_input = self._find_first_visible_locator(page, _QUERY_INPUT_SELECTORS)
@@ -487,149 +1662,77 @@ class SminfoClient:
             return False
 
         query_input.fill(query)
+        self._begin_stage(page)
         query_input.press("Enter")
-        self._wait_for_page_settle(page)
+        self._wait_for_stage(page, SEARCH_RESULTS)
 
         # Enter로 검색되지 않은 경우를 대비한 fallback 클릭
         if not self._extract_candidates(page, query):
             button = self._find_first_visible_locator(page, _SEARCH_BUTTON_SELECTORS)
             if button:
+                self._begin_stage(page)
                 button.click()
-                self._wait_for_page_settle(page)
+                self._wait_for_stage(page, SEARCH_RESULTS)
         return True
 
     def _submit_search_query(self, page: Page, query: str) -> bool:
+        self._begin_stage(page)
         try:
             submitted = page.evaluate(_JS_SUBMIT_SEARCH_SCRIPT, {"keyword": query})
         except Exception:
             submitted = False
 
         if submitted:
-            self._wait_for_page_settle(page)
+            self._wait_for_stage(page, SEARCH_RESULTS)
             return True
 
         # 검색 스크립트 진입이 실패하면 초기 POST 방식으로 재시도
         self._open_search_page_via_post(page, query=query)
         return True
 
-    def _extract_candidates(self, page: Page, query: str) -> list[Candidate]:
-        deduped: dict[tuple[str, str], Candidate] = {}
-
-        self._merge_candidate_rows(
-            page=page,
-            script=_CANDIDATE_TABLE_EXTRACT_SCRIPT,
-            query=query,
-            deduped=deduped,
-        )
-
-        if not deduped:
-            self._merge_candidate_rows(
-                page=page,
-                script=_GENERIC_LINK_CANDIDATE_SCRIPT,
-                query=query,
-                deduped=deduped,
-            )
-
-        ordered = sorted(
-            deduped.values(),
-            key=lambda c: (c.match_score, len(c.row_text), -len(c.name), c.name),
-            reverse=True,
-        )
-
-        if query:
-            matched = [candidate for candidate in ordered if candidate.match_score > 0]
-            if matched:
-                return matched[:50]
-            return []
-
-        return ordered[:50]
-
-    def _merge_candidate_rows(
-        self,
-        page: Page,
-        script: str,
-        query: str,
-        deduped: dict[tuple[str, str], Candidate],
-    ) -> None:
-        for frame in page.frames:
+    def _page_snapshot(self, page: Page, query: str = "") -> _PageSnapshot:
+        payloads = []
+        for frame in content_frames(page):
             try:
-                raw = frame.evaluate(script, query)
+                payloads.append(frame.evaluate(_PAGE_SNAPSHOT_SCRIPT, self._snapshot_arg(query)))
             except Exception:
                 continue
+        return self._build_snapshot(payloads, query)
 
-            if not isinstance(raw, list):
-                continue
-
-            for item in raw:
-                name = self._normalize_space(str(item.get("name", "")))
-                if not name:
-                    continue
-
-                row_text = self._normalize_space(str(item.get("row_text", "")))
-                table_title = self._normalize_space(str(item.get("table_title", "")))
-                score = int(item.get("match_score", 0))
-
-                key = (name, row_text)
-                prev = deduped.get(key)
-                candidate = Candidate(
-                    name=name,
-                    row_text=row_text,
-                    table_title=table_title,
-                    match_score=score,
-                )
-                if prev is None or candidate.match_score > prev.match_score:
-                    deduped[key] = candidate
-
-    def _choose_candidate(
-        self,
-        candidates: list[Candidate],
-        company_name: str | None,
-    ) -> Candidate | None:
-        if not candidates:
-            return None
-
-        if company_name:
-            target = self._normalize_space(company_name).lower()
-            exact = [c for c in candidates if c.name.lower() == target]
-            if exact:
-                return sorted(exact, key=lambda c: c.match_score, reverse=True)[0]
-
-            contains = [c for c in candidates if target in c.name.lower()]
-            if contains:
-                return sorted(contains, key=lambda c: c.match_score, reverse=True)[0]
-
-            raise SearchError(f"'{company_name}' 후보를 찾지 못했습니다.")
-
-        return candidates[0]
+    def _extract_candidates(self, page: Page, query: str) -> list[Candidate]:
+        return self._page_snapshot(page, query).candidates
 
     def _click_company_link(self, page: Page, company_name: str) -> None:
         target = self._normalize_space(company_name)
+        self._begin_stage(page)
 
-        for frame in page.frames:
+        frames = content_frames(page)
+
+        for frame in frames:
             try:
                 exact = frame.get_by_role("link", name=target, exact=True)
                 if exact.count() > 0:
                     exact.first.click()
-                    self._wait_for_page_settle(page)
+                    self._wait_for_stage(page, DETAIL)
                     return
             except Exception:
                 pass
 
-        for frame in page.frames:
+        for frame in frames:
             try:
                 partial = frame.locator("a").filter(has_text=target)
                 if partial.count() > 0:
                     partial.first.click()
-                    self._wait_for_page_settle(page)
+                    self._wait_for_stage(page, DETAIL)
                     return
             except Exception:
                 pass
 
-        for frame in page.frames:
+        for frame in frames:
             try:
                 clicked = frame.evaluate(_JS_CLICK_LINK_SCRIPT, target)
                 if clicked:
-                    self._wait_for_page_settle(page)
+                    self._wait_for_stage(page, DETAIL)
                     return
             except Exception:
                 continue
@@ -637,84 +1740,34 @@ class SminfoClient:
         raise SearchError(f"회사 링크를 클릭하지 못했습니다: {company_name}")
 
     def _extract_relevant_tables(self, page: Page) -> list[TableData]:
+        if self.in_page_table_scoring:
+            scored: list[tuple[int, TableData]] = []
+            for frame in content_frames(page):
+                try:
+                    raw_tables = frame.evaluate(_RANKED_TABLE_EXTRACT_SCRIPT, self._ranked_tables_arg())
+                except Exception:
+                    continue
+                scored.extend(self._build_scored_tables(raw_tables, frame.url))
+            return self._select_scored_tables(scored)
+
         all_tables: list[TableData] = []
 
-        for frame in page.frames:
+        for frame in content_frames(page):
             try:
                 raw_tables = frame.evaluate(_TABLE_EXTRACT_SCRIPT)
             except Exception:
                 continue
 
-            if not isinstance(raw_tables, list):
-                continue
-
-            for item in raw_tables:
-                rows = item.get("rows", [])
-                if not rows:
-                    continue
-
-                table = TableData(
-                    title=self._normalize_space(str(item.get("title", ""))),
-                    headers=[
-                        self._normalize_space(str(header))
-                        for header in item.get("headers", [])
-                        if self._normalize_space(str(header))
-                    ],
-                    rows=[
-                        [self._normalize_space(str(cell)) for cell in row]
-                        for row in rows
-                        if any(self._normalize_space(str(cell)) for cell in row)
-                    ],
-                    frame_url=frame.url,
-                )
-                if table.rows:
-                    all_tables.append(table)
-
-        if not all_tables:
-            return []
-
-        scored = sorted(
-            ((self._score_table(table), table) for table in all_tables),
-            key=lambda pair: pair[0],
-            reverse=True,
-        )
-        relevant = [table for score, table in scored if score >= 4]
+            all_tables.extend(self._build_tables(raw_tables, frame.url))
 
-        if relevant:
-            return relevant[:10]
-
-        # 키워드를 못 찾은 경우라도 첫 3개 표는 반환
-        return [table for _, table in scored[:3]]
-
-    def _score_table(self, table: TableData) -> int:
-        blob_parts = [table.title, *table.headers]
-        for row in table.rows[:20]:
-            blob_parts.extend(row)
-
-        blob = " ".join(blob_parts)
-        score = 0
-
-        if re.search(r"20\\d{2}", blob):
-            score += 3
-
-        for keyword in _FINANCIAL_KEYWORDS:
-            if keyword in blob:
-                score += 2
-
-        if len(table.headers) >= 2:
-            score += 1
-
-        if len(table.rows) >= 2:
-            score += 1
-
-        return score
+        return self._select_relevant_tables(all_tables)
 
     def _find_first_visible_locator(
         self,
         page: Page,
         selectors: tuple[str, ...],
     ) -> Locator | None:
-        for frame in page.frames:
+        for frame in content_frames(page):
             for selector in selectors:
                 locator = frame.locator(selector).first
                 try:
@@ -727,13 +1780,33 @@ class SminfoClient:
         return None
 
     def _is_login_page(self, page: Page) -> bool:
-        url = page.url or ""
-        if "CMM004R0" in url or "CMM004R1" in url:
+        if self._is_login_url(page.url):
             return True
+        return self._page_snapshot(page).login_form
 
-        id_input = self._find_first_visible_locator(page, _LOGIN_ID_SELECTORS)
-        pw_input = self._find_first_visible_locator(page, _LOGIN_PW_SELECTORS)
-        return id_input is not None and pw_input is not None
+    def _begin_stage(self, page: Page) -> None:
+        if self.readiness:
+            mark_stale(page)
+
+    def _wait_for_stage(self, page: Page, stage: str) -> None:
+        if not self.readiness:
+            self._wait_for_page_settle(page)
+            return
+
+        started = time.monotonic()
+        ready = wait_until_ready(page, stage, self.ready_timeout_ms)
+        ready_ms = (time.monotonic() - started) * 1000
+        if not ready:
+            self._wait_for_page_settle(page)
+            self.readiness_stats.record(stage, ready_ms, fallback=True)
+            return
+
+        saved_ms = None
+        if self.readiness_audit:
+            audit_started = time.monotonic()
+            self._wait_for_page_settle(page)
+            saved_ms = (time.monotonic() - audit_started) * 1000
+        self.readiness_stats.record(stage, ready_ms, saved_ms=saved_ms)
 
     def _wait_for_page_settle(self, page: Page) -> None:
         try:
@@ -743,89 +1816,7 @@ class SminfoClient:
         page.wait_for_timeout(700)
 
     def _extract_logged_in_username(self, page: Page) -> str | None:
-        script = """
-        () => {
-          const normalize = (s) => (s || "").replace(/\\s+/g, " ").trim();
-          const blocked = new Set(["로그인", "로그아웃", "회원가입", "나의정보"]);
-          const out = [];
-
-          const push = (value) => {
-            const v = normalize(value);
-            if (!v) return;
-            if (v.length < 2 || v.length > 60) return;
-            if (blocked.has(v)) return;
-            out.push(v);
-          };
-
-          document.querySelectorAll("input[name='cmId'], input[name='id']").forEach((input) => {
-            push(input.value || input.getAttribute("value") || "");
-          });
-
-          const profileNode = document.querySelector(".user, .my_info, .member, .login_info");
-          if (profileNode) push(profileNode.textContent || "");
-
-          const anchors = Array.from(document.querySelectorAll("a"));
-          anchors.forEach((a) => {
-            const t = normalize(a.innerText || a.textContent || "");
-            if (t.endsWith("님")) push(t.replace(/님$/, ""));
-          });
-
-          const unique = Array.from(new Set(out));
-          return unique.length ? unique[0] : null;
-        }
-        """
-        for frame in page.frames:
-            try:
-                raw = frame.evaluate(script)
-            except Exception:
-                continue
-            username = self._normalize_space(str(raw or ""))
-            if username:
-                return username
-        return None
-
-    def _write_session_meta(self, username: str | None) -> None:
-        self.meta_path.parent.mkdir(parents=True, exist_ok=True)
-        payload = {"username": self._normalize_space(username or ""), "saved_at": int(time.time())}
-        self.meta_path.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
-
-    def _read_result_count(self, page: Page) -> int | None:
-        try:
-            raw = page.main_frame.evaluate(
-                """
-                () => {
-                  const text = (document.body && document.body.innerText) || "";
-                  const match = text.match(/검색결과\\s*([0-9,]+)\\s*건/);
-                  return match ? match[1] : null;
-                }
-                """
-            )
-        except Exception:
-            return None
-
-        if raw is None:
-            return None
-        try:
-            return int(str(raw).replace(",", "").strip())
-        except ValueError:
-            return None
+        return self._page_snapshot(page).username
 
     def _launch_browser(self, pw: Playwright, headless: bool) -> Browser:
-        channel = self.browser_channel.lower()
-        if not channel or channel == "chromium":
-            return pw.chromium.launch(headless=headless)
-
-        try:
-            return pw.chromium.launch(headless=headless, channel=channel)
-        except PlaywrightError as exc:
-            print(
-                f"경고: 브라우저 채널 '{channel}' 실행 실패. Chromium으로 전환합니다. ({exc})"
-            )
-            return pw.chromium.launch(headless=headless)
-
-    @staticmethod
-    def _normalize_space(value: str) -> str:
-        return re.sub(r"\\s+", " ", value or "").strip()
+        return launch_browser(pw, self.browser_channel, headless)
@@ -0,0 +1,201 @@
+"""Relevance scoring for the tables found on a company detail page.
+
+A table's title, headers and first rows are joined into one text blob and
+matched against the vocabulary (financial keywords plus the year pattern).
+Large vocabularies go through one compiled alternation that walks the blob
+once. Small ones, and vocabularies whose keywords overlap each other, are
+faster as per-keyword substring checks in CPython. Both give the same hits.
+:meth:`TableScorer.score` only checks which keywords are present;
+:meth:`TableScorer.features` also counts them, and computes the column
+features on first read. Both apply the same rule (:func:`_score`).
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Iterable
+
+from .config import DEFAULT_TABLE_KEYWORDS
+
+FINANCIAL_KEYWORDS = (
+    "재무",
+    "실적",
+    "매출",
+    "영업",
+    "순이익",
+    "당기",
+    "자산",
+    "부채",
+    "회계",
+    "연도",
+)
+
+# 점수가 이 값 이상인 표만 실적 표로 간주
+RELEVANT_SCORE = 4
+
+# 이보다 적은 어휘는 키워드별 `in` 검사가 단일 정규식 스캔보다 빠름 (bench_table_score.py 기준)
+_MATCHER_MIN_KEYWORDS = 40
+
+_YEAR_RE = re.compile(r"20\d{2}")
+# 셀을 구분 문자로 이어 붙인 문자열에서 숫자 셀 전체를 한 번의 스캔으로 셈
+_CELL_SEP = "\x1f"
+_NUMERIC_CELLS_RE = re.compile(
+    r"(?:^|\x1f)[-+△▲▼]?\(?[-+]?\d[\d,]*(?:\.\d+)?\)?%?(?=\x1f|$)"
+)
+
+
+def _score(keyword_count: int, has_year: bool, header_count: int, row_count: int) -> int:
+    score = 2 * keyword_count
+    if has_year:
+        score += 3
+    if header_count >= 2:
+        score += 1
+    if row_count >= 2:
+        score += 1
+    return score
+
+
+@dataclass
+class TableFeatures:
+    """What the scorer saw in one table."""
+
+    keyword_hits: dict[str, int]
+    has_year: bool
+    header_count: int
+    row_count: int
+    headers: list[str] = field(default_factory=list, repr=False, compare=False)
+    first_row: list[str] = field(default_factory=list, repr=False, compare=False)
+    cells: list[str] = field(default_factory=list, repr=False, compare=False)
+
+    @cached_property
+    def year_columns(self) -> int:
+        # 연도 열 머리글은 thead 또는 tbody 첫 행에 있음
+        columns = {idx for idx, cell in enumerate(self.headers) if _YEAR_RE.search(cell)}
+        columns.update(idx for idx, cell in enumerate(self.first_row) if _YEAR_RE.search(cell))
+        return len(columns)
+
+    @cached_property
+    def numeric_ratio(self) -> float:
+        filled = len(self.cells) - self.cells.count("")
+        if not filled:
+            return 0.0
+        return len(_NUMERIC_CELLS_RE.findall(_CELL_SEP.join(self.cells))) / filled
+
+    @property
+    def score(self) -> int:
+        return _score(len(self.keyword_hits), self.has_year, self.header_count, self.row_count)
+
+
+class TableScorer:
+    """Scores tables by financial vocabulary, year mentions and shape.
+
+    Only the title, headers and the first ``max_rows`` rows are read, the
+    same slice the in-page scorer uses.
+    """
+
+    def __init__(self, keywords: Iterable[str] = FINANCIAL_KEYWORDS, max_rows: int = 20) -> None:
+        self.keywords = tuple(dict.fromkeys(k.strip() for k in keywords if k and k.strip()))
+        self.max_rows = max_rows
+        self._matcher, self._implied = self._compile(self.keywords)
+
+    @staticmethod
+    def _compile(keywords: tuple[str, ...]) -> tuple[re.Pattern[str] | None, dict[str, tuple[str, ...]]]:
+        if len(keywords) < _MATCHER_MIN_KEYWORDS:
+            return None, {}
+
+        ordered = sorted(keywords, key=len, reverse=True)
+        alternation = "|".join(re.escape(keyword) for keyword in ordered) + "|" + _YEAR_RE.pattern
+
+        # 한 위치에서 더 긴 키워드가 선택되면 그 안에 포함된 키워드도 함께 등장한 것
+        implied = {
+            keyword: tuple(other for other in ordered if other != keyword and other in keyword)
+            for keyword in ordered
+        }
+        overlapping = any(
+            not (a in b or b in a)
+            and any(a.endswith(b[:size]) for size in range(1, min(len(a), len(b))))
+            for a in ordered
+            for b in ordered
+            if a != b
+        ) or any(any(ch.isdigit() for ch in keyword) for keyword in ordered)
+        if overlapping:
+            # 서로 겹쳐 이어지는 키워드는 한 번의 비중첩 스캔으로 모두 찾을 수 없고,
+            # 모든 위치를 검사하는 lookahead는 키워드별 `in`보다 느림
+            return None, {}
+        return re.compile(f"({alternation})"), implied
+
+    def _blob(self, title: str, headers: list[str], rows: list[list[str]]) -> str:
+        parts = [title, *headers]
+        for row in rows[: self.max_rows]:
+            parts.extend(row)
+        return " ".join(parts)
+
+    def _found(self, blob: str) -> tuple[int, bool]:
+        """Number of distinct keywords present, and whether a year is; nothing is counted."""
+        if self._matcher is None:
+            return sum(1 for keyword in self.keywords if keyword in blob), _YEAR_RE.search(blob) is not None
+
+        found: set[str] = set()
+        has_year = False
+        for token in set(self._matcher.findall(blob)):
+            implied = self._implied.get(token)
+            if implied is None:
+                has_year = True
+                continue
+            found.add(token)
+            found.update(implied)
+        return len(found), has_year
+
+    def _hits(self, blob: str) -> tuple[dict[str, int], bool]:
+        if self._matcher is None:
+            # 없는 키워드는 `in`으로 바로 걸러지고, 있는 키워드만 한 번 더 셈
+            hits = {keyword: blob.count(keyword) for keyword in self.keywords if keyword in blob}
+            return hits, _YEAR_RE.search(blob) is not None
+
+        hits: Counter[str] = Counter()
+        has_year = False
+        for token, count in Counter(self._matcher.findall(blob)).items():
+            implied = self._implied.get(token)
+            if implied is None:
+                has_year = True
+                continue
+            hits[token] += count
+            for keyword in implied:
+                hits[keyword] += count
+        return dict(hits), has_year
+
+    def score(self, title: str, headers: list[str], rows: list[list[str]]) -> int:
+        """Same value as ``features(...).score`` without counting hits or building features."""
+        keyword_count, has_year = self._found(self._blob(title, headers, rows))
+        return _score(keyword_count, has_year, len(headers), len(rows))
+
+    def features(self, title: str, headers: list[str], rows: list[list[str]]) -> TableFeatures:
+        """Keyword hit counts, year columns and numeric-cell ratio for one table."""
+        cells: list[str] = []
+        for row in rows[: self.max_rows]:
+            cells.extend(row)
+        hits, has_year = self._hits(" ".join([title, *headers, *cells]))
+        return TableFeatures(
+            keyword_hits=hits,
+            has_year=has_year,
+            header_count=len(headers),
+            row_count=len(rows),
+            headers=headers,
+            first_row=rows[0] if rows else [],
+            cells=cells,
+        )
+
+
+_DEFAULT_SCORER: TableScorer | None = None
+
+
+def get_table_scorer() -> TableScorer:
+    """Scorer with the built-in vocabulary plus ``SMINFO_TABLE_KEYWORDS``."""
+    global _DEFAULT_SCORER
+    if _DEFAULT_SCORER is None:
+        extra = [part.strip() for part in DEFAULT_TABLE_KEYWORDS.split(",") if part.strip()]
+        _DEFAULT_SCORER = TableScorer((*FINANCIAL_KEYWORDS, *extra))
+    return _DEFAULT_SCORER
@@ -0,0 +1,220 @@
+"""Typed numeric view of a scraped performance table.
+
+Detail-page tables hold financial figures as display strings
+(``"1,234,567"``, ``"(12,345)"``, ``"△500"``, ``"-"``) with the unit
+written once in the title or a header (``"(단위: 백만원)"``). :class:`TypedTable`
+parses a table once into per-metric ``array('d')`` columns indexed by year,
+scaled to won, with a presence mask for empty or unparsable cells.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from array import array
+
+# 긴 단위부터 검사해야 "백만원"이 "만원"으로 잘못 잡히지 않음
+UNIT_SCALES = {
+    "십억원": 1e9,
+    "백만원": 1e6,
+    "천만원": 1e7,
+    "억원": 1e8,
+    "조원": 1e12,
+    "만원": 1e4,
+    "천원": 1e3,
+    "원": 1.0,
+}
+
+_UNIT_ALTERNATION = "|".join(sorted(UNIT_SCALES, key=len, reverse=True))
+_UNIT_NOTE_RE = re.compile(r"단위\s*[:：]?\s*(" + _UNIT_ALTERNATION + ")")
+_CELL_UNIT_RE = re.compile(r"\s*(" + _UNIT_ALTERNATION + r")\s*$")
+_NUMBER_RE = re.compile(r"([-+△▲▼]?)\s*(\()?\s*([-+]?)(\d[\d,]*(?:\.\d+)?)\s*(\))?\s*(%?)")
+_YEAR_RE = re.compile(r"(?<!\d)((?:19|20)\d{2})(?!\d)")
+_YEAR_CELL_MAX_LEN = 16
+_MISSING = frozenset({"", "-", "–", "—", "N/A", "n/a", "해당없음", "없음"})
+
+
+def parse_number(cell: str) -> tuple[float, float] | None:
+    """``(value, scale)`` of a display number, or None when the cell holds none.
+
+    Parenthesized values and a leading ``△``/``▼`` are negative. ``scale`` is
+    the unit written in the cell itself (1.0 for percentages), or 0.0 when
+    the table's unit applies.
+    """
+    text = cell.strip()
+    if text in _MISSING:
+        return None
+
+    scale = 0.0
+    unit = _CELL_UNIT_RE.search(text)
+    if unit is not None:
+        scale = UNIT_SCALES[unit.group(1)]
+        text = text[: unit.start()]
+
+    match = _NUMBER_RE.fullmatch(text)
+    if match is None:
+        return None
+    marker, open_paren, sign, digits, close_paren, percent = match.groups()
+    if marker and sign:
+        # "--5", "△-5"처럼 부호가 겹친 셀은 숫자로 보지 않음
+        return None
+    value = float(digits.replace(",", ""))
+    if marker in ("-", "△", "▼") or sign == "-" or (open_paren and close_paren):
+        value = -value
+    return value, (1.0 if percent else scale)
+
+
+def detect_unit_scale(texts: list[str]) -> float:
+    """Unit multiplier from a ``단위: ...`` note in the given texts (1.0 if none)."""
+    for text in texts:
+        match = _UNIT_NOTE_RE.search(text)
+        if match is not None:
+            return UNIT_SCALES[match.group(1)]
+    return 1.0
+
+
+def parse_year(cell: str) -> int | None:
+    if len(cell) > _YEAR_CELL_MAX_LEN or "," in cell:
+        return None
+    match = _YEAR_RE.search(cell)
+    return int(match.group(1)) if match else None
+
+
+def _metric_key(label: str) -> str:
+    return "".join(label.split())
+
+
+class TypedTable:
+    """Per-metric numeric columns of one table, aligned with :attr:`years`.
+
+    Supports the two layouts the detail pages use: years across the header
+    (or first body row) with one metric per row, and years down the first
+    column with one metric per column. ``values[metric][i]`` is NaN and
+    ``present[metric][i]`` is 0 when the cell for ``years[i]`` is missing.
+    """
+
+    __slots__ = ("years", "metrics", "unit_scale", "values", "present")
+
+    def __init__(
+        self,
+        years: list[int],
+        metrics: list[str],
+        unit_scale: float,
+        values: dict[str, array],
+        present: dict[str, bytearray],
+    ) -> None:
+        self.years = years
+        self.metrics = metrics
+        self.unit_scale = unit_scale
+        self.values = values
+        self.present = present
+
+    @classmethod
+    def from_table(cls, title: str, headers: list[str], rows: list[list[str]]) -> TypedTable:
+        unit_scale = detect_unit_scale([title, *headers, *(row[0] for row in rows[:3] if row)])
+        series = cls._year_columns_layout(headers, rows) or cls._year_rows_layout(headers, rows)
+
+        years = sorted({year for _, cells in series for year, _ in cells})
+        position = {year: idx for idx, year in enumerate(years)}
+        metrics: list[str] = []
+        values: dict[str, array] = {}
+        present: dict[str, bytearray] = {}
+
+        for label, cells in series:
+            label = label.strip()
+            if not label or label in values:
+                continue
+            column = array("d", [math.nan]) * len(years)
+            mask = bytearray(len(years))
+            for year, cell in cells:
+                parsed = parse_number(cell)
+                if parsed is None:
+                    continue
+                value, cell_scale = parsed
+                column[position[year]] = value * (cell_scale or unit_scale)
+                mask[position[year]] = 1
+            if any(mask):
+                metrics.append(label)
+                values[label] = column
+                present[label] = mask
+
+        return cls(years, metrics, unit_scale, values, present)
+
+    @staticmethod
+    def _year_columns_layout(headers: list[str], rows: list[list[str]]) -> list[tuple[str, list[tuple[int, str]]]]:
+        # thead 머리글은 빈 칸(왼쪽 위 모서리 등)이 빠지고 여러 행이 한 줄로 이어져 있어
+        # 본문 행과 열 위치가 맞지 않으므로 오른쪽 끝을 기준으로 맞춤
+        width = max((len(row) for row in rows), default=0)
+        header_offset = width - len(headers) if headers else 0
+
+        # 연도 머리글이 thead에 없으면 tbody 첫 행에서 찾음
+        for header_row, body, offset in (
+            (headers, rows, header_offset),
+            (rows[0] if rows else [], rows[1:], 0),
+        ):
+            # 첫 열은 지표 이름 열
+            year_cols = [
+                (col, year)
+                for idx, cell in enumerate(header_row)
+                if (col := idx + offset) > 0 and (year := parse_year(cell))
+            ]
+            if year_cols:
+                return [
+                    (row[0], [(year, row[idx] if idx < len(row) else "") for idx, year in year_cols])
+                    for row in body
+                    if row
+                ]
+        return []
+
+    @staticmethod
+    def _year_rows_layout(headers: list[str], rows: list[list[str]]) -> list[tuple[str, list[tuple[int, str]]]]:
+        # 연도가 첫 열에 세로로 있는 표: 머리글(없으면 첫 행)이 지표 이름
+        header_row, body = (headers, rows) if headers else (rows[0] if rows else [], rows[1:])
+        year_rows = [(year, row) for row in body if row and (year := parse_year(row[0]))]
+        if not year_rows:
+            return []
+        return [
+            (label, [(year, row[idx] if idx < len(row) else "") for year, row in year_rows])
+            for idx, label in enumerate(header_row)
+            if idx > 0
+        ]
+
+    def find_metric(self, metric: str) -> str | None:
+        """The row label for ``metric``: exact match first, then ignoring spaces, then by prefix.
+
+        A prefix that starts more than one label (``매출`` for ``매출원가`` and
+        ``매출액``) is ambiguous and finds nothing.
+        """
+        if metric in self.values:
+            return metric
+        key = _metric_key(metric)
+        keyed = {_metric_key(label): label for label in self.metrics}
+        if key in keyed:
+            return keyed[key]
+        matches = [label for label_key, label in keyed.items() if label_key.startswith(key)]
+        return matches[0] if len(matches) == 1 else None
+
+    def as_series(self, metric: str) -> dict[int, float]:
+        """``{year: value in won}`` for the metric's non-missing cells (empty if not found)."""
+        label = self.find_metric(metric)
+        if label is None:
+            return {}
+        column = self.values[label]
+        mask = self.present[label]
+        return {year: column[idx] for idx, year in enumerate(self.years) if mask[idx]}
+
+    def as_numpy(self, metric: str):
+        """``(values, present)`` NumPy views of a metric column without copying; needs numpy."""
+        try:
+            import numpy as np
+        except ImportError as exc:
+            raise RuntimeError("numpy가 설치되어 있지 않습니다. pip install numpy 후 사용하세요.") from exc
+
+        label = self.find_metric(metric)
+        if label is None:
+            raise KeyError(metric)
+        return (
+            np.frombuffer(self.values[label], dtype=np.float64),
+            # 마스크는 0/1 바이트뿐이므로 bool dtype으로 복사 없이 볼 수 있음
+            np.frombuffer(self.present[label], dtype=np.bool_),
+        )
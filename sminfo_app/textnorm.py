@@ -0,0 +1,52 @@
+"""Whitespace and Unicode normalization for text read from sminfo pages.
+
+Every title, header, cell and candidate field goes through
+:func:`normalize_text`, so it is written for the common case: most strings
+coming out of the page scripts are already clean and are returned as-is
+after one regex scan.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Iterable
+
+# 공백 문자 중 일반 공백이 아닌 것(NBSP, 전각 공백, 탭, 줄바꿈 등), 연속 공백, 앞뒤 공백
+_NEEDS_COLLAPSE_RE = re.compile(r"[^\S ]|  |^ | $")
+
+
+def normalize_text(value: str | None) -> str:
+    """NFC-normalize and collapse every run of Unicode whitespace to one space, trimmed."""
+    if not value:
+        return ""
+    if not value.isascii() and not unicodedata.is_normalized("NFC", value):
+        value = unicodedata.normalize("NFC", value)
+    if _NEEDS_COLLAPSE_RE.search(value) is None:
+        return value
+    # str.split()은 NBSP(U+00A0)와 전각 공백(U+3000)도 공백으로 취급
+    return " ".join(value.split())
+
+
+def normalize_cells(cells: Iterable[object]) -> list[str]:
+    """Normalize ``cells`` and drop the ones that end up empty (e.g. header lists)."""
+    out = []
+    for cell in cells:
+        text = normalize_text(cell if isinstance(cell, str) else str(cell))
+        if text:
+            out.append(text)
+    return out
+
+
+def normalize_rows(rows: Iterable[Iterable[object]]) -> list[list[str]]:
+    """Normalize every cell of a table in one pass, dropping rows that are entirely empty.
+
+    Cell positions are kept (empty cells stay as ``""``) so columns still line up.
+    """
+    normalize = normalize_text
+    out = []
+    for row in rows:
+        cells = [normalize(cell if isinstance(cell, str) else str(cell)) for cell in row]
+        if any(cells):
+            out.append(cells)
+    return out
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import json
 import os
 from pathlib import Path
 
-from flask import Flask, render_template, request
+from flask import Flask, Response, render_template, request, stream_with_context
+from playwright.sync_api import Error as PlaywrightError
 
+from .browser_pool import ContextPool, get_browser_pool
+from .config import DEFAULT_BROWSER_CHANNEL, DEFAULT_DAEMON_SOCKET, DEFAULT_HTTP_CLIENT
+from .http_client import SminfoHttpClient
+from .keepalive import start_keepalive_from_env
+from .session_pool import SessionPoolClient, SessionSlot, load_session_pool
 from .sminfo_client import NotLoggedInError, SearchError, SminfoClient
 
 
@@ -18,10 +25,51 @@ def create_app() -> Flask:
 
     state_path = os.getenv("SMINFO_STATE_PATH")
     timeout_ms = int(os.getenv("SMINFO_TIMEOUT_MS", "45000"))
+    browser_pool = get_browser_pool(DEFAULT_BROWSER_CHANNEL, headless=True)
+    context_pool = ContextPool(browser_pool)
+    # 브라우저 데몬을 쓰면 세션 유지는 데몬 한 곳에서만 실행
+    if not DEFAULT_DAEMON_SOCKET:
+        start_keepalive_from_env(state_path, timeout_ms=timeout_ms)
+
+    session_pool = load_session_pool()
+    slot_http_clients: dict[str, SminfoHttpClient] = {}
+
+    def make_slot_client(slot: SessionSlot):
+        if DEFAULT_HTTP_CLIENT:
+            if slot.name not in slot_http_clients:
+                slot_http_clients[slot.name] = SminfoHttpClient(
+                    state_path=slot.state_path,
+                    meta_path=slot.meta_path,
+                    timeout_ms=timeout_ms,
+                    auto_relogin=False,
+                )
+            return slot_http_clients[slot.name]
+        return SminfoClient(
+            state_path=slot.state_path,
+            meta_path=slot.meta_path,
+            timeout_ms=timeout_ms,
+            browser_pool=browser_pool,
+            context_pool=context_pool,
+            daemon_socket=DEFAULT_DAEMON_SOCKET or None,
+            auto_relogin=False,
+        )
+
+    # 클라이언트는 설정만 담고 세션 파일은 프로세스 공용 캐시에서 읽으므로 요청마다 만들지 않음
+    if session_pool is not None:
+        client = SessionPoolClient(session_pool, make_slot_client)
+    elif DEFAULT_HTTP_CLIENT:
+        client = SminfoHttpClient(state_path=state_path, timeout_ms=timeout_ms)
+    else:
+        client = SminfoClient(
+            state_path=state_path,
+            timeout_ms=timeout_ms,
+            browser_pool=browser_pool,
+            context_pool=context_pool,
+            daemon_socket=DEFAULT_DAEMON_SOCKET or None,
+        )
 
     @app.get("/")
     def home_get():
-        client = SminfoClient(state_path=state_path, timeout_ms=timeout_ms)
         return render_template(
             "index.html",
             query="",
@@ -38,8 +86,6 @@ def create_app() -> Flask:
         query = request.form.get("query", "").strip()
         company = request.form.get("company", "").strip()
 
-        client = SminfoClient(state_path=state_path, timeout_ms=timeout_ms)
-
         if not query:
             return render_template(
                 "index.html",
@@ -58,6 +104,9 @@ def create_app() -> Flask:
         except (NotLoggedInError, SearchError, ValueError) as exc:
             result = None
             error = str(exc)
+        except PlaywrightError as exc:
+            result = None
+            error = f"브라우저 오류로 검색하지 못했습니다: {exc}"
 
         return render_template(
             "index.html",
@@ -70,9 +119,39 @@ def create_app() -> Flask:
             state_path=str(client.state_path),
         )
 
+    @app.post("/api/search")
+    def api_search():
+        payload = request.get_json(silent=True) or request.form
+        query = str(payload.get("query", "")).strip()
+        company = str(payload.get("company", "")).strip()
+
+        def generate():
+            # 단계별 이벤트를 한 줄씩 바로 내보내 후보 목록을 상세 조회 전에 보여줄 수 있게 함
+            if not query:
+                yield _ndjson({"event": "error", "query": query, "error": "검색어를 입력하세요."})
+                return
+            try:
+                for event in client.iter_search(query, company_name=company or None):
+                    yield _ndjson(event.to_dict())
+            except (NotLoggedInError, SearchError, ValueError, PlaywrightError) as exc:
+                yield _ndjson(
+                    {
+                        "event": "error",
+                        "query": query,
+                        "error_type": type(exc).__name__,
+                        "error": str(exc),
+                    }
+                )
+
+        return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
     return app
 
 
+def _ndjson(payload: dict) -> str:
+    return json.dumps(payload, ensure_ascii=False) + "\n"
+
+
 app = create_app()
 
 
@@ -0,0 +1,79 @@
+import asyncio
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from sminfo_app.models import BatchOutcome  # noqa: E402
+from sminfo_app.sminfo_client import SminfoClient  # noqa: E402
+
+
+class _SlowAsyncClient:
+    """Stands in for AsyncSminfoClient: one outcome per query, a few ms apart."""
+
+    closed = threading.Event()
+
+    def __init__(self, **kwargs) -> None:
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        type(self).closed.set()
+
+    async def search_many(self, queries, concurrency=4):
+        for index, (query, company_name) in enumerate(queries):
+            await asyncio.sleep(0.002)
+            yield BatchOutcome(index=index, query=query, company_name=company_name)
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    module = types.ModuleType("sminfo_app.async_client")
+    module.AsyncSminfoClient = _SlowAsyncClient
+    monkeypatch.setitem(sys.modules, "sminfo_app.async_client", module)
+    return SminfoClient(state_path=tmp_path / "storage_state.json")
+
+
+def test_search_many_yields_every_outcome(client):
+    outcomes = list(client.search_many([f"회사{idx}" for idx in range(5)]))
+    assert sorted(outcome.index for outcome in outcomes) == list(range(5))
+
+
+@pytest.mark.parametrize("consumed", [0, 1, 3, 9])
+def test_search_many_closes_cleanly_when_stopped_early(client, consumed):
+    for _ in range(20):
+        _SlowAsyncClient.closed.clear()
+        batch = client.search_many([f"회사{idx}" for idx in range(10)])
+        for _ in range(consumed):
+            next(batch)
+        batch.close()
+        if consumed:
+            # 생성기가 시작된 경우에만 작업 스레드가 있음
+            assert _SlowAsyncClient.closed.wait(1)
+    assert not [t for t in threading.enumerate() if t.name == "sminfo-search-many"]
+
+
+class _LingeringLoop(asyncio.SelectorEventLoop):
+    """Keeps the worker thread alive for a moment after the loop is closed."""
+
+    def close(self) -> None:
+        super().close()
+        time.sleep(0.2)
+
+
+def test_search_many_stopped_after_loop_closed(client, monkeypatch):
+    monkeypatch.setattr(asyncio, "new_event_loop", _LingeringLoop)
+    _SlowAsyncClient.closed.clear()
+    batch = client.search_many([f"회사{idx}" for idx in range(3)])
+    for _ in range(3):
+        next(batch)
+    assert _SlowAsyncClient.closed.wait(1)
+    time.sleep(0.05)
+    # 작업 스레드가 loop를 닫은 뒤 아직 살아 있을 때 멈춰도 RuntimeError가 나지 않아야 함
+    batch.close()
@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from sminfo_app.session_pool import SessionPool  # noqa: E402
+
+
+def _write(tmp_path, payload):
+    path = tmp_path / "sessions.json"
+    path.write_text(payload if isinstance(payload, str) else json.dumps(payload), encoding="utf-8")
+    return path
+
+
+def test_from_file_resolves_paths_against_config_dir(tmp_path):
+    pool = SessionPool.from_file(_write(tmp_path, [{"state_path": "a/state.json", "budget_per_minute": 5}]))
+    (slot,) = pool.slots
+    assert slot.name == "session-1"
+    assert slot.state_path == tmp_path / "a" / "state.json"
+    assert slot.meta_path == tmp_path / "a" / "session_meta.json"
+    assert slot.budget_per_minute == 5
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        "{not json",
+        {"state_path": "a.json"},
+        ["a.json"],
+        [{"name": "no-state"}],
+        [{"state_path": 3}],
+        [{"state_path": "a.json", "meta_path": ["m.json"]}],
+        [{"state_path": "a.json", "budget_per_minute": "many"}],
+        [],
+    ],
+)
+def test_from_file_rejects_malformed_config_with_value_error(tmp_path, payload):
+    with pytest.raises(ValueError):
+        SessionPool.from_file(_write(tmp_path, payload))